@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for GomocupProtocol.parse_message.
+
+Compares the single-pass tokenizer against the previous parser, which
+tried the UCILIKE, MCTS, NORMAL, summary and indexed regexes in turn,
+on a log of Rapfi MESSAGE lines, and checks that both agree.
+
+The bundled data/rapfi_messages.log mixes every Rapfi output format
+(UCILIKE with and without multipv, MCTS, NORMAL, summary, indexed and
+free-form lines); pass any other engine log to measure that instead.
+
+Usage:
+    python benchmarks/bench_parse_message.py [LOG] [--repeat N]
+"""
+
+import argparse
+import os
+import re
+import sys
+import timeit
+from typing import Any
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from pygomo.protocol import GomocupProtocol
+
+
+DEFAULT_LOG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "rapfi_messages.log")
+
+
+def legacy_parse_message(protocol: GomocupProtocol, data: str) -> dict[str, Any]:
+    """The regex-cascade parse_message() this benchmark compares against."""
+    # Remove MESSAGE prefix if present
+    if data.upper().startswith("MESSAGE"):
+        data = data[7:].strip()
+
+    result = {
+        "depth": 0,
+        "sel_depth": 0,
+        "eval": "0",
+        "nodes": 0,
+        "nps": 0,  # n/ms (nodes per millisecond)
+        "time": 0,
+        "pv": [],
+        "multipv": 1,
+        "winrate": None,  # From MCTS output
+        "drawrate": None,
+        "raw": data,
+    }
+
+    # Try UCILIKE format with depth first
+    # Pattern: depth X-Y [multipv N] ev VAL n NODES n/ms SPEED tm TIME pv MOVES
+    uci_match = re.match(
+        r"depth\s+(\d+)-(\d+)\s+"
+        r"(?:multipv\s+(\d+)\s+)?"
+        r"ev\s+([+-]?\w*\d+)\s+"
+        r"n\s+([\d.]+[KMG]?)\s+"
+        r"n/ms\s+(\d+)\s+"
+        r"tm\s+(\d+)\s+"
+        r"pv\s+(.+)",
+        data, re.IGNORECASE
+    )
+
+    if uci_match:
+        result["depth"] = int(uci_match.group(1))
+        result["sel_depth"] = int(uci_match.group(2))
+        if uci_match.group(3):
+            result["multipv"] = int(uci_match.group(3))
+        result["eval"] = uci_match.group(4)
+        result["nodes"] = protocol._parse_node_count(uci_match.group(5))
+        result["nps"] = int(uci_match.group(6))
+        result["time"] = int(uci_match.group(7))
+        result["pv"] = protocol._parse_pv(uci_match.group(8))
+        return result
+
+    # Try MCTS format (multipv first, no depth at start)
+    # Pattern: multipv N ev VAL w WR d DR stdev SD v V seldepth SD n N n/ms SPEED tm TIME prior P pv MOVES
+    mcts_match = re.match(
+        r"multipv\s+(\d+)\s+"
+        r"ev\s+([+-]?\w*\d+)\s+"
+        r"w\s+([\d.]+)\s+"
+        r"d\s+([\d.]+)\s+"
+        r"stdev\s+([\d.]+)\s+"
+        r"v\s+([\d.]+[KMG]?)\s+"
+        r"seldepth\s+(\d+)\s+"
+        r"n\s+([\d.]+[KMG]?)\s+"
+        r"n/ms\s+(\d+)\s+"
+        r"tm\s+(\d+)\s+"
+        r"(?:prior\s+([\d.]+)\s+)?"
+        r"pv\s+(.+)",
+        data, re.IGNORECASE
+    )
+
+    if mcts_match:
+        result["multipv"] = int(mcts_match.group(1))
+        result["eval"] = mcts_match.group(2)
+        result["winrate"] = float(mcts_match.group(3))
+        result["drawrate"] = float(mcts_match.group(4))
+        result["sel_depth"] = int(mcts_match.group(7))
+        result["nodes"] = protocol._parse_node_count(mcts_match.group(8))
+        result["nps"] = int(mcts_match.group(9))
+        result["time"] = int(mcts_match.group(10))
+        result["pv"] = protocol._parse_pv(mcts_match.group(12))
+        return result
+
+    # Try NORMAL format: Depth X-Y | Eval VAL | Time T | MOVES
+    # Or: [Pondering] Depth X-Y | Eval VAL | Time T | MOVES
+    normal_match = re.match(
+        r"(?:\[Pondering\]\s*)?"
+        r"Depth\s+(\d+)-(\d+)\s+\|\s+"
+        r"Eval\s+([+-]?\w*\d+)\s+\|\s+"
+        r"Time\s+([\d.]+[sm]?)\s+\|\s+"
+        r"(.+)",
+        data, re.IGNORECASE
+    )
+
+    if normal_match:
+        result["depth"] = int(normal_match.group(1))
+        result["sel_depth"] = int(normal_match.group(2))
+        result["eval"] = normal_match.group(3)
+        result["pv"] = protocol._parse_pv(normal_match.group(5))
+        return result
+
+    # Try summary format: Speed X | Depth Y-Z | Eval V | Node N | Time T
+    summary_match = re.match(
+        r"(?:\[Pondering\]\s*)?"
+        r"Speed\s+[\d.]+[KMG]?n/s\s+\|\s+"
+        r"Depth\s+(\d+)-(\d+)\s+\|\s+"
+        r"Eval\s+([+-]?\w*\d+)\s+\|\s+"
+        r"Node\s+([\d.]+[KMG]?)\s+\|\s+"
+        r"Time\s+([\d.]+[sm]?)",
+        data, re.IGNORECASE
+    )
+
+    if summary_match:
+        result["depth"] = int(summary_match.group(1))
+        result["sel_depth"] = int(summary_match.group(2))
+        result["eval"] = summary_match.group(3)
+        result["nodes"] = protocol._parse_node_count(summary_match.group(4))
+        return result
+
+    # Try indexed format: (1) 123 | 5-8 | h8 i9
+    indexed_match = re.match(
+        r"\((\d+)\)\s+([+-]?\w*\d+)\s+\|\s+"
+        r"(\d+)-(\d+)\s+\|\s+"
+        r"(.+)",
+        data, re.IGNORECASE
+    )
+
+    if indexed_match:
+        result["multipv"] = int(indexed_match.group(1))
+        result["eval"] = indexed_match.group(2)
+        result["depth"] = int(indexed_match.group(3))
+        result["sel_depth"] = int(indexed_match.group(4))
+        result["pv"] = protocol._parse_pv(indexed_match.group(5))
+        return result
+
+    # Fallback: try to extract any eval we can find
+    eval_match = re.search(r"(?:ev|eval)\s+([+-]?\w*\d+)", data, re.IGNORECASE)
+    if eval_match:
+        result["eval"] = eval_match.group(1)
+
+    depth_match = re.search(r"(?:depth\s+)?(\d+)-(\d+)", data, re.IGNORECASE)
+    if depth_match:
+        result["depth"] = int(depth_match.group(1))
+        result["sel_depth"] = int(depth_match.group(2))
+
+    pv_match = re.search(r"pv\s+(.+)", data, re.IGNORECASE)
+    if pv_match:
+        result["pv"] = protocol._parse_pv(pv_match.group(1))
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("log", nargs="?", default=DEFAULT_LOG, help="File with one MESSAGE line per line")
+    parser.add_argument("--repeat", type=int, default=20, help="Passes over the log per timing")
+    options = parser.parse_args()
+    
+    with open(options.log, encoding="utf-8") as f:
+        lines = [line.strip() for line in f if line.strip()]
+    
+    protocol = GomocupProtocol()
+    mismatches = [
+        line for line in lines
+        if protocol.parse_message(line) != legacy_parse_message(protocol, line)
+    ]
+    
+    def run_legacy():
+        for line in lines:
+            legacy_parse_message(protocol, line)
+    
+    def run_tokenizer():
+        for line in lines:
+            protocol.parse_message(line)
+    
+    total = len(lines) * options.repeat
+    legacy = min(timeit.repeat(run_legacy, number=options.repeat, repeat=3))
+    tokenizer = min(timeit.repeat(run_tokenizer, number=options.repeat, repeat=3))
+    
+    print(f"{len(lines)} lines x {options.repeat} from {os.path.basename(options.log)}")
+    print(f"  regex cascade: {legacy / total * 1e6:6.2f} us/line")
+    print(f"  tokenizer:     {tokenizer / total * 1e6:6.2f} us/line ({legacy / tokenizer:.2f}x)")
+    print(f"  mismatches:    {len(mismatches)}")
+    for line in mismatches[:10]:
+        print(f"    {line}")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,13 +24,14 @@ __version__ = "0.1.1"
 __author__ = "PyGomo Contributors"
 
 # Main client
-from pygomo.client import EngineClient
+from pygomo.client import EngineClient, EnginePool, AsyncEngineClient
 
 # Protocol models
 from pygomo.protocol.models import (
     Move,
     Evaluate,
     SearchInfo,
+    LazySearchInfo,
     PlayResult,
     BoardPosition,
 )
@@ -81,11 +82,14 @@ __all__ = [
     
     # Main client
     "EngineClient",
+    "EnginePool",
+    "AsyncEngineClient",
     
     # Models
     "Move",
     "Evaluate",
     "SearchInfo",
+    "LazySearchInfo",
     "PlayResult",
     "BoardPosition",
     
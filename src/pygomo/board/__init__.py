@@ -4,6 +4,9 @@ PyGomo Board Submodule.
 Provides board representations for Gomoku:
 - BitBoard: Fast bitwise operations
 - RenjuBitBoard: With forbidden move detection
+- CompactBitBoard: Slotted board with O(1) copy for search
+- BatchBoard: Vectorized batch of positions (pygomo.board.batch,
+  requires the optional NumPy extra)
 
 Example:
     from pygomo.board import BitBoard, RenjuBitBoard
@@ -29,7 +32,9 @@ from pygomo.board.interface import (
 
 from pygomo.board.bitboard import BitBoard
 from pygomo.board.renju import RenjuBitBoard
+from pygomo.board.compact import CompactBitBoard
 from pygomo.board.zobrist import ZobristHash, get_zobrist
+from pygomo.board.masks import LineMasks, get_line_masks
 
 
 __all__ = [
@@ -46,8 +51,13 @@ __all__ = [
     # Implementations
     "BitBoard",
     "RenjuBitBoard",
+    "CompactBitBoard",
     
     # Hashing
     "ZobristHash",
     "get_zobrist",
+    
+    # Line masks
+    "LineMasks",
+    "get_line_masks",
 ]
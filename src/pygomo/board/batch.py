@@ -0,0 +1,244 @@
+"""
+Vectorized batch board for Gomoku.
+
+Holds N positions in a single NumPy array and applies
+placement, win detection and legal-move masks to the whole
+batch in one call.
+
+Requires the optional NumPy dependency::
+
+    pip install pygomo-lib[numpy]
+"""
+
+from typing import Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - depends on environment
+    raise ImportError(
+        "pygomo.board.batch requires NumPy; "
+        "install it with 'pip install pygomo-lib[numpy]'"
+    ) from e
+
+from pygomo.board.interface import IBoard, BLACK, WHITE, EMPTY
+from pygomo.board.bitboard import BitBoard
+
+
+class BatchBoard:
+    """
+    Batch of Gomoku positions stored as an (N, size, size) int8 array.
+
+    Cell values use the board constants (EMPTY, BLACK, WHITE) and
+    are indexed as `stones[n, row, col]`, matching the BitBoard
+    bit index `row * size + col`.
+
+    Semantics follow BitBoard: a placement fails on off-board or
+    occupied squares, the default color alternates with the move
+    count, and five or more in a row wins.
+
+    Example:
+        batch = BatchBoard(count=1024, size=15)
+
+        # Every board plays h8, then i8
+        batch.place_many(np.full((1024, 2), (7, 7)))
+        batch.place_many(np.full((1024, 2), (8, 7)))
+
+        winners = batch.check_win_many()      # (1024,) int8
+        legal = batch.legal_mask_many()       # (1024, 15, 15) bool
+    """
+
+    def __init__(self, count: int, size: int = 15):
+        """
+        Create a batch of empty boards.
+
+        Args:
+            count: Number of positions in the batch.
+            size: Board size.
+        """
+        self._size = size
+        self._stones = np.zeros((count, size, size), dtype=np.int8)
+        self._move_count = np.zeros(count, dtype=np.int32)
+
+    # --- Properties ---
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def stones(self) -> "np.ndarray":
+        """The (N, size, size) int8 cell array (not a copy)."""
+        return self._stones
+
+    @property
+    def move_count(self) -> "np.ndarray":
+        """Number of stones placed on each board, shape (N,)."""
+        return self._move_count
+
+    @property
+    def current_player(self) -> "np.ndarray":
+        """Player to move on each board (BLACK or WHITE), shape (N,)."""
+        return np.where(self._move_count % 2 == 0, BLACK, WHITE).astype(np.int8)
+
+    def __len__(self) -> int:
+        return self._stones.shape[0]
+
+    # --- Conversion ---
+
+    @classmethod
+    def from_boards(cls, boards: Sequence[IBoard]) -> "BatchBoard":
+        """
+        Build a batch from existing boards.
+
+        Args:
+            boards: Boards of the same size.
+
+        Returns:
+            BatchBoard holding the same stones and move counts.
+
+        Raises:
+            ValueError: If board sizes differ.
+        """
+        if not boards:
+            raise ValueError("Cannot build a batch from no boards")
+        size = boards[0].size
+        batch = cls(len(boards), size)
+
+        for n, board in enumerate(boards):
+            if board.size != size:
+                raise ValueError(
+                    f"Board {n} has size {board.size}, expected {size}"
+                )
+            for color in (BLACK, WHITE):
+                for move in board.stones(color):
+                    batch._stones[n, move.row, move.col] = color
+            batch._move_count[n] = board.move_count
+
+        return batch
+
+    def to_board(self, n: int) -> BitBoard:
+        """
+        Convert one position to a BitBoard.
+
+        Move order is not tracked by the batch, so the history of
+        the returned board lists black stones first, then white.
+
+        Args:
+            n: Position index in the batch.
+        """
+        board = BitBoard(_size=self._size)
+        for color in (BLACK, WHITE):
+            indices = np.flatnonzero(self._stones[n] == color)
+            for index in indices.tolist():
+                board.place_index(index, color)
+        return board
+
+    def copy(self) -> "BatchBoard":
+        """Create an independent copy of the batch."""
+        batch = BatchBoard.__new__(BatchBoard)
+        batch._size = self._size
+        batch._stones = self._stones.copy()
+        batch._move_count = self._move_count.copy()
+        return batch
+
+    # --- Batch Operations ---
+
+    def place_many(
+        self,
+        moves: "np.ndarray",
+        colors: Optional[Union[int, "np.ndarray"]] = None,
+        active: Optional["np.ndarray"] = None,
+    ) -> "np.ndarray":
+        """
+        Place one stone on every board.
+
+        Args:
+            moves: Integer array of shape (N, 2) holding (col, row).
+            colors: Stone color per board, a single color for all,
+                    or None for each board's current player.
+            active: Optional boolean mask of boards to play on.
+
+        Returns:
+            Boolean array (N,), True where the stone was placed.
+        """
+        moves = np.asarray(moves, dtype=np.int64)
+        if moves.shape != (len(self), 2):
+            raise ValueError(
+                f"moves must have shape ({len(self)}, 2), got {moves.shape}"
+            )
+        cols, rows = moves[:, 0], moves[:, 1]
+
+        if colors is None:
+            colors = self.current_player
+        else:
+            colors = np.broadcast_to(np.asarray(colors, dtype=np.int8), (len(self),))
+
+        ok = (cols >= 0) & (cols < self._size) & (rows >= 0) & (rows < self._size)
+        if active is not None:
+            ok &= np.asarray(active, dtype=bool)
+
+        # Only index in-bounds squares when checking occupancy
+        boards = np.nonzero(ok)[0]
+        empty = self._stones[boards, rows[boards], cols[boards]] == EMPTY
+        boards = boards[empty]
+        ok[:] = False
+        ok[boards] = True
+
+        self._stones[boards, rows[boards], cols[boards]] = colors[boards]
+        self._move_count[boards] += 1
+        return ok
+
+    def check_win_many(self) -> "np.ndarray":
+        """
+        Check every board for five or more in a row.
+
+        Returns:
+            int8 array (N,) with the winner per board
+            (BLACK, WHITE, or EMPTY if nobody has won).
+            Black is reported if both colors have a five.
+        """
+        black = self._has_five(self._stones == BLACK)
+        white = self._has_five(self._stones == WHITE)
+        return np.where(black, BLACK, np.where(white, WHITE, EMPTY)).astype(np.int8)
+
+    def legal_mask_many(self) -> "np.ndarray":
+        """
+        Get the legal (empty) squares of every board.
+
+        Returns:
+            Boolean array (N, size, size), True on empty squares.
+        """
+        return self._stones == EMPTY
+
+    def _has_five(self, planes: "np.ndarray") -> "np.ndarray":
+        """
+        Detect 5-in-a-row windows in a stack of boolean planes.
+
+        ANDs five offset slices per direction, so each output cell
+        marks a complete window starting there.
+        """
+        n, size = planes.shape[0], self._size
+        if size < 5:
+            return np.zeros(n, dtype=bool)
+        span = size - 4
+
+        horizontal = planes[:, :, 0:span].copy()
+        vertical = planes[:, 0:span, :].copy()
+        diagonal = planes[:, 0:span, 0:span].copy()
+        anti_diagonal = planes[:, 0:span, 4:size].copy()
+
+        for k in range(1, 5):
+            horizontal &= planes[:, :, k:span + k]
+            vertical &= planes[:, k:span + k, :]
+            diagonal &= planes[:, k:span + k, k:span + k]
+            anti_diagonal &= planes[:, k:span + k, 4 - k:size - k]
+
+        return (
+            horizontal.any(axis=(1, 2))
+            | vertical.any(axis=(1, 2))
+            | diagonal.any(axis=(1, 2))
+            | anti_diagonal.any(axis=(1, 2))
+        )
+
+    def __repr__(self) -> str:
+        return f"BatchBoard(count={len(self)}, size={self._size})"
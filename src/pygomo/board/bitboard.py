@@ -2,59 +2,39 @@
 BitBoard implementation for Gomoku.
 
 Uses Python's arbitrary precision integers as bitboards
-for efficient board operations.
+for efficient board operations. The board logic lives in a base
+class shared with CompactBitBoard, which only differs in how it
+stores the move history.
 """
 
-from typing import Optional
+from abc import abstractmethod
+from typing import Iterator, Optional
 from dataclasses import dataclass, field
 
 from pygomo.protocol.models import Move
 from pygomo.board.interface import IBoard, WinInfo, BLACK, WHITE, EMPTY
 from pygomo.board.zobrist import ZobristHash, get_zobrist
+from pygomo.board.masks import (
+    LineMasks,
+    DIRECTIONS,
+    get_line_masks,
+    iter_bits,
+    bit_indices,
+)
 
 
-@dataclass
-class BitBoard(IBoard):
+class _BitBoardBase(IBoard):
     """
-    BitBoard representation for Gomoku.
-    
-    Uses two Python integers as bitboards:
-    - `_black`: Bit set for each black stone
-    - `_white`: Bit set for each white stone
-    
-    For a 15x15 board, each bitboard is 225 bits.
-    Bit index = row * size + col.
-    
-    Features:
-    - O(1) place, remove, is_empty operations
-    - O(1) win detection using bit shifting
-    - Zobrist hashing for transposition tables
-    - Move history tracking
+    Bitboard logic shared by BitBoard and CompactBitBoard.
     
-    Example:
-        board = BitBoard(size=15)
-        board.place(Move("h8"))           # Black plays
-        board.place(Move("i8"))           # White plays
-        board.place(Move("h7"))           # Black plays
-        
-        if board.check_win(Move("h8")):
-            print("Black wins!")
+    Subclasses hold the state (`_size`, `_black`, `_white`,
+    `_move_count`, `_hash`, `_sym_hash`, `_zobrist`, `_lines`) and
+    decide how the move history is stored: they implement
+    `last_move`, `get_move_history`, `copy` and the two history
+    hooks called by place_index() and remove_index().
     """
     
-    _size: int = 15
-    _black: int = 0
-    _white: int = 0
-    _move_count: int = 0
-    _history: list[Move] = field(default_factory=list)
-    _hash: int = 0
-    _zobrist: ZobristHash = field(default=None, repr=False)
-    
-    def __post_init__(self):
-        """Initialize Zobrist hash table."""
-        if self._zobrist is None:
-            self._zobrist = get_zobrist(self._size)
-        if self._hash == 0:
-            self._hash = self._zobrist.empty_hash
+    __slots__ = ()
     
     # --- Properties ---
     
@@ -70,14 +50,20 @@ class BitBoard(IBoard):
     def current_player(self) -> int:
         return BLACK if self._move_count % 2 == 0 else WHITE
     
-    @property
-    def last_move(self) -> Optional[Move]:
-        return self._history[-1] if self._history else None
-    
     @property
     def hash(self) -> int:
         return self._hash
     
+    @property
+    def canonical_hash(self) -> int:
+        """
+        Zobrist hash that is identical for all 8 symmetric positions.
+        
+        Use as a key for opening books and position caches so that
+        rotated or mirrored positions share one entry.
+        """
+        return self._zobrist.canonical(self._sym_hash)
+    
     # --- Bit Operations ---
     
     def _index(self, move: Move) -> int:
@@ -99,43 +85,70 @@ class BitBoard(IBoard):
         else:
             self._white = value
     
+    # --- History ---
+    
+    @abstractmethod
+    def _push_history(self, move: Move) -> None:
+        """Record a placed stone as the last move."""
+        ...
+    
+    @abstractmethod
+    def _pop_history(self, index: int) -> None:
+        """Drop the last move if it is the stone removed at index."""
+        ...
+    
     # --- Core Operations ---
     
     def place(self, move: Move, color: Optional[int] = None) -> bool:
         """Place a stone on the board."""
         if not self.is_valid(move):
             return False
-        if not self.is_empty(move):
+        return self.place_index(move.row * self._size + move.col, color)
+    
+    def remove(self, move: Move) -> bool:
+        """Remove a stone from the board."""
+        if not self.is_valid(move):
+            return False
+        return self.remove_index(move.row * self._size + move.col)
+    
+    def place_index(self, index: int, color: Optional[int] = None) -> bool:
+        """
+        Place a stone by square index (row * size + col).
+        
+        Hot-path variant of place() for callers that already work in
+        bit indices; the index must be on the board.
+        """
+        bit = 1 << index
+        if (self._black | self._white) & bit:
             return False
         
         if color is None:
             color = self.current_player
         
-        bit = self._bit(move)
-        
         # Set the bit
         if color == BLACK:
             self._black |= bit
         else:
+            color = WHITE
             self._white |= bit
         
-        # Update hash
-        self._hash = self._zobrist.update(
-            self._hash, move.col, move.row, color
-        )
+        # Update hashes
+        self._hash = self._zobrist.update_index(self._hash, index, color)
+        self._sym_hash = self._zobrist.update_symmetric(self._sym_hash, index, color)
         
         # Update history
-        self._history.append(move)
+        self._push_history(Move.from_index(index, self._size))
         self._move_count += 1
         
         return True
     
-    def remove(self, move: Move) -> bool:
-        """Remove a stone from the board."""
-        if not self.is_valid(move):
-            return False
+    def remove_index(self, index: int) -> bool:
+        """
+        Remove a stone by square index (row * size + col).
         
-        bit = self._bit(move)
+        Hot-path variant of remove(); the index must be on the board.
+        """
+        bit = 1 << index
         
         # Check which color to remove
         if self._black & bit:
@@ -147,18 +160,25 @@ class BitBoard(IBoard):
         else:
             return False  # Empty
         
-        # Update hash
-        self._hash = self._zobrist.update(
-            self._hash, move.col, move.row, color
-        )
+        # Update hashes
+        self._hash = self._zobrist.update_index(self._hash, index, color)
+        self._sym_hash = self._zobrist.update_symmetric(self._sym_hash, index, color)
         
         # Remove from history (if it's the last move)
-        if self._history and self._history[-1] == move:
-            self._history.pop()
+        self._pop_history(index)
         
         self._move_count -= 1
         return True
     
+    def get_index(self, index: int) -> int:
+        """Get the stone at a square index (row * size + col)."""
+        bit = 1 << index
+        if self._black & bit:
+            return BLACK
+        if self._white & bit:
+            return WHITE
+        return EMPTY
+    
     def get(self, move: Move) -> int:
         """Get the stone at position."""
         if not self.is_valid(move):
@@ -189,114 +209,52 @@ class BitBoard(IBoard):
         Check for a winning condition.
         
         Uses bit shifting to detect 5-in-a-row patterns.
-        If move is provided, only checks lines through that position.
+        If move is provided, only checks the precomputed
+        windows through that position.
         """
         if move is not None:
-            color = self.get(move)
-            if color == EMPTY:
+            if not self.is_valid(move):
                 return None
-            return self._check_win_at(move, color)
+            index = self._index(move)
+            bit = 1 << index
+            if self._black & bit:
+                return self._check_win_at(index, BLACK)
+            if self._white & bit:
+                return self._check_win_at(index, WHITE)
+            return None
         
         # Check entire board
         for color in (BLACK, WHITE):
             stones = self._black if color == BLACK else self._white
             
-            # Check all 4 directions using bit shifting
-            for direction, shift in self._get_directions():
-                if self._has_five(stones, shift):
-                    # Find the winning line (slower, but only called on win)
-                    line = self._find_winning_line(color, direction)
-                    if line:
-                        return WinInfo(winner=color, line=line, direction=direction)
+            exact = self._exact_five(color)
+            
+            # Check all 4 directions using guarded bit shifting
+            for d in range(len(DIRECTIONS)):
+                starts = self._lines.five_starts(stones, d, exact)
+                if starts:
+                    start = (starts & -starts).bit_length() - 1
+                    return self._win_info(color, d, self._lines.five[d][start])
         
         return None
     
-    def _get_directions(self) -> list[tuple[str, int]]:
-        """Get direction names and their bit shifts."""
-        return [
-            ("horizontal", 1),
-            ("vertical", self._size),
-            ("diagonal", self._size + 1),
-            ("anti-diagonal", self._size - 1),
-        ]
+    def _check_win_at(self, index: int, color: int) -> Optional[WinInfo]:
+        """Check for win through a specific bit index."""
+        stones = self._black if color == BLACK else self._white
+        hit = self._lines.find_five_at(stones, index, self._exact_five(color))
+        if hit is None:
+            return None
+        return self._win_info(color, *hit)
     
-    def _has_five(self, stones: int, shift: int) -> bool:
-        """
-        Check if there are 5 consecutive bits in the given direction.
-        
-        Uses the "parallel prefix" technique:
-        - AND stones with itself shifted by 1, 2, and 4 positions
-        - If any bit remains, there's a 5-in-a-row
-        """
-        m = stones & (stones >> shift)
-        m = m & (m >> shift)
-        m = m & (m >> shift)
-        m = m & (m >> shift)
-        return m != 0
-    
-    def _check_win_at(self, move: Move, color: int) -> Optional[WinInfo]:
-        """Check for win centered at a specific move."""
-        for direction, (dx, dy) in [
-            ("horizontal", (1, 0)),
-            ("vertical", (0, 1)),
-            ("diagonal", (1, 1)),
-            ("anti-diagonal", (1, -1)),
-        ]:
-            count = 1
-            line = [move]
-            
-            # Check positive direction
-            for i in range(1, 5):
-                x, y = move.col + dx * i, move.row + dy * i
-                if 0 <= x < self._size and 0 <= y < self._size:
-                    if self.get(Move((x, y))) == color:
-                        count += 1
-                        line.append(Move((x, y)))
-                    else:
-                        break
-                else:
-                    break
-            
-            # Check negative direction
-            for i in range(1, 5):
-                x, y = move.col - dx * i, move.row - dy * i
-                if 0 <= x < self._size and 0 <= y < self._size:
-                    if self.get(Move((x, y))) == color:
-                        count += 1
-                        line.insert(0, Move((x, y)))
-                    else:
-                        break
-                else:
-                    break
-            
-            if count >= 5:
-                return WinInfo(winner=color, line=line[:5], direction=direction)
-        
-        return None
+    def _exact_five(self, color: int) -> bool:
+        """Whether only exactly five (not six or more) wins for a color."""
+        return False
     
-    def _find_winning_line(self, color: int, direction: str) -> Optional[list[Move]]:
-        """Find the actual winning line positions."""
-        dx, dy = {
-            "horizontal": (1, 0),
-            "vertical": (0, 1),
-            "diagonal": (1, 1),
-            "anti-diagonal": (1, -1),
-        }[direction]
-        
-        for row in range(self._size):
-            for col in range(self._size):
-                if self.get(Move((col, row))) == color:
-                    line = []
-                    for i in range(5):
-                        x, y = col + dx * i, row + dy * i
-                        if 0 <= x < self._size and 0 <= y < self._size:
-                            if self.get(Move((x, y))) == color:
-                                line.append(Move((x, y)))
-                            else:
-                                break
-                    if len(line) == 5:
-                        return line
-        return None
+    def _win_info(self, color: int, direction: int, window: int) -> WinInfo:
+        """Build WinInfo from a direction index and window mask."""
+        table = Move.index_table(self._size)
+        line = [table[i] for i in iter_bits(window)]
+        return WinInfo(winner=color, line=line, direction=DIRECTIONS[direction][0])
     
     # --- Game State ---
     
@@ -306,44 +264,50 @@ class BitBoard(IBoard):
     
     def get_legal_moves(self) -> list[Move]:
         """Get all legal (empty) positions."""
+        empty = self._lines.full & ~(self._black | self._white)
+        return self._moves_from_mask(empty)
+    
+    def get_candidate_moves(self, radius: int = 2) -> list[Move]:
+        """
+        Get empty positions within `radius` squares of any stone.
+        
+        Dilates the occupied mask, so the cost does not depend on
+        how many squares are far from the action. On an empty board
+        the center is the only candidate.
+        
+        Args:
+            radius: Maximum Chebyshev distance to an existing stone.
+            
+        Returns:
+            Candidate moves in board index order.
+        """
         occupied = self._black | self._white
-        moves = []
-        for row in range(self._size):
-            for col in range(self._size):
-                idx = row * self._size + col
-                if not (occupied & (1 << idx)):
-                    moves.append(Move((col, row)))
-        return moves
+        if not occupied:
+            center = self._size // 2
+            return [Move.of(center, center)]
+        
+        near = self._lines.dilate(occupied, radius)
+        return self._moves_from_mask(near & ~occupied)
     
-    # --- History ---
+    def _moves_from_mask(self, mask: int) -> list[Move]:
+        """Convert set bits of a mask to interned moves."""
+        table = Move.index_table(self._size)
+        return [table[i] for i in bit_indices(mask)]
     
-    def get_move_history(self) -> list[Move]:
-        """Get ordered list of moves played."""
-        return list(self._history)
+    def stones(self, color: int) -> Iterator[Move]:
+        """Iterate over all stones of a given color."""
+        stones = self._black if color == BLACK else self._white if color == WHITE else 0
+        yield from self._moves_from_mask(stones)
     
     def undo(self) -> Optional[Move]:
         """Undo the last move."""
-        if not self._history:
+        move = self.last_move
+        if move is None:
             return None
         
-        move = self._history[-1]
-        self.remove(move)
+        self.remove_index(move.index(self._size))
         return move
     
-    # --- Copy ---
-    
-    def copy(self) -> "BitBoard":
-        """Create an independent copy of the board."""
-        return BitBoard(
-            _size=self._size,
-            _black=self._black,
-            _white=self._white,
-            _move_count=self._move_count,
-            _history=list(self._history),
-            _hash=self._hash,
-            _zobrist=self._zobrist,  # Share zobrist table
-        )
-    
     # --- Display ---
     
     def __str__(self) -> str:
@@ -352,7 +316,7 @@ class BitBoard(IBoard):
         for row in range(self._size - 1, -1, -1):
             line = f"{row + 1:2} "
             for col in range(self._size):
-                stone = self.get(Move((col, row)))
+                stone = self.get_index(row * self._size + col)
                 if stone == BLACK:
                     line += "X "
                 elif stone == WHITE:
@@ -366,6 +330,90 @@ class BitBoard(IBoard):
         lines.append(header)
         
         return "\n".join(lines)
+
+
+@dataclass
+class BitBoard(_BitBoardBase):
+    """
+    BitBoard representation for Gomoku.
+    
+    Uses two Python integers as bitboards:
+    - `_black`: Bit set for each black stone
+    - `_white`: Bit set for each white stone
+    
+    For a 15x15 board, each bitboard is 225 bits.
+    Bit index = row * size + col.
+    
+    Features:
+    - O(1) place, remove, is_empty operations
+    - O(1) win detection using bit shifting
+    - Zobrist hashing for transposition tables, plus a
+      symmetry-canonical hash shared by all 8 rotations/reflections
+    - Move history tracking
+    
+    Example:
+        board = BitBoard(size=15)
+        board.place(Move("h8"))           # Black plays
+        board.place(Move("i8"))           # White plays
+        board.place(Move("h7"))           # Black plays
+        
+        if board.check_win(Move("h8")):
+            print("Black wins!")
+    """
+    
+    _size: int = 15
+    _black: int = 0
+    _white: int = 0
+    _move_count: int = 0
+    _history: list[Move] = field(default_factory=list)
+    _hash: int = 0
+    _zobrist: ZobristHash = field(default=None, repr=False)
+    _lines: LineMasks = field(default=None, repr=False)
+    _sym_hash: int = field(default=0, repr=False)
+    
+    def __post_init__(self):
+        """Initialize Zobrist hash and line mask tables."""
+        if self._zobrist is None:
+            self._zobrist = get_zobrist(self._size)
+        if self._lines is None:
+            self._lines = get_line_masks(self._size)
+        if self._hash == 0:
+            self._hash = self._zobrist.empty_hash
+        if self._sym_hash == 0:
+            self._sym_hash = self._zobrist.empty_sym_hash
+    
+    @property
+    def last_move(self) -> Optional[Move]:
+        return self._history[-1] if self._history else None
+    
+    # --- History ---
+    
+    def _push_history(self, move: Move) -> None:
+        self._history.append(move)
+    
+    def _pop_history(self, index: int) -> None:
+        if self._history and self._history[-1].index(self._size) == index:
+            self._history.pop()
+    
+    def get_move_history(self) -> list[Move]:
+        """Get ordered list of moves played."""
+        return list(self._history)
+    
+    # --- Copy ---
+    
+    def copy(self) -> "BitBoard":
+        """Create an independent copy of the board."""
+        return BitBoard(
+            _size=self._size,
+            _black=self._black,
+            _white=self._white,
+            _move_count=self._move_count,
+            _history=list(self._history),
+            _hash=self._hash,
+            _zobrist=self._zobrist,  # Share zobrist table
+            _lines=self._lines,  # Share line mask tables
+            _sym_hash=self._sym_hash,
+        )
     
     def __repr__(self) -> str:
         return f"BitBoard(size={self._size}, moves={self._move_count})"
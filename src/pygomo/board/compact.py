@@ -0,0 +1,121 @@
+"""
+Compact BitBoard for search.
+
+A `__slots__` board with a persistent move history, so copies are
+O(1) and each instance only holds a handful of references.
+"""
+
+from typing import Optional
+
+from pygomo.protocol.models import Move
+from pygomo.board.bitboard import _BitBoardBase
+from pygomo.board.zobrist import get_zobrist
+from pygomo.board.masks import get_line_masks
+
+
+# History node: (parent node, move), None for an empty history
+_Node = Optional[tuple]
+
+
+class CompactBitBoard(_BitBoardBase):
+    """
+    Slotted bitboard with O(1) copy.
+
+    Stores the same state as BitBoard (two stone bitboards, move
+    count, Zobrist hash) but without a per-instance `__dict__`.
+    The move history is a persistent linked list of
+    `(parent, move)` tuples: placing a stone adds one node, undo
+    steps back to the parent, and copies share all existing nodes.
+
+    Shares all board logic with BitBoard: five or more in a row
+    wins, and `remove` only drops the move from history if it was
+    the last one.
+
+    Example:
+        board = CompactBitBoard(size=15)
+        board.place(Move("h8"))
+
+        child = board.copy()          # O(1), shares history
+        child.place(Move("i8"))
+
+        assert board.move_count == 1
+    """
+
+    __slots__ = (
+        "_size",
+        "_black",
+        "_white",
+        "_move_count",
+        "_history",
+        "_hash",
+        "_sym_hash",
+        "_zobrist",
+        "_lines",
+    )
+
+    def __init__(self, size: int = 15):
+        """
+        Create an empty board.
+
+        Args:
+            size: Board size.
+        """
+        self._size = size
+        self._black = 0
+        self._white = 0
+        self._move_count = 0
+        self._history: _Node = None
+        self._zobrist = get_zobrist(size)
+        self._lines = get_line_masks(size)
+        self._hash = self._zobrist.empty_hash
+        self._sym_hash = self._zobrist.empty_sym_hash
+
+    @property
+    def last_move(self) -> Optional[Move]:
+        return self._history[1] if self._history is not None else None
+
+    # --- History ---
+
+    def _push_history(self, move: Move) -> None:
+        self._history = (self._history, move)
+
+    def _pop_history(self, index: int) -> None:
+        history = self._history
+        if history is not None and history[1].index(self._size) == index:
+            self._history = history[0]
+
+    def get_move_history(self) -> list[Move]:
+        """Get ordered list of moves played."""
+        moves = []
+        node = self._history
+        while node is not None:
+            node, move = node
+            moves.append(move)
+        moves.reverse()
+        return moves
+
+    # --- Copy ---
+
+    def copy(self) -> "CompactBitBoard":
+        """
+        Create an independent copy in O(1).
+
+        History nodes are immutable, so the copy shares them.
+        """
+        board = CompactBitBoard.__new__(CompactBitBoard)
+        board._size = self._size
+        board._black = self._black
+        board._white = self._white
+        board._move_count = self._move_count
+        board._history = self._history
+        board._hash = self._hash
+        board._sym_hash = self._sym_hash
+        board._zobrist = self._zobrist
+        board._lines = self._lines
+        return board
+
+    def __copy__(self) -> "CompactBitBoard":
+        return self.copy()
+
+    def __repr__(self) -> str:
+        return f"CompactBitBoard(size={self._size}, moves={self._move_count})"
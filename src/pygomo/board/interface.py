@@ -33,6 +33,9 @@ class IBoard(ABC):
     (BitBoard, SimpleBoard, etc.).
     """
     
+    # No instance state here, so slotted implementations stay dict-free
+    __slots__ = ()
+    
     # Color constants
     BLACK = BLACK
     WHITE = WHITE
@@ -173,7 +176,7 @@ class IBoard(ABC):
         """Iterate over all positions and their states."""
         for row in range(self.size):
             for col in range(self.size):
-                move = Move((col, row))
+                move = Move.of(col, row)
                 yield move, self.get(move)
     
     def stones(self, color: int) -> Iterator[Move]:
@@ -190,6 +193,8 @@ class IRenjuBoard(IBoard):
     Adds forbidden move detection for Black.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def is_forbidden(self, move: Move) -> bool:
         """
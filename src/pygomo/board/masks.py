@@ -0,0 +1,343 @@
+"""
+Precomputed line masks for bitboard pattern detection.
+
+Provides per-size lookup tables mapping each square to the
+five-in-a-row windows passing through it, so win checks become
+a handful of integer ANDs instead of coordinate walks.
+"""
+
+from typing import Iterator, Optional
+
+
+# Direction name and (dx, dy) unit step.
+# All steps are positive in bit-index space (index = row * size + col),
+# so anti-diagonal runs towards lower columns as rows increase.
+DIRECTIONS: tuple[tuple[str, int, int], ...] = (
+    ("horizontal", 1, 0),
+    ("vertical", 0, 1),
+    ("diagonal", 1, 1),
+    ("anti-diagonal", -1, 1),
+)
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """
+    Iterate over the indices of set bits in ascending order.
+
+    Args:
+        mask: Bitmask to walk.
+
+    Yields:
+        Bit index of each set bit.
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def bit_indices(mask: int) -> list[int]:
+    """
+    Get the indices of set bits in ascending order.
+
+    Sparse masks are walked bit by bit; dense masks (e.g. the empty
+    squares of an early position) are scanned through their binary
+    string, which is much cheaper than repeated big-int arithmetic.
+
+    Args:
+        mask: Bitmask to walk.
+
+    Returns:
+        List of set bit indices.
+    """
+    bits = bin(mask)[:1:-1]
+    if bits.count("1") * 8 < len(bits):
+        return list(iter_bits(mask))
+    return [i for i, c in enumerate(bits) if c == "1"]
+
+
+class LineMasks:
+    """
+    Five-in-a-row window tables for a board size.
+
+    For every square and direction, stores the bitmasks of all
+    5-square windows that contain the square and fit on the board.
+
+    Example:
+        lines = get_line_masks(15)
+
+        # Does black have five through h8 (index 112)?
+        hit = lines.find_five_at(black_bits, 112)
+        if hit:
+            direction, window = hit
+    """
+
+    def __init__(self, size: int = 15):
+        """
+        Build window tables for a board size.
+
+        Args:
+            size: Board size.
+        """
+        self.size = size
+        self.total_squares = size * size
+        self.full = (1 << self.total_squares) - 1
+
+        # Bit-index step for each direction
+        self.steps = tuple(dy * size + dx for _, dx, dy in DIRECTIONS)
+
+        # File masks: every square except column A / the last column
+        file_a = sum(1 << (row * size) for row in range(size))
+        self.not_file_a = self.full & ~file_a
+        self.not_file_last = self.full & ~(file_a << (size - 1))
+
+        # guards[d] -> squares whose predecessor along d is on the same line.
+        # Masking a bitboard with it before `>> step` stops runs from
+        # wrapping across the board edge into the next row.
+        self.guards = tuple(
+            self.not_file_a if dx > 0 else self.not_file_last if dx < 0 else self.full
+            for _, dx, _ in DIRECTIONS
+        )
+
+        # five[d][index] -> mask of the window starting at index, or 0
+        self.five: tuple[tuple[int, ...], ...] = tuple(
+            tuple(
+                self._window(index, dx, dy, 5)
+                for index in range(self.total_squares)
+            )
+            for _, dx, dy in DIRECTIONS
+        )
+
+        # through[index][d] -> starts of the windows containing index,
+        # ordered by window start
+        through: list[list[list[int]]] = [
+            [[] for _ in DIRECTIONS] for _ in range(self.total_squares)
+        ]
+        for d, step in enumerate(self.steps):
+            for start, window in enumerate(self.five[d]):
+                if window:
+                    for k in range(5):
+                        through[start + k * step][d].append(start)
+        self.through: tuple[tuple[tuple[int, ...], ...], ...] = tuple(
+            tuple(tuple(starts) for starts in square) for square in through
+        )
+
+        # flank5[d][start] -> the squares just before and after a window
+        # (only those on the board), used to tell exact fives from overlines
+        self.flank5: tuple[tuple[int, ...], ...] = tuple(
+            tuple(
+                self._flanks(start, dx, dy, 5) if self.five[d][start] else 0
+                for start in range(self.total_squares)
+            )
+            for d, (_, dx, dy) in enumerate(DIRECTIONS)
+        )
+
+        self._starts: dict[tuple[int, int], int] = {}
+        self._segments: dict[tuple[int, int, int], int] = {}
+        self._line_squares: dict[tuple[int, int, int], tuple[tuple[int, ...], int]] = {}
+
+    def _window(self, index: int, dx: int, dy: int, length: int) -> int:
+        """Mask of `length` squares from index along (dx, dy), 0 if off-board."""
+        col, row = index % self.size, index // self.size
+        end_col = col + dx * (length - 1)
+        end_row = row + dy * (length - 1)
+        if not (0 <= end_col < self.size and 0 <= end_row < self.size):
+            return 0
+
+        mask = 0
+        for k in range(length):
+            mask |= 1 << ((row + dy * k) * self.size + col + dx * k)
+        return mask
+
+    def _flanks(self, index: int, dx: int, dy: int, length: int) -> int:
+        """Mask of the on-board squares adjacent to both ends of a window."""
+        col, row = index % self.size, index // self.size
+        mask = 0
+        for c, r in ((col - dx, row - dy), (col + dx * length, row + dy * length)):
+            if 0 <= c < self.size and 0 <= r < self.size:
+                mask |= 1 << (r * self.size + c)
+        return mask
+
+    def window_starts(self, direction: int, length: int) -> int:
+        """
+        Mask of squares where a window of `length` fits along a direction.
+
+        Shifting a bitboard right by k steps and ANDing with this mask
+        keeps only geometrically valid windows, so no separate edge
+        guard is needed for offsets inside the window.
+
+        Args:
+            direction: Direction index into DIRECTIONS.
+            length: Window length in squares.
+        """
+        key = (direction, length)
+        if key not in self._starts:
+            _, dx, dy = DIRECTIONS[direction]
+            mask = 0
+            for index in range(self.total_squares):
+                col, row = index % self.size, index // self.size
+                end_col = col + dx * (length - 1)
+                end_row = row + dy * (length - 1)
+                if 0 <= end_col < self.size and 0 <= end_row < self.size:
+                    mask |= 1 << index
+            self._starts[key] = mask
+        return self._starts[key]
+
+    def segment(self, index: int, direction: int, radius: int) -> int:
+        """
+        Mask of the squares on a line within `radius` of a square.
+
+        Args:
+            index: Bit index of the center square (included).
+            direction: Direction index into DIRECTIONS.
+            radius: Maximum distance along the line.
+        """
+        key = (index, direction, radius)
+        if key not in self._segments:
+            _, dx, dy = DIRECTIONS[direction]
+            col, row = index % self.size, index // self.size
+            mask = 0
+            for k in range(-radius, radius + 1):
+                c, r = col + dx * k, row + dy * k
+                if 0 <= c < self.size and 0 <= r < self.size:
+                    mask |= 1 << (r * self.size + c)
+            self._segments[key] = mask
+        return self._segments[key]
+
+    def line_squares(
+        self,
+        index: int,
+        direction: int,
+        radius: int,
+    ) -> tuple[tuple[int, ...], int]:
+        """
+        Squares on a line within `radius` of a square, in line order.
+
+        Args:
+            index: Bit index of the center square (included).
+            direction: Direction index into DIRECTIONS.
+            radius: Maximum distance along the line.
+
+        Returns:
+            (bit indices in ascending order, position of index among them).
+        """
+        key = (index, direction, radius)
+        if key not in self._line_squares:
+            _, dx, dy = DIRECTIONS[direction]
+            col, row = index % self.size, index // self.size
+            squares = []
+            center = 0
+            for k in range(-radius, radius + 1):
+                c, r = col + dx * k, row + dy * k
+                if 0 <= c < self.size and 0 <= r < self.size:
+                    if k == 0:
+                        center = len(squares)
+                    squares.append(r * self.size + c)
+            self._line_squares[key] = (tuple(squares), center)
+        return self._line_squares[key]
+
+    def find_five_at(
+        self,
+        stones: int,
+        index: int,
+        exact: bool = False,
+    ) -> Optional[tuple[int, int]]:
+        """
+        Find a complete five through a square.
+
+        Args:
+            stones: Bitboard of one color.
+            index: Bit index of the square.
+            exact: If True, ignore fives that are part of an overline.
+
+        Returns:
+            (direction index, window mask) of the first complete window,
+            or None.
+        """
+        for d, starts in enumerate(self.through[index]):
+            five = self.five[d]
+            for start in starts:
+                window = five[start]
+                if stones & window != window:
+                    continue
+                if exact and stones & self.flank5[d][start]:
+                    continue
+                return d, window
+        return None
+
+    def five_starts(self, stones: int, direction: int, exact: bool = False) -> int:
+        """
+        Find all complete fives in one direction with bit shifting.
+
+        Each round ANDs the run mask with itself shifted by one step,
+        guarded so that no run crosses the board edge.
+
+        Args:
+            stones: Bitboard of one color.
+            direction: Direction index into DIRECTIONS.
+            exact: If True, drop windows that are part of an overline.
+
+        Returns:
+            Mask of the first squares of every 5-in-a-row window
+            (0 if there is none).
+        """
+        shift = self.steps[direction]
+        guard = self.guards[direction]
+        m = stones
+        for _ in range(4):
+            m &= (m & guard) >> shift
+        if exact and m:
+            m &= ~self.flanked(stones, direction, 5)
+        return m
+
+    def flanked(self, stones: int, direction: int, length: int) -> int:
+        """
+        Window starts whose square before or after the window is in `stones`.
+
+        Args:
+            stones: Bitboard to test the flanking squares against.
+            direction: Direction index into DIRECTIONS.
+            length: Window length in squares.
+
+        Returns:
+            Mask of window starts with an occupied flank.
+        """
+        shift = self.steps[direction]
+        before = (stones << shift) & self.guards[direction]
+        after = (stones >> (shift * length)) & self.window_starts(direction, length + 1)
+        return (before | after) & self.full
+
+    def dilate(self, mask: int, radius: int = 1) -> int:
+        """
+        Grow a mask by `radius` squares in every direction (a square area).
+
+        Horizontal growth is guarded by the file masks so bits never
+        spill into the neighbouring row.
+
+        Args:
+            mask: Bitmask to grow.
+            radius: Chebyshev distance to grow by.
+
+        Returns:
+            Dilated mask, clipped to the board.
+        """
+        for _ in range(radius):
+            mask |= ((mask & self.not_file_last) << 1) | ((mask & self.not_file_a) >> 1)
+        for _ in range(radius):
+            mask |= (mask << self.size) | (mask >> self.size)
+        return mask & self.full
+
+
+# Cached instances per board size
+_line_masks_cache: dict[int, LineMasks] = {}
+
+
+def get_line_masks(size: int = 15) -> LineMasks:
+    """
+    Get the line mask tables for the given board size.
+
+    Uses a cache to reuse tables for the same size.
+    """
+    if size not in _line_masks_cache:
+        _line_masks_cache[size] = LineMasks(size=size)
+    return _line_masks_cache[size]
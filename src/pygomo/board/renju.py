@@ -7,10 +7,12 @@ has restrictions on double-three, double-four, and overline.
 
 from typing import Optional
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from pygomo.protocol.models import Move
 from pygomo.board.interface import IRenjuBoard, WinInfo, BLACK, WHITE, EMPTY
 from pygomo.board.bitboard import BitBoard
+from pygomo.board.masks import DIRECTIONS
 from pygomo.board.zobrist import ZobristHash, get_zobrist
 
 
@@ -26,6 +28,16 @@ class RenjuBitBoard(BitBoard, IRenjuBoard):
     
     White has no restrictions and wins with 5 or more.
     
+    Patterns are detected for all empty squares at once with
+    shift-and-mask window tests, so split shapes (X.XX threes,
+    XX.XX fours) count as well. A move that makes an exact five
+    is never forbidden. Threes are not checked recursively (a
+    three whose four-point is itself forbidden still counts).
+    
+    The per-direction pattern masks are cached and updated by
+    place/remove/undo for the squares within 5 cells of the changed
+    stone along its four lines, so forbidden-move queries are O(1).
+    
     Example::
 
         board = RenjuBitBoard(size=15)
@@ -36,6 +48,16 @@ class RenjuBitBoard(BitBoard, IRenjuBoard):
             print("Move is forbidden!")
     """
     
+    # Forbidden-point cache: per-direction pattern masks, the combined
+    # forbidden mask, and the (black, white) position they describe
+    _patterns: Optional[list[tuple[int, ...]]] = field(
+        default=None, repr=False, compare=False
+    )
+    _forbidden: int = field(default=0, repr=False, compare=False)
+    _pattern_key: Optional[tuple[int, int]] = field(
+        default=None, repr=False, compare=False
+    )
+    
     def is_forbidden(self, move: Move) -> bool:
         """
         Check if a move is forbidden for Black (Renju rules).
@@ -55,32 +77,16 @@ class RenjuBitBoard(BitBoard, IRenjuBoard):
         if not self.is_empty(move):
             return False
         
-        # Check overline (6+)
-        if self._check_overline(move, BLACK):
-            return True
-        
-        # Check double-four
-        if self._check_double_four(move, BLACK):
-            return True
-        
-        # Check double-three (open threes)
-        if self._check_double_three(move, BLACK):
-            return True
-        
-        return False
+        return bool(self._forbidden_mask() & self._bit(move))
     
     def get_forbidden_moves(self) -> list[Move]:
         """Get all currently forbidden moves for Black."""
         if self.current_player != BLACK:
             return []
         
-        forbidden = []
-        for move in self.get_legal_moves():
-            if self.is_forbidden(move):
-                forbidden.append(move)
-        return forbidden
+        return self._moves_from_mask(self._forbidden_mask())
     
-    def place(self, move: Move, color: Optional[int] = None) -> bool:
+    def place_index(self, index: int, color: Optional[int] = None) -> bool:
         """
         Place a stone, respecting Renju forbidden rules.
         
@@ -90,189 +96,154 @@ class RenjuBitBoard(BitBoard, IRenjuBoard):
             color = self.current_player
         
         # Check forbidden only for Black's own moves
-        if color == BLACK and self.is_forbidden(move):
+        if (
+            color == BLACK
+            and self.current_player == BLACK
+            and self._forbidden_mask() >> index & 1
+        ):
+            return False
+        
+        cached = self._pattern_key == (self._black, self._white)
+        if not super().place_index(index, color):
             return False
         
-        return super().place(move, color)
+        if cached:
+            self._update_patterns(index)
+        return True
     
-    def check_win(self, move: Optional[Move] = None) -> Optional[WinInfo]:
-        """
-        Check for win with Renju overline rule.
+    def remove_index(self, index: int) -> bool:
+        """Remove a stone and update the forbidden-point cache."""
+        cached = self._pattern_key == (self._black, self._white)
+        if not super().remove_index(index):
+            return False
         
-        Black's 6+ in a row is forbidden (not a win).
+        if cached:
+            self._update_patterns(index)
+        return True
+    
+    def _exact_five(self, color: int) -> bool:
+        """
+        Black's 6+ in a row is an overline (not a win).
         White's 5+ is a win.
         """
-        result = super().check_win(move)
-        
-        if result and result.winner == BLACK:
-            # Check if it's exactly 5 (not overline)
-            if len(result.line) > 5:
-                return None  # Forbidden overline
-            
-            # Verify it's exactly 5, not part of 6+
-            if move:
-                for direction, (dx, dy) in [
-                    ("horizontal", (1, 0)),
-                    ("vertical", (0, 1)),
-                    ("diagonal", (1, 1)),
-                    ("anti-diagonal", (1, -1)),
-                ]:
-                    if result.direction == direction:
-                        count = self._count_line(move, dx, dy, BLACK)
-                        if count > 5:
-                            return None  # Overline
-        
-        return result
+        return color == BLACK
     
     # --- Pattern Detection ---
     
-    def _count_line(self, move: Move, dx: int, dy: int, color: int) -> int:
-        """Count consecutive stones in a line through move."""
-        count = 1
-        
-        # Positive direction
-        x, y = move.col + dx, move.row + dy
-        while 0 <= x < self._size and 0 <= y < self._size:
-            if self.get(Move((x, y))) == color:
-                count += 1
-                x += dx
-                y += dy
-            else:
-                break
-        
-        # Negative direction
-        x, y = move.col - dx, move.row - dy
-        while 0 <= x < self._size and 0 <= y < self._size:
-            if self.get(Move((x, y))) == color:
-                count += 1
-                x -= dx
-                y -= dy
-            else:
-                break
-        
-        return count
-    
-    def _check_overline(self, move: Move, color: int) -> bool:
-        """Check if placing at move creates 6+ in a row."""
-        # Temporarily place the stone
-        bit = self._bit(move)
-        self._black |= bit
-        
-        has_overline = False
-        for dx, dy in [(1, 0), (0, 1), (1, 1), (1, -1)]:
-            if self._count_line(move, dx, dy, color) >= 6:
-                has_overline = True
-                break
+    def _forbidden_mask(self) -> int:
+        """
+        Get the forbidden squares for Black.
         
-        # Remove the temporary stone
-        self._black &= ~bit
+        Rebuilds the pattern cache from scratch only when the stones no
+        longer match it (e.g. after direct bitboard edits).
         
-        return has_overline
+        Returns:
+            Bitmask of forbidden empty squares.
+        """
+        if self._pattern_key != (self._black, self._white):
+            self._rebuild_patterns()
+        return self._forbidden
     
-    def _check_double_four(self, move: Move, color: int) -> bool:
-        """Check if placing at move creates double-four."""
-        # Temporarily place the stone
-        bit = self._bit(move)
-        self._black |= bit
-        
-        four_count = 0
-        for dx, dy in [(1, 0), (0, 1), (1, 1), (1, -1)]:
-            if self._is_four(move, dx, dy, color):
-                four_count += 1
-        
-        # Remove the temporary stone
-        self._black &= ~bit
-        
-        return four_count >= 2
+    def _rebuild_patterns(self) -> None:
+        """Compute the pattern masks of every direction for the whole board."""
+        black = self._black
+        empty = self._lines.full & ~(black | self._white)
+        
+        self._patterns = [
+            self._line_patterns(d, black, empty)
+            for d in range(len(DIRECTIONS))
+        ]
+        self._combine_patterns()
     
-    def _check_double_three(self, move: Move, color: int) -> bool:
-        """Check if placing at move creates double open-three."""
-        # Temporarily place the stone
-        bit = self._bit(move)
-        self._black |= bit
-        
-        three_count = 0
-        for dx, dy in [(1, 0), (0, 1), (1, 1), (1, -1)]:
-            if self._is_open_three(move, dx, dy, color):
-                three_count += 1
-        
-        # Remove the temporary stone
-        self._black &= ~bit
+    def _update_patterns(self, index: int) -> None:
+        """
+        Refresh the pattern cache after a stone changed at index.
         
-        return three_count >= 2
-    
-    def _is_four(self, move: Move, dx: int, dy: int, color: int) -> bool:
+        Only the lines through index are affected, and a square's
+        pattern along a line depends on the squares within 5 of it.
+        For each direction, the stones within 10 of index are packed
+        into a short 1-D line whose shapes are looked up in a memo, and
+        the result is spliced back in within 5 of index.
         """
-        Check if there's a four (4 consecutive with one end open)
-        in the given direction through the move.
+        lines = self._lines
+        black = self._black
+        occupied = black | self._white
+        
+        patterns = list(self._patterns)
+        for d in range(len(DIRECTIONS)):
+            squares, center = lines.line_squares(index, d, 10)
+            line_black = line_empty = 0
+            for k, sq in enumerate(squares):
+                if black >> sq & 1:
+                    line_black |= 1 << k
+                elif not occupied >> sq & 1:
+                    line_empty |= 1 << k
+            
+            shapes = _line_shape_masks(line_black, line_empty, len(squares))
+            
+            # Scatter the shapes of the squares within 5 back to the board
+            lo, hi = max(center - 5, 0), center + 6
+            keep = ~lines.segment(index, d, 5)
+            updated = []
+            for old, shape in zip(patterns[d], shapes):
+                shape = (shape >> lo) & ((1 << (hi - lo)) - 1)
+                new = 0
+                while shape:
+                    low = shape & -shape
+                    new |= 1 << squares[lo + low.bit_length() - 1]
+                    shape ^= low
+                updated.append((old & keep) | new)
+            patterns[d] = tuple(updated)
+        
+        self._patterns = patterns
+        self._combine_patterns()
+    
+    def _combine_patterns(self) -> None:
         """
-        # Count consecutive stones including move
-        count = 1
+        Combine per-direction pattern masks into the forbidden mask.
         
-        # Check positive direction
-        end_pos = 0
-        end_neg = 0
-        
-        x, y = move.col + dx, move.row + dy
-        while 0 <= x < self._size and 0 <= y < self._size:
-            if self.get(Move((x, y))) == color:
-                count += 1
-                x += dx
-                y += dy
-            else:
-                if self.get(Move((x, y))) == EMPTY:
-                    end_pos = 1  # Open end
-                break
-        
-        x, y = move.col - dx, move.row - dy
-        while 0 <= x < self._size and 0 <= y < self._size:
-            if self.get(Move((x, y))) == color:
-                count += 1
-                x -= dx
-                y -= dy
-            else:
-                if self.get(Move((x, y))) == EMPTY:
-                    end_neg = 1  # Open end
-                break
-        
-        # Four: 4 stones with at least one open end
-        return count == 4 and (end_pos + end_neg >= 1)
+        A square is forbidden if playing it makes an overline, two fours
+        or two open threes, unless it also makes an exact five.
+        """
+        fives = overlines = 0
+        fours = double_fours = 0
+        threes = double_threes = 0
+        
+        for five, overline, four, line_double_four, three in self._patterns:
+            fives |= five
+            overlines |= overline
+            double_fours |= (fours & four) | line_double_four
+            fours |= four
+            double_threes |= threes & three
+            threes |= three
+        
+        self._forbidden = (overlines | double_fours | double_threes) & ~fives
+        self._pattern_key = (self._black, self._white)
     
-    def _is_open_three(self, move: Move, dx: int, dy: int, color: int) -> bool:
+    def _line_patterns(
+        self,
+        direction: int,
+        black: int,
+        empty: int,
+    ) -> tuple[int, int, int, int, int]:
         """
-        Check if there's an open three in the given direction.
+        Compute Black's pattern masks along one direction of the board.
         
-        Open three: 3 consecutive with both ends open,
-        such that it can become an open four with one move.
+        Returns:
+            (five, overline, four, line_double_four, open_three) masks of
+            empty squares p where placing Black makes that shape.
         """
-        count = 1
-        end_pos = 0
-        end_neg = 0
-        
-        x, y = move.col + dx, move.row + dy
-        while 0 <= x < self._size and 0 <= y < self._size:
-            if self.get(Move((x, y))) == color:
-                count += 1
-                x += dx
-                y += dy
-            else:
-                if self.get(Move((x, y))) == EMPTY:
-                    end_pos = 1
-                break
-        
-        x, y = move.col - dx, move.row - dy
-        while 0 <= x < self._size and 0 <= y < self._size:
-            if self.get(Move((x, y))) == color:
-                count += 1
-                x -= dx
-                y -= dy
-            else:
-                if self.get(Move((x, y))) == EMPTY:
-                    end_neg = 1
-                break
-        
-        # Open three: 3 stones with both ends open
-        return count == 3 and end_pos == 1 and end_neg == 1
+        lines = self._lines
+        starts5 = lines.window_starts(direction, 5)
+        starts6 = lines.window_starts(direction, 6)
+        return _shape_masks(
+            black,
+            empty,
+            lines.steps[direction],
+            starts5 & ~lines.flanked(black, direction, 5),
+            starts6,
+            starts6 & ~lines.flanked(black, direction, 6),
+        )
     
     def copy(self) -> "RenjuBitBoard":
         """Create an independent copy."""
@@ -284,4 +255,141 @@ class RenjuBitBoard(BitBoard, IRenjuBoard):
             _history=list(self._history),
             _hash=self._hash,
             _zobrist=self._zobrist,
+            _lines=self._lines,
+            _sym_hash=self._sym_hash,
+            _patterns=self._patterns,  # Replaced, never mutated in place
+            _forbidden=self._forbidden,
+            _pattern_key=self._pattern_key,
         )
+
+
+def _shape_masks(
+    black: int,
+    empty: int,
+    step: int,
+    exact5: int,
+    starts6: int,
+    open6: int,
+) -> tuple[int, int, int, int, int]:
+    """
+    Find Black's shapes along one direction with window tests.
+    
+    Works on windows rather than contiguous runs, so split shapes
+    such as X.XX (three) and XX.XX (four) are found too. For each
+    window start i, `black >> k*step` tests square i + k*step; the
+    window start masks keep only windows that fit on the line, and
+    a window's hit is shifted back onto the empty square p.
+    
+    Args:
+        black: Black stones.
+        empty: Empty squares.
+        step: Bit-index step between neighbouring squares on a line.
+        exact5: Starts of 5-square windows not flanked by black.
+        starts6: Starts of all 6-square windows.
+        open6: Starts of 6-square windows not flanked by black.
+    
+    Returns:
+        (five, overline, four, line_double_four, open_three) masks of
+        empty squares p where placing Black makes that shape.
+    """
+    b = [black >> (k * step) for k in range(6)]
+    e = [empty >> (k * step) for k in range(6)]
+    
+    # --- 5-square windows, not extended by a black flank ---
+    five = 0
+    for kp in range(5):
+        w = exact5 & e[kp]
+        for k in range(5):
+            if not w:
+                break
+            if k != kp:
+                w &= b[k]
+        five |= w << (kp * step)
+    
+    # Four: three black + p + one empty q in an exact window.
+    # by_offset[j] marks p whose completing square is q = p + j*step.
+    by_offset: dict[int, int] = {}
+    for kp in range(5):
+        for kq in range(5):
+            if kq == kp:
+                continue
+            w = exact5 & e[kp] & e[kq]
+            for k in range(5):
+                if not w:
+                    break
+                if k != kp and k != kq:
+                    w &= b[k]
+            if w:
+                j = kq - kp
+                by_offset[j] = by_offset.get(j, 0) | (w << (kp * step))
+    
+    four = 0
+    for mask in by_offset.values():
+        four |= mask
+    
+    # Two completing squares in one line are two fours (e.g. X.XXX.X),
+    # unless they are the two ends of one straight four (.XXXX.)
+    line_double_four = 0
+    offsets = sorted(by_offset)
+    for a, j1 in enumerate(offsets):
+        for j2 in offsets[a + 1:]:
+            if j2 - j1 != 5:
+                line_double_four |= by_offset[j1] & by_offset[j2]
+    
+    # --- 6-square windows ---
+    # Overline: five black + p in six consecutive squares
+    overline = 0
+    for kp in range(6):
+        w = starts6 & e[kp]
+        for k in range(6):
+            if not w:
+                break
+            if k != kp:
+                w &= b[k]
+        overline |= w << (kp * step)
+    
+    # Open three: .[XX p q]. with both ends empty and not flanked by
+    # black, so that adding q makes a straight four
+    open6 &= e[0] & e[5]
+    three = 0
+    for kp in range(1, 5):
+        for kq in range(kp + 1, 5):
+            w = open6 & e[kp] & e[kq]
+            for k in range(1, 5):
+                if not w:
+                    break
+                if k != kp and k != kq:
+                    w &= b[k]
+            three |= (w << (kp * step)) | (w << (kq * step))
+    
+    # A shape that is already a four does not also count as a three
+    three &= ~four
+    
+    return five, overline, four, line_double_four, three
+
+
+@lru_cache(maxsize=1 << 16)
+def _line_shape_masks(
+    black: int,
+    empty: int,
+    length: int,
+) -> tuple[int, int, int, int, int]:
+    """
+    Shape masks for a single line of `length` squares (bit k = square k).
+    
+    Memoized: local updates only ever see short line segments, and the
+    same segments recur constantly during a game.
+    """
+    full = (1 << length) - 1
+    starts5 = full >> 4
+    starts6 = full >> 5
+    flank5 = (black << 1) | (black >> 5)
+    flank6 = (black << 1) | (black >> 6)
+    return _shape_masks(
+        black,
+        empty,
+        1,
+        starts5 & ~flank5,
+        starts6,
+        starts6 & ~flank6,
+    )
@@ -1,13 +1,21 @@
 """
 Zobrist hashing for board positions.
 
-Provides fast incremental hash updates for transposition tables.
+Provides fast incremental hash updates for transposition tables,
+plus symmetry-aware hashes that are equal for all 8 rotations and
+reflections of a position.
 """
 
 import random
 from typing import Optional
 
 
+# Number of board symmetries (the dihedral group of the square)
+SYMMETRY_COUNT = 8
+
+_MASK64 = (1 << 64) - 1
+
+
 class ZobristHash:
     """
     Zobrist hashing for Gomoku boards.
@@ -21,6 +29,14 @@ class ZobristHash:
         hash_val = zobrist.empty_hash
         hash_val = zobrist.update(hash_val, Move("h8"), BLACK)  # Add stone
         hash_val = zobrist.update(hash_val, Move("h8"), BLACK)  # Remove stone (XOR again)
+    
+    Symmetry hashing packs the 8 hashes of a position's rotations and
+    reflections into one integer (64 bits per symmetry), so a single
+    XOR updates all of them and `canonical()` picks the smallest::
+    
+        sym = zobrist.empty_sym_hash
+        sym = zobrist.update_symmetric(sym, 112, BLACK)
+        key = zobrist.canonical(sym)  # Same for all 8 symmetric positions
     """
     
     def __init__(self, size: int = 15, seed: Optional[int] = None):
@@ -51,12 +67,64 @@ class ZobristHash:
         
         # Empty board hash
         self._empty_hash = rng.getrandbits(64)
+        
+        # symmetries[k][index] -> index of the square after transform k
+        self.symmetries = self._build_symmetries(size)
+        
+        # Packed per-symmetry keys: 64-bit lane k of _sym_table[color][index]
+        # holds the key of the square that transform k maps index to
+        self._sym_table = [
+            [
+                sum(
+                    self._table[color][transform[index]] << (64 * k)
+                    for k, transform in enumerate(self.symmetries)
+                )
+                for index in range(self.total_squares)
+            ]
+            for color in range(3)
+        ]
+        self._empty_sym_hash = sum(
+            self._empty_hash << (64 * k) for k in range(SYMMETRY_COUNT)
+        )
+    
+    @staticmethod
+    def _build_symmetries(size: int) -> tuple[tuple[int, ...], ...]:
+        """
+        Index permutations for the 8 board symmetries.
+        
+        Order: identity, rotations by 90/180/270 degrees, mirror
+        columns, mirror rows, transpose, anti-transpose.
+        """
+        n = size - 1
+        maps = (
+            lambda c, r: (c, r),
+            lambda c, r: (n - r, c),
+            lambda c, r: (n - c, n - r),
+            lambda c, r: (r, n - c),
+            lambda c, r: (n - c, r),
+            lambda c, r: (c, n - r),
+            lambda c, r: (r, c),
+            lambda c, r: (n - r, n - c),
+        )
+        symmetries = []
+        for transform in maps:
+            table = []
+            for index in range(size * size):
+                col, row = transform(index % size, index // size)
+                table.append(row * size + col)
+            symmetries.append(tuple(table))
+        return tuple(symmetries)
     
     @property
     def empty_hash(self) -> int:
         """Hash value for an empty board."""
         return self._empty_hash
     
+    @property
+    def empty_sym_hash(self) -> int:
+        """Packed symmetry hashes for an empty board."""
+        return self._empty_sym_hash
+    
     def _index(self, col: int, row: int) -> int:
         """Convert (col, row) to linear index."""
         return row * self.size + col
@@ -95,6 +163,53 @@ class ZobristHash:
         """
         return current_hash ^ self.get_value(col, row, color)
     
+    def update_index(self, current_hash: int, index: int, color: int) -> int:
+        """
+        Update hash for a stone given by its square index.
+        
+        Same as update(), without the coordinate conversion.
+        
+        Args:
+            current_hash: Current hash value.
+            index: Square index (row * size + col).
+            color: Color of stone (1=BLACK, 2=WHITE).
+        """
+        return current_hash ^ self._table[color][index]
+    
+    def update_symmetric(self, sym_hash: int, index: int, color: int) -> int:
+        """
+        Update packed symmetry hashes when adding or removing a stone.
+        
+        Args:
+            sym_hash: Current packed symmetry hashes.
+            index: Square index (row * size + col).
+            color: Color of stone (1=BLACK, 2=WHITE).
+            
+        Returns:
+            Updated packed symmetry hashes.
+        """
+        return sym_hash ^ self._sym_table[color][index]
+    
+    def symmetric_hashes(self, sym_hash: int) -> tuple[int, ...]:
+        """
+        Unpack the hash of each symmetry.
+        
+        Entry 0 (identity) equals the plain Zobrist hash; entry k is
+        the plain hash of the position with transform k applied.
+        """
+        return tuple(
+            (sym_hash >> (64 * k)) & _MASK64 for k in range(SYMMETRY_COUNT)
+        )
+    
+    def canonical(self, sym_hash: int) -> int:
+        """
+        Get the canonical hash: the smallest of the 8 symmetry hashes.
+        
+        Rotating or reflecting a position permutes its symmetry
+        hashes, so all 8 variants share the same canonical hash.
+        """
+        return min(self.symmetric_hashes(sym_hash))
+    
     def toggle_side(self, current_hash: int) -> int:
         """
         Toggle the side-to-move bit.
@@ -4,7 +4,20 @@ Application layer provides high-level API for engine interaction.
 """
 
 from pygomo.client.engine import EngineClient
+from pygomo.client.pool import EnginePool
+from pygomo.client.analyzer import Analyzer, AnalysisResult
+from pygomo.client.cache import AnalysisCache, CacheKey
+from pygomo.client.sync import PositionTracker
+from pygomo.client.async_engine import AsyncEngineClient, AsyncSearch
 
 __all__ = [
     "EngineClient",
+    "EnginePool",
+    "Analyzer",
+    "AnalysisResult",
+    "AnalysisCache",
+    "CacheKey",
+    "PositionTracker",
+    "AsyncEngineClient",
+    "AsyncSearch",
 ]
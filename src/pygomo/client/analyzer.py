@@ -0,0 +1,231 @@
+"""
+Batch position analysis.
+
+This module provides Analyzer, which fans a stream of positions out
+over the engines of an EnginePool and yields the analyses as they
+finish, keeping only a bounded number of positions in flight.
+"""
+
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+from pygomo.client.engine import EngineClient
+from pygomo.client.pool import EnginePool
+from pygomo.protocol.models import BoardPosition, Move, PlayResult, SearchInfo
+
+
+@dataclass
+class AnalysisResult:
+    """
+    Analysis of one position.
+
+    `index` is the position's place in the input; `result` is None
+    if the engine did not answer in time (or died).
+    """
+    index: int
+    position: BoardPosition
+    result: Optional[PlayResult] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.result is not None
+
+    @property
+    def move(self) -> Optional[Move]:
+        """Best move, or None on failure."""
+        return self.result.move if self.result else None
+
+    @property
+    def lines(self) -> list[SearchInfo]:
+        """Latest search info of each PV line, best first."""
+        return self.result.all_info if self.result else []
+
+
+# Marks the end of the job queue for a worker
+_DONE = None
+
+
+class Analyzer:
+    """
+    Analyze many positions in parallel on an EnginePool.
+
+    Each worker thread borrows one engine from the pool for the whole
+    run and sets its INFO TIMEOUT_TURN to `time_ms`, restoring the
+    engine's previous value (e.g. from the pool options) when it gives
+    the engine back. With `nbest=1`
+    a position is analyzed with BOARD; with more lines it is set up
+    with YXBOARD and searched with YXNBEST. The input iterable is
+    consumed lazily: at most `max_pending` positions are queued or
+    being analyzed at any time.
+
+    Results are yielded in completion order, or in input order with
+    `ordered=True`: finished results then wait for earlier ones, and
+    count against the `max_pending` window until they are yielded.
+
+    Example::
+
+        with EnginePool("/path/to/engine", size=8) as pool:
+            analyzer = Analyzer(pool, time_ms=500)
+            for analysis in analyzer.analyze(positions):
+                print(analysis.index, analysis.move)
+    """
+
+    def __init__(
+        self,
+        pool: EnginePool,
+        time_ms: int = 1000,
+        nbest: int = 1,
+        ordered: bool = False,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        timeout_margin: float = 5.0,
+    ):
+        """
+        Args:
+            pool: Engines to analyze with.
+            time_ms: Thinking time per position (INFO TIMEOUT_TURN).
+            nbest: Number of best lines per position.
+            ordered: Yield results in input order.
+            workers: Concurrent analyses; defaults to the pool size.
+            max_pending: Positions in flight; defaults to 2 * workers.
+            timeout_margin: Seconds on top of time_ms before a position
+                is given up.
+        """
+        if nbest < 1:
+            raise ValueError("nbest must be at least 1")
+
+        self._pool = pool
+        self._time_ms = time_ms
+        self._nbest = nbest
+        self._ordered = ordered
+        self._workers = workers or pool.size
+        self._max_pending = max_pending or 2 * self._workers
+        self._timeout = time_ms / 1000 + timeout_margin
+
+        if self._max_pending < self._workers:
+            raise ValueError("max_pending must be at least the number of workers")
+
+    def analyze(self, positions: Iterable[BoardPosition]) -> Iterator[AnalysisResult]:
+        """
+        Analyze positions, yielding each result as it is ready.
+
+        Leaving the loop early stops the workers after their current
+        position.
+
+        Raises:
+            EngineError: If the pool cannot provide an engine.
+        """
+        jobs: "queue.Queue[Optional[tuple[int, BoardPosition]]]" = queue.Queue()
+        results: "queue.Queue[tuple[int, Optional[AnalysisResult], Optional[BaseException]]]" = queue.Queue()
+        stop = threading.Event()
+
+        threads = [
+            threading.Thread(
+                target=self._work, args=(jobs, results, stop),
+                name=f"pygomo-analyzer-{i}", daemon=True,
+            )
+            for i in range(self._workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        source = enumerate(positions)
+        exhausted = False
+        in_flight = 0
+        ready: dict[int, AnalysisResult] = {}
+        next_index = 0
+
+        try:
+            while True:
+                # Back-pressure: only pull input while the window has room
+                while not exhausted and in_flight < self._max_pending:
+                    job = next(source, None)
+                    if job is None:
+                        exhausted = True
+                    else:
+                        jobs.put(job)
+                        in_flight += 1
+
+                if in_flight == 0:
+                    return
+
+                index, analysis, error = results.get()
+                if error is not None:
+                    raise error
+
+                if not self._ordered:
+                    in_flight -= 1
+                    yield analysis
+                    continue
+
+                # Held results stay in the window until they are yielded
+                ready[index] = analysis
+                while next_index in ready:
+                    in_flight -= 1
+                    yield ready.pop(next_index)
+                    next_index += 1
+        finally:
+            stop.set()
+            for _ in threads:
+                jobs.put(_DONE)
+            for thread in threads:
+                thread.join()
+
+    def _work(
+        self,
+        jobs: "queue.Queue",
+        results: "queue.Queue",
+        stop: threading.Event,
+    ) -> None:
+        """Worker thread: analyze jobs on one borrowed engine."""
+        while not stop.is_set():
+            try:
+                with self._pool.acquire() as engine:
+                    previous = engine.settings.get("TIMEOUT_TURN")
+                    engine.set_time(turn_time_ms=self._time_ms)
+                    try:
+                        if not self._drain(engine, jobs, results, stop):
+                            return
+                    finally:
+                        if previous is not None:
+                            engine.set_time(turn_time_ms=previous)
+            except Exception as e:
+                results.put((-1, None, e))  # Fails the whole run
+                return
+
+    def _drain(
+        self,
+        engine: EngineClient,
+        jobs: "queue.Queue",
+        results: "queue.Queue",
+        stop: threading.Event,
+    ) -> bool:
+        """
+        Analyze jobs until the queue ends or the engine fails.
+
+        Returns:
+            True if the engine failed and must be returned to the pool.
+        """
+        while True:
+            job = jobs.get()
+            if job is _DONE or stop.is_set():
+                return False
+
+            index, position = job
+            result = self._analyze(engine, position)
+            results.put((index, AnalysisResult(index, position, result), None))
+
+            if result is None:
+                if engine.is_connected:
+                    engine.stop()  # Still thinking; the pool restarts it
+                return True
+
+    def _analyze(self, engine: EngineClient, position: BoardPosition) -> Optional[PlayResult]:
+        """Analyze one position with BOARD, or YXBOARD + YXNBEST."""
+        if self._nbest == 1:
+            return engine.board(position, timeout=self._timeout, collect="last")
+
+        engine.board(position, start_thinking=False)
+        return engine.nbest(self._nbest, timeout=self._timeout, collect="last")
@@ -0,0 +1,477 @@
+"""
+asyncio engine client API.
+
+This module provides AsyncEngineClient, the asyncio counterpart of
+EngineClient, for driving many engines from one event loop.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Callable, Generator, Optional, Union
+
+from pygomo.transport.async_subprocess import AsyncSubprocessTransport, AsyncOutputRouter
+from pygomo.protocol import GomocupProtocol, IProtocol
+from pygomo.command.handlers.base import SearchInfoCollector
+from pygomo.protocol.models import (
+    Move,
+    PlayResult,
+    SearchInfo,
+    BoardPosition,
+)
+
+
+# Marks the end of an AsyncSearch info stream
+_DONE = object()
+
+
+class AsyncSearch:
+    """
+    A thinking command (TURN, BEGIN, BOARD, YXNBEST) in flight.
+
+    Await it for the final PlayResult (None on timeout or failure),
+    or iterate it to receive each SearchInfo as soon as the engine
+    prints it. The command is sent on first await or iteration.
+
+    Example::
+
+        result = await engine.turn("h8")
+
+        search = engine.turn("i9")
+        async for info in search:
+            print(info.depth, info.eval.raw_value)
+        result = await search  # Already finished, returns at once
+    """
+
+    def __init__(
+        self,
+        run: Callable[["AsyncSearch"], "asyncio.Future[Optional[PlayResult]]"],
+        on_info: Optional[Callable[[SearchInfo], None]] = None,
+    ):
+        self._run = run
+        self._on_info = on_info
+        self._queue: "asyncio.Queue[Any]" = asyncio.Queue()
+        self._task: Optional["asyncio.Task[Optional[PlayResult]]"] = None
+        self._exhausted = False
+
+    def _start(self) -> "asyncio.Task[Optional[PlayResult]]":
+        """Start the command task once."""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._main())
+        return self._task
+
+    async def _main(self) -> Optional[PlayResult]:
+        try:
+            return await self._run(self)
+        finally:
+            self._queue.put_nowait(_DONE)
+
+    def _emit(self, info: SearchInfo) -> None:
+        """Deliver one search info to iterators and the callback."""
+        self._queue.put_nowait(info)
+        if self._on_info:
+            self._on_info(info)
+
+    @property
+    def done(self) -> bool:
+        """Whether the engine has answered (or the command failed)."""
+        return self._task is not None and self._task.done()
+
+    def __await__(self) -> Generator[Any, None, Optional[PlayResult]]:
+        return self._start().__await__()
+
+    def __aiter__(self) -> AsyncIterator[SearchInfo]:
+        self._start()
+        return self
+
+    async def __anext__(self) -> SearchInfo:
+        if self._exhausted:
+            raise StopAsyncIteration
+        item = await self._queue.get()
+        if item is _DONE:
+            self._exhausted = True
+            raise StopAsyncIteration
+        return item
+
+
+class AsyncEngineClient:
+    """
+    asyncio client for engine communication.
+
+    Mirrors EngineClient, with coroutine methods. Thinking commands
+    return an AsyncSearch that can be awaited for the result or
+    iterated for realtime search info. Commands on one client are
+    serialized; run many clients concurrently to drive many engines.
+
+    Example::
+
+        async with AsyncEngineClient("/path/to/engine") as engine:
+            await engine.start(15)
+
+            result = await engine.turn("h8")
+            print(f"Engine played: {result.move}")
+
+            async for info in engine.turn("i9"):
+                print(f"Depth {info.depth}: {info.winrate_percent:.1f}%")
+    """
+
+    def __init__(
+        self,
+        executable_path: str,
+        protocol: Optional[IProtocol] = None,
+        **transport_kwargs,
+    ):
+        """
+        Initialize the engine client.
+
+        Args:
+            executable_path: Path to engine executable.
+            protocol: Protocol implementation (defaults to GomocupProtocol).
+            **transport_kwargs: Additional args for transport (e.g., working_directory).
+        """
+        self._executable_path = executable_path
+        self._protocol = protocol or GomocupProtocol()
+        self._transport_kwargs = transport_kwargs
+
+        self._transport: Optional[AsyncSubprocessTransport] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+        # Default settings
+        self._default_timeout = 60.0
+        self._board_size = 15
+        self._is_started = False
+
+    # ==================== Properties ====================
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if connected to engine."""
+        return self._transport is not None and self._transport.is_running
+
+    @property
+    def is_started(self) -> bool:
+        """Check if game has been started (START command sent)."""
+        return self._is_started
+
+    @property
+    def process_id(self) -> Optional[int]:
+        """Get engine process ID."""
+        return self._transport.process_id if self._transport else None
+
+    @property
+    def protocol(self) -> IProtocol:
+        """Get the protocol implementation."""
+        return self._protocol
+
+    @property
+    def router(self) -> Optional[AsyncOutputRouter]:
+        """Get the output channel router."""
+        return self._transport.router if self.is_connected else None
+
+    # ==================== Connection ====================
+
+    async def connect(self) -> None:
+        """
+        Connect to the engine (start subprocess).
+
+        Raises:
+            RuntimeError: If already connected.
+        """
+        if self.is_connected:
+            raise RuntimeError("Already connected to engine")
+
+        self._transport = AsyncSubprocessTransport(
+            self._executable_path,
+            **self._transport_kwargs,
+        )
+        await self._transport.start()
+        self._lock = asyncio.Lock()
+
+    async def disconnect(self, timeout: float = 5.0) -> None:
+        """
+        Disconnect from engine (stop subprocess).
+
+        Args:
+            timeout: Time to wait for graceful shutdown.
+        """
+        if self._transport:
+            await self._transport.stop(timeout=timeout)
+            self._transport = None
+        self._is_started = False
+
+    # ==================== Lifecycle Commands ====================
+
+    async def start(
+        self,
+        board_size: int = 15,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Start a new game with specified board size.
+
+        Returns:
+            True if successful.
+        """
+        if not self.is_connected:
+            await self.connect()
+
+        if await self._command_ok(f"START {board_size}", timeout or 5.0):
+            self._board_size = board_size
+            self._is_started = True
+            return True
+        return False
+
+    async def restart(self, timeout: Optional[float] = None) -> bool:
+        """Restart the current game. Returns True if successful."""
+        return await self._command_ok("RESTART", timeout or 5.0)
+
+    async def quit(self) -> None:
+        """Quit the engine and disconnect."""
+        if self.is_connected:
+            await self._send("END")
+        await self.disconnect()
+
+    async def about(self, timeout: Optional[float] = None) -> Optional[str]:
+        """Get engine information, or None on failure."""
+        if not self.is_connected:
+            raise RuntimeError("Not connected to engine")
+        async with self._lock:
+            await self._send("ABOUT")
+            response = await self.router.get("output", timeout=timeout or 5.0)
+        return response or None
+
+    # ==================== Game Commands ====================
+
+    def turn(
+        self,
+        move: Union[str, Move, tuple[int, int]],
+        timeout: Optional[float] = None,
+        on_info: Optional[Callable[[SearchInfo], None]] = None,
+        collect: str = "all",
+    ) -> AsyncSearch:
+        """
+        Send opponent's move and get engine's response.
+
+        Args:
+            move: Move in any format ("h8", "7,8", (7, 8), or Move).
+            timeout: Maximum thinking time.
+            on_info: Callback for realtime search info.
+            collect: Search info kept in the result: "all", "per_depth" or "last".
+
+        Returns:
+            AsyncSearch resolving to a PlayResult, or None on failure.
+        """
+        if isinstance(move, tuple):
+            move = Move(move)
+        elif isinstance(move, str):
+            move = Move.parse(move)
+
+        command = self._protocol.serialize_command("TURN", move)
+        return self._search([command], timeout, on_info, collect)
+
+    def begin(
+        self,
+        timeout: Optional[float] = None,
+        on_info: Optional[Callable[[SearchInfo], None]] = None,
+        collect: str = "all",
+    ) -> AsyncSearch:
+        """Request engine's first move (engine plays black)."""
+        return self._search(["BEGIN"], timeout, on_info, collect)
+
+    def board(
+        self,
+        position: BoardPosition,
+        timeout: Optional[float] = None,
+        on_info: Optional[Callable[[SearchInfo], None]] = None,
+        collect: str = "all",
+    ) -> AsyncSearch:
+        """
+        Set up a position and get engine's move.
+
+        Use set_position() to set up a position without thinking.
+        """
+        lines = ["BOARD"] + position.to_protocol_string().split("\n")
+        return self._search(lines, timeout, on_info, collect)
+
+    async def set_position(self, position: BoardPosition) -> None:
+        """Set up a position without thinking (YXBOARD)."""
+        if not self.is_connected:
+            raise RuntimeError("Not connected to engine")
+        async with self._lock:
+            await self._send_many(["YXBOARD"] + position.to_protocol_string().split("\n"))
+
+    async def takeback(
+        self,
+        move: Union[str, Move],
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Take back a move. Returns True if successful."""
+        if isinstance(move, str):
+            move = Move.parse(move)
+        command = self._protocol.serialize_command("TAKEBACK", move)
+        return await self._command_ok(command, timeout or 5.0)
+
+    async def stop(self) -> None:
+        """
+        Stop engine thinking immediately.
+
+        Sent without waiting for the command lock, so it can interrupt
+        a search in progress.
+        """
+        await self._send("STOP")
+
+    # ==================== Search Commands ====================
+
+    def nbest(
+        self,
+        count: int = 5,
+        timeout: Optional[float] = None,
+        on_info: Optional[Callable[[SearchInfo], None]] = None,
+        collect: str = "all",
+    ) -> AsyncSearch:
+        """Get multiple best moves from engine."""
+        command = self._protocol.serialize_command("YXNBEST", count)
+        return self._search([command], timeout, on_info, collect)
+
+    # ==================== Configuration ====================
+
+    async def configure(self, **options) -> None:
+        """
+        Configure engine options.
+
+        Example::
+
+            await engine.configure(timeout_turn=5000, thread_num=4)
+        """
+        for key, value in options.items():
+            await self._info(key.upper(), value)
+
+    async def set_time(
+        self,
+        turn_time_ms: Optional[int] = None,
+        match_time_ms: Optional[int] = None,
+        time_left_ms: Optional[int] = None,
+    ) -> None:
+        """Set time control options (milliseconds)."""
+        if turn_time_ms is not None:
+            await self._info("TIMEOUT_TURN", turn_time_ms)
+        if match_time_ms is not None:
+            await self._info("TIMEOUT_MATCH", match_time_ms)
+        if time_left_ms is not None:
+            await self._info("TIME_LEFT", time_left_ms)
+
+    async def set_rule(self, rule: int) -> None:
+        """Set game rule (0=freestyle, 1=standard, 4=renju)."""
+        await self._info("RULE", rule)
+
+    async def set_threads(self, count: int) -> None:
+        """Set number of search threads."""
+        await self._info("THREAD_NUM", count)
+
+    async def set_memory(self, size_bytes: int) -> None:
+        """Set maximum memory usage."""
+        await self._info("MAX_MEMORY", size_bytes)
+
+    # ==================== Raw Access ====================
+
+    async def send_raw(self, command: str) -> None:
+        """Send a raw command string directly to engine."""
+        await self._send(command)
+
+    async def receive_raw(self, channel: str = "output", timeout: float = 1.0) -> str:
+        """Receive raw output from a channel."""
+        if not self.is_connected:
+            raise RuntimeError("Not connected to engine")
+        return await self.router.get(channel, timeout=timeout)
+
+    # ==================== Internal ====================
+
+    async def _send(self, line: str) -> None:
+        """Send one line to the engine."""
+        if not self.is_connected:
+            raise RuntimeError("Not connected to engine")
+        await self._transport.send(line)
+
+    async def _send_many(self, lines: list[str]) -> None:
+        """Send several lines to the engine in one write."""
+        if not self.is_connected:
+            raise RuntimeError("Not connected to engine")
+        await self._transport.send_many(lines)
+
+    async def _info(self, key: str, value: Any) -> None:
+        """Send one INFO key/value option."""
+        await self._send(self._protocol.serialize_command("INFO", key, value))
+
+    async def _command_ok(self, command: str, timeout: float) -> bool:
+        """Send a command and wait for OK."""
+        if not self.is_connected:
+            return False
+        async with self._lock:
+            await self._send(command)
+            response = await self.router.get("output", timeout=timeout)
+        return response.upper() == "OK"
+
+    def _search(
+        self,
+        lines: list[str],
+        timeout: Optional[float],
+        on_info: Optional[Callable[[SearchInfo], None]],
+        collect: str,
+    ) -> AsyncSearch:
+        """Build an AsyncSearch that sends lines and waits for a coordinate."""
+        timeout = timeout or self._default_timeout
+        SearchInfoCollector.check_mode(collect)
+
+        async def run(search: AsyncSearch) -> Optional[PlayResult]:
+            if not self.is_connected:
+                return None
+
+            async with self._lock:
+                router = self.router
+                collector = SearchInfoCollector(self._protocol, collect, search._emit)
+                await self._send_many(lines)
+
+                coord = await self._wait_for_coord(router, timeout, collector)
+                if not coord:
+                    return None
+                return collector.play_result(coord)
+
+        return AsyncSearch(run, on_info)
+
+    async def _wait_for_coord(
+        self,
+        router: AsyncOutputRouter,
+        timeout: float,
+        collector: SearchInfoCollector,
+    ) -> str:
+        """Wait for a coordinate while dispatching search info as it arrives."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        while True:
+            channel = await router.wait_any(
+                ("coord", "message"),
+                timeout=deadline - loop.time(),
+            )
+
+            if channel == "coord":
+                coord = router.get_nowait("coord")
+                for msg in router.get_all("message"):
+                    collector.add(msg)
+                return coord or ""
+
+            if channel is None:
+                return ""
+
+            for msg in router.get_all("message"):
+                collector.add(msg)
+
+    # ==================== Context Manager ====================
+
+    async def __aenter__(self) -> "AsyncEngineClient":
+        """Async context manager entry."""
+        if not self.is_connected:
+            await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.quit()
@@ -0,0 +1,262 @@
+"""
+Persistent analysis cache.
+
+This module provides AnalysisCache, an sqlite store of engine
+results keyed by the Zobrist hash of the position and everything
+else that changes the engine's answer: board size, rule, engine
+identity and time budget. An EngineClient given a cache answers
+repeated BOARD / YXNBEST searches from it without asking the engine.
+"""
+
+import json
+import sqlite3
+import threading
+from dataclasses import astuple, dataclass
+from typing import Any, Optional
+
+from pygomo.board.zobrist import get_zobrist
+from pygomo.protocol.models import (
+    BoardPosition,
+    Evaluate,
+    Move,
+    PlayResult,
+    SearchInfo,
+)
+
+
+@dataclass(frozen=True)
+class CacheKey:
+    """Everything that identifies one cached search."""
+    position: int  # Zobrist hash, as a signed 64-bit integer
+    board_size: int
+    rule: int
+    engine: str  # Executable, arguments and engine options
+    budget: str  # Time settings, e.g. "TIMEOUT_TURN=1000"
+    command: str  # "BOARD" or "YXNBEST <count>"
+
+
+# INFO keys that make up the time budget of a search; every other
+# INFO key (except RULE and TIME_LEFT) is part of the engine identity
+BUDGET_INFO = ("TIMEOUT_TURN", "TIMEOUT_MATCH", "MAX_NODE", "MAX_DEPTH")
+
+# INFO keys left out of the key: TIME_LEFT changes with every move of
+# a timed game, so keying on it would never hit
+_UNKEYED_INFO = ("RULE", "TIME_LEFT")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analysis (
+    position INTEGER NOT NULL,
+    board_size INTEGER NOT NULL,
+    rule INTEGER NOT NULL,
+    engine TEXT NOT NULL,
+    budget TEXT NOT NULL,
+    command TEXT NOT NULL,
+    result TEXT NOT NULL,
+    PRIMARY KEY (position, board_size, rule, engine, budget, command)
+)
+"""
+
+_WHERE = (
+    "position = ? AND board_size = ? AND rule = ? "
+    "AND engine = ? AND budget = ? AND command = ?"
+)
+
+
+class AnalysisCache:
+    """
+    On-disk cache of engine analyses.
+
+    Stores the move and the final search info of every PV line. A
+    cached result therefore looks like one collected with
+    `collect="last"`, whatever mode the original search used.
+
+    One cache can be shared by several clients and threads (e.g. all
+    engines of an EnginePool) and, through the file, by several
+    processes.
+
+    Example::
+
+        with AnalysisCache("analysis.db") as cache:
+            with EngineClient("/path/to/engine", cache=cache) as engine:
+                engine.start(15)
+                engine.set_time(turn_time_ms=5000)
+                result = engine.board(position)  # Searched once, then cached
+    """
+
+    def __init__(self, path: str = ":memory:", timeout: float = 30.0):
+        """
+        Args:
+            path: Database file; ":memory:" keeps the cache in memory.
+            timeout: Seconds to wait for a lock held by another process.
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(_SCHEMA)
+
+        self.hits = 0
+        self.misses = 0
+
+    # ==================== Keys ====================
+
+    @classmethod
+    def key(
+        cls,
+        position: BoardPosition,
+        command: str,
+        engine_id: str,
+        settings: dict[str, Any],
+        board_size: int = 15,
+    ) -> Optional[CacheKey]:
+        """
+        Build the key of a search.
+
+        Args:
+            position: Position searched.
+            command: "BOARD" or "YXNBEST <count>".
+            engine_id: Identity of the engine binary and arguments.
+            settings: INFO values sent to the engine, by upper-case key.
+            board_size: Board size.
+
+        Returns:
+            The key, or None if the position cannot be cached.
+        """
+        position_hash = cls.position_hash(position, board_size)
+        if position_hash is None:
+            return None
+
+        budget = " ".join(
+            f"{name}={settings[name]}" for name in BUDGET_INFO if name in settings
+        )
+        options = " ".join(
+            f"{name}={value}"
+            for name, value in sorted(settings.items())
+            if name not in BUDGET_INFO and name not in _UNKEYED_INFO
+        )
+        return CacheKey(
+            position=position_hash,
+            board_size=board_size,
+            rule=int(settings.get("RULE", 0)),
+            engine=f"{engine_id} {options}".rstrip(),
+            budget=budget,
+            command=command,
+        )
+
+    @staticmethod
+    def position_hash(position: BoardPosition, board_size: int = 15) -> Optional[int]:
+        """
+        Zobrist hash of a BOARD position, from the side to move.
+
+        Equal to BitBoard.hash with own stones as black, as a signed
+        64-bit integer. Positions with walls are not cached.
+
+        Returns:
+            The hash, or None if the position has a wall.
+        """
+        stones = []
+        for move, color in position.moves:
+            if color == BoardPosition.WALL:
+                return None
+            stones.append((move.col, move.row, color))
+
+        value = get_zobrist(board_size).compute_full(stones)
+        return value - (1 << 64) if value >= 1 << 63 else value
+
+    # ==================== Access ====================
+
+    def get(self, key: CacheKey) -> Optional[PlayResult]:
+        """Cached result for a key, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT result FROM analysis WHERE {_WHERE}", astuple(key),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return _decode(row[0])
+
+    def put(self, key: CacheKey, result: PlayResult) -> None:
+        """Store a result, replacing any previous one for the key."""
+        data = _encode(result)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analysis VALUES (?, ?, ?, ?, ?, ?, ?)",
+                astuple(key) + (data,),
+            )
+
+    def clear(self) -> None:
+        """Remove every cached result."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM analysis")
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM analysis").fetchone()[0]
+
+    def __enter__(self) -> "AnalysisCache":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+# ==================== Serialization ====================
+
+def _encode(result: PlayResult) -> str:
+    """
+    JSON for a result: its move and the latest info of each line.
+
+    Infos that cannot be read (malformed lines) are left out.
+    """
+    lines: dict[int, list] = {}
+    for info in result.all_info:
+        values = _encode_info(info)
+        if values is not None:
+            lines[values[-1]] = values
+    return json.dumps({
+        "move": result.move.to_tuple(),
+        "info": [lines[k] for k in sorted(lines)],
+        "final": _encode_info(result.search_info) if result.search_info else None,
+    })
+
+
+def _encode_info(info: SearchInfo) -> Optional[list]:
+    """Field values of an info, or None if it cannot be read."""
+    try:
+        return [
+            info.depth, info.sel_depth, info.eval.raw_value, info.nodes,
+            info.nps, info.time_ms, [move.to_tuple() for move in info.pv], info.multipv,
+        ]
+    except Exception:
+        return None
+
+
+def _decode(text: str) -> PlayResult:
+    data = json.loads(text)
+    final = data["final"]
+    return PlayResult(
+        move=Move.of(*data["move"]),
+        search_info=_decode_info(final) if final else None,
+        all_info=[_decode_info(info) for info in data["info"]],
+    )
+
+
+def _decode_info(values: list) -> SearchInfo:
+    depth, sel_depth, raw_eval, nodes, nps, time_ms, pv, multipv = values
+    return SearchInfo(
+        depth=depth,
+        sel_depth=sel_depth,
+        eval=Evaluate(raw_eval),
+        nodes=nodes,
+        nps=nps,
+        time_ms=time_ms,
+        pv=[Move.of(col, row) for col, row in pv],
+        multipv=multipv,
+    )
@@ -5,7 +5,7 @@ This module provides the main EngineClient class that serves
 as the facade for engine communication.
 """
 
-from typing import Optional, Callable, Union, Any
+from typing import TYPE_CHECKING, Optional, Callable, Sequence, Union, Any
 
 from pygomo.transport import SubprocessTransport, OutputChannelRouter
 from pygomo.protocol import GomocupProtocol, IProtocol
@@ -17,7 +17,11 @@ from pygomo.protocol.models import (
 )
 from pygomo.command import CommandRegistry, CommandContext, CommandResult
 from pygomo.command.hooks import HookManager, HookType
-from pygomo.command.handlers import register_all_handlers
+from pygomo.command.handlers import register_all_handlers, SearchInfoCollector
+from pygomo.client.sync import PositionTracker
+
+if TYPE_CHECKING:
+    from pygomo.client.cache import AnalysisCache, CacheKey
 
 
 class EngineClient:
@@ -62,6 +66,8 @@ class EngineClient:
         executable_path: str,
         protocol: Optional[IProtocol] = None,
         auto_start: bool = False,
+        transport_class: type[SubprocessTransport] = SubprocessTransport,
+        cache: Optional["AnalysisCache"] = None,
         **transport_kwargs,
     ):
         """
@@ -71,11 +77,17 @@ class EngineClient:
             executable_path: Path to engine executable.
             protocol: Protocol implementation (defaults to GomocupProtocol).
             auto_start: Whether to start engine immediately.
+            transport_class: Transport to spawn the engine with, e.g.
+                BinarySubprocessTransport for verbose engines.
+            cache: AnalysisCache answering repeated board() / nbest()
+                searches without the engine.
             **transport_kwargs: Additional args for transport (e.g., working_directory).
         """
         self._executable_path = executable_path
         self._protocol = protocol or GomocupProtocol()
+        self._transport_class = transport_class
         self._transport_kwargs = transport_kwargs
+        self._cache = cache
         
         # Components (initialized on start)
         self._transport: Optional[SubprocessTransport] = None
@@ -90,6 +102,14 @@ class EngineClient:
         self._board_size = 15
         self._is_started = False
         
+        # INFO values sent so far, and the position set up with
+        # board(start_thinking=False), for cache keys
+        self._settings: dict[str, Any] = {}
+        self._position: Optional[BoardPosition] = None
+        
+        # Moves the engine holds, followed from every command
+        self._tracker = PositionTracker()
+        
         if auto_start:
             self.connect()
     
@@ -125,6 +145,21 @@ class EngineClient:
         """Get the command registry for custom handlers."""
         return self._registry
     
+    @property
+    def tracker(self) -> PositionTracker:
+        """Get the tracker of the engine's current position."""
+        return self._tracker
+    
+    @property
+    def cache(self) -> Optional["AnalysisCache"]:
+        """Get the analysis cache, if any."""
+        return self._cache
+    
+    @property
+    def settings(self) -> dict[str, Any]:
+        """Get the INFO options sent to the engine, by upper-case key."""
+        return dict(self._settings)
+    
     @property
     def router(self) -> Optional[OutputChannelRouter]:
         """Get the output channel router."""
@@ -142,7 +177,7 @@ class EngineClient:
         if self.is_connected:
             raise RuntimeError("Already connected to engine")
         
-        self._transport = SubprocessTransport(
+        self._transport = self._transport_class(
             self._executable_path,
             **self._transport_kwargs,
         )
@@ -161,6 +196,7 @@ class EngineClient:
             self._transport = None
             self._router = None
         self._is_started = False
+        self._tracker.invalidate()
     
     # ==================== Lifecycle Commands ====================
     
@@ -184,6 +220,7 @@ class EngineClient:
         
         result = self._execute("START", board_size, timeout=timeout)
         
+        self._position = None
         if result.is_success:
             self._board_size = board_size
             self._is_started = True
@@ -198,6 +235,7 @@ class EngineClient:
         Returns:
             True if successful.
         """
+        self._position = None
         result = self._execute("RESTART", timeout=timeout)
         return result.is_success
     
@@ -226,6 +264,7 @@ class EngineClient:
         move: Union[str, Move, tuple[int, int]],
         timeout: Optional[float] = None,
         on_info: Optional[Callable[[SearchInfo], None]] = None,
+        collect: str = "all",
     ) -> Optional[PlayResult]:
         """
         Send opponent's move and get engine's response.
@@ -234,6 +273,8 @@ class EngineClient:
             move: Move in any format ("h8", "7,8", (7, 8), or Move).
             timeout: Maximum thinking time.
             on_info: Callback for realtime search info.
+            collect: Search info kept in the result: "all", "per_depth"
+                (latest per depth) or "last" (latest per multipv line).
             
         Returns:
             PlayResult with engine's move, or None on failure.
@@ -241,9 +282,12 @@ class EngineClient:
         if isinstance(move, tuple):
             move = Move(move)
         elif isinstance(move, str):
-            move = Move(move)
+            move = Move.parse(move)
         
-        result = self._execute("TURN", move, timeout=timeout, on_info=on_info)
+        self._position = None
+        result = self._execute(
+            "TURN", move, timeout=timeout, on_info=on_info, collect=SearchInfoCollector.check_mode(collect),
+        )
         
         if result.is_success:
             return result.data
@@ -254,6 +298,7 @@ class EngineClient:
         self,
         timeout: Optional[float] = None,
         on_info: Optional[Callable[[SearchInfo], None]] = None,
+        collect: str = "all",
     ) -> Optional[PlayResult]:
         """
         Request engine's first move (engine plays black).
@@ -261,11 +306,16 @@ class EngineClient:
         Args:
             timeout: Maximum thinking time.
             on_info: Callback for realtime search info.
+            collect: Search info kept in the result: "all", "per_depth"
+                (latest per depth) or "last" (latest per multipv line).
             
         Returns:
             PlayResult with engine's move, or None on failure.
         """
-        result = self._execute("BEGIN", timeout=timeout, on_info=on_info)
+        self._position = None
+        result = self._execute(
+            "BEGIN", timeout=timeout, on_info=on_info, collect=SearchInfoCollector.check_mode(collect),
+        )
         
         if result.is_success:
             return result.data
@@ -278,32 +328,117 @@ class EngineClient:
         start_thinking: bool = True,
         timeout: Optional[float] = None,
         on_info: Optional[Callable[[SearchInfo], None]] = None,
+        collect: str = "all",
     ) -> Optional[PlayResult]:
         """
         Set up a position and optionally get engine's move.
         
+        With a cache, a position already searched with the same
+        settings is answered from the cache without searching. The
+        engine is still given the position and the cached move with
+        YXBOARD, so it holds the same stones as after a live search
+        and turn() can follow either way.
+        
         Args:
             position: BoardPosition with moves.
             start_thinking: Whether to trigger engine thinking.
             timeout: Maximum thinking time.
             on_info: Callback for realtime search info.
+            collect: Search info kept in the result: "all", "per_depth"
+                (latest per depth) or "last" (latest per multipv line).
             
         Returns:
             PlayResult if thinking, None otherwise.
         """
+        collect = SearchInfoCollector.check_mode(collect)
+        key = self._cache_key(position, "BOARD") if start_thinking else None
+        if key is not None:
+            cached = self._cached(key, on_info)
+            if cached is not None:
+                # Leave the engine where the search would have: the
+                # position plus its own reply
+                played = BoardPosition(
+                    moves=position.moves + [(cached.move, BoardPosition.SELF)],
+                )
+                self._execute("BOARD", position=played, start_thinking=False)
+                self._position = None
+                return cached
+        
         result = self._execute(
             "BOARD",
             position=position,
             start_thinking=start_thinking,
             timeout=timeout,
             on_info=on_info,
+            collect=collect,
         )
         
+        self._position = None
         if result.is_success:
+            if not start_thinking:
+                self._position = position
+            elif key is not None and result.data is not None:
+                self._cache_put(key, result.data)
             return result.data
         
         return None
     
+    def goto(
+        self,
+        moves: Sequence[Union[str, Move, tuple[int, int]]],
+        think: bool = True,
+        timeout: Optional[float] = None,
+        on_info: Optional[Callable[[SearchInfo], None]] = None,
+        collect: str = "all",
+    ) -> Optional[PlayResult]:
+        """
+        Bring the engine to a position with as few changes as possible.
+        
+        Stones the engine holds beyond the common prefix with `moves`
+        are taken back and the last move is played with TURN, so the
+        engine keeps its search state. BOARD (or YXBOARD) is sent only
+        when the engine's position is unknown, more than one stone
+        must be added, a kept stone would change owner (the engine is
+        to play the other color), or the engine rejects TAKEBACK. See
+        PositionTracker.plan.
+        
+        Args:
+            moves: Moves of the position in playing order, first black.
+            think: Whether the engine should search the position.
+            timeout: Maximum thinking time.
+            on_info: Callback for realtime search info.
+            collect: Search info kept in the result: "all", "per_depth"
+                (latest per depth) or "last" (latest per multipv line).
+            
+        Returns:
+            PlayResult if thinking, None otherwise (or on failure).
+        """
+        target = []
+        for move in moves:
+            if isinstance(move, tuple):
+                move = Move(move)
+            elif isinstance(move, str):
+                move = Move.parse(move)
+            target.append(move)
+        collect = SearchInfoCollector.check_mode(collect)
+        search = dict(timeout=timeout, on_info=on_info, collect=collect)
+        
+        for step in self._tracker.plan(target, think):
+            if step.command == "TAKEBACK":
+                if not self.takeback(step.move, timeout=timeout):
+                    # Engine without TAKEBACK: set the position directly
+                    position = PositionTracker.to_position(target)
+                    return self.board(position, start_thinking=think, **search)
+            elif step.command == "TURN":
+                return self.turn(step.move, **search)
+            elif step.command == "BEGIN":
+                return self.begin(**search)
+            else:
+                position = PositionTracker.to_position(target)
+                return self.board(position, start_thinking=think, **search)
+        
+        return None
+    
     def takeback(
         self,
         move: Union[str, Move],
@@ -320,8 +455,9 @@ class EngineClient:
             True if successful.
         """
         if isinstance(move, str):
-            move = Move(move)
+            move = Move.parse(move)
         
+        self._position = None
         result = self._execute("TAKEBACK", move, timeout=timeout)
         return result.is_success
     
@@ -336,21 +472,44 @@ class EngineClient:
         count: int = 5,
         timeout: Optional[float] = None,
         on_info: Optional[Callable[[SearchInfo], None]] = None,
+        collect: str = "all",
     ) -> Optional[PlayResult]:
         """
         Get multiple best moves from engine.
         
+        With a cache, searches of a position set up with
+        board(start_thinking=False), or of a position the engine is
+        known to hold (see goto), are answered from the cache.
+        
         Args:
             count: Number of best moves to request.
             timeout: Maximum thinking time.
             on_info: Callback for realtime search info.
+            collect: Search info kept in the result: "all", "per_depth"
+                (latest per depth) or "last" (latest per multipv line).
             
         Returns:
             PlayResult with best move and all info.
         """
-        result = self._execute("YXNBEST", count, timeout=timeout, on_info=on_info)
+        collect = SearchInfoCollector.check_mode(collect)
+        key = None
+        position = self._position
+        if position is None:
+            position = self._tracker.position
+        if position is not None:
+            key = self._cache_key(position, f"YXNBEST {count}")
+        if key is not None:
+            cached = self._cached(key, on_info)
+            if cached is not None:
+                return cached
+        
+        result = self._execute(
+            "YXNBEST", count, timeout=timeout, on_info=on_info, collect=collect,
+        )
         
         if result.is_success:
+            if key is not None and result.data is not None:
+                self._cache_put(key, result.data)
             return result.data
         
         return None
@@ -374,7 +533,7 @@ class EngineClient:
             )
         """
         for key, value in options.items():
-            self._execute("INFO", key.upper(), value)
+            self._send_info(key.upper(), value)
     
     def set_time(
         self,
@@ -391,11 +550,11 @@ class EngineClient:
             time_left_ms: Remaining time in milliseconds.
         """
         if turn_time_ms is not None:
-            self._execute("INFO", "TIMEOUT_TURN", turn_time_ms)
+            self._send_info("TIMEOUT_TURN", turn_time_ms)
         if match_time_ms is not None:
-            self._execute("INFO", "TIMEOUT_MATCH", match_time_ms)
+            self._send_info("TIMEOUT_MATCH", match_time_ms)
         if time_left_ms is not None:
-            self._execute("INFO", "TIME_LEFT", time_left_ms)
+            self._send_info("TIME_LEFT", time_left_ms)
     
     def set_rule(self, rule: int) -> None:
         """
@@ -404,7 +563,7 @@ class EngineClient:
         Args:
             rule: Rule ID (0=freestyle, 1=standard, 4=renju).
         """
-        self._execute("INFO", "RULE", rule)
+        self._send_info("RULE", rule)
     
     def set_threads(self, count: int) -> None:
         """
@@ -413,7 +572,7 @@ class EngineClient:
         Args:
             count: Number of threads.
         """
-        self._execute("INFO", "THREAD_NUM", count)
+        self._send_info("THREAD_NUM", count)
     
     def set_memory(self, size_bytes: int) -> None:
         """
@@ -422,7 +581,7 @@ class EngineClient:
         Args:
             size_bytes: Max memory in bytes.
         """
-        self._execute("INFO", "MAX_MEMORY", size_bytes)
+        self._send_info("MAX_MEMORY", size_bytes)
     
     # ==================== Raw Execution ====================
     
@@ -458,6 +617,7 @@ class EngineClient:
         """
         if not self.is_connected:
             raise RuntimeError("Not connected to engine")
+        self._tracker.invalidate()
         self._transport.send(command)
     
     def receive_raw(
@@ -481,6 +641,41 @@ class EngineClient:
     
     # ==================== Internal ====================
     
+    def _send_info(self, key: str, value: Any) -> None:
+        """Send an INFO option and remember it for cache keys."""
+        self._settings[key] = value
+        self._execute("INFO", key, value)
+    
+    def _cache_key(self, position: BoardPosition, command: str) -> Optional["CacheKey"]:
+        """Cache key of a search, or None without a cache."""
+        if self._cache is None:
+            return None
+        args = self._transport_kwargs.get("args") or []
+        engine_id = " ".join([self._executable_path, *map(str, args)])
+        return self._cache.key(position, command, engine_id, self._settings, self._board_size)
+    
+    def _cache_put(self, key: "CacheKey", result: PlayResult) -> None:
+        """Store a search result; a failed write never fails the search."""
+        try:
+            self._cache.put(key, result)
+        except Exception:
+            pass
+    
+    def _cached(
+        self,
+        key: "CacheKey",
+        on_info: Optional[Callable[[SearchInfo], None]],
+    ) -> Optional[PlayResult]:
+        """Cached result of a search, replaying its info to on_info."""
+        cached = self._cache.get(key)
+        if cached is not None and on_info is not None:
+            for info in cached.all_info:
+                try:
+                    on_info(info)
+                except Exception:
+                    pass  # As for a live search, the callback cannot fail it
+        return cached
+    
     def _execute(
         self,
         command: str,
@@ -504,7 +699,9 @@ class EngineClient:
             timeout=timeout or self._default_timeout,
         )
         
-        return self._registry.execute(context)
+        result = self._registry.execute(context)
+        self._tracker.observe(context, result)
+        return result
     
     # ==================== Context Manager ====================
     
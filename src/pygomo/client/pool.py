@@ -0,0 +1,259 @@
+"""
+Engine process pool.
+
+This module provides EnginePool, which keeps a fixed number of
+started and configured engines warm so that callers do not pay
+the engine startup cost (loading networks, allocating hash) on
+every request.
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from pygomo.client.engine import EngineClient
+from pygomo.exceptions import EngineError, TimeoutError
+
+
+class EnginePool:
+    """
+    Pool of warm, pre-started engines.
+
+    Every engine in the pool has already received START and the
+    configured INFO options. Engines are handed out with
+    `acquire()` and reset with RESTART when returned. Engines
+    whose process died, or that fail to answer RESTART, are
+    replaced with a fresh one.
+
+    Example::
+
+        with EnginePool("/path/to/engine", size=4,
+                        options={"timeout_turn": 1000}) as pool:
+            with pool.acquire() as engine:
+                result = engine.turn("h8")
+    """
+
+    def __init__(
+        self,
+        executable_path: str,
+        size: int = 2,
+        board_size: int = 15,
+        options: Optional[dict[str, Any]] = None,
+        start_timeout: float = 30.0,
+        reset_timeout: float = 5.0,
+        **transport_kwargs,
+    ):
+        """
+        Initialize the pool. Engines are spawned by start().
+
+        Args:
+            executable_path: Path to engine executable.
+            size: Number of engines to keep.
+            board_size: Board size sent with START.
+            options: INFO options applied to each engine (see EngineClient.configure).
+            start_timeout: Time to wait for each engine to answer START.
+            reset_timeout: Time to wait for RESTART when an engine is returned.
+            **transport_kwargs: Additional args for transport (e.g., args, working_directory).
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self._executable_path = executable_path
+        self._size = size
+        self._board_size = board_size
+        self._options = dict(options or {})
+        self._start_timeout = start_timeout
+        self._reset_timeout = reset_timeout
+        self._transport_kwargs = transport_kwargs
+
+        # Idle engines; None marks a slot whose engine must be respawned
+        self._idle: "queue.Queue[Optional[EngineClient]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+
+    # ==================== Properties ====================
+
+    @property
+    def size(self) -> int:
+        """Number of engines managed by the pool."""
+        return self._size
+
+    @property
+    def available(self) -> int:
+        """Number of engines currently idle."""
+        return self._idle.qsize()
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether close() has been called."""
+        return self._closed
+
+    # ==================== Lifecycle ====================
+
+    def start(self) -> None:
+        """
+        Spawn, START and configure all engines.
+
+        Called automatically by the first acquire().
+
+        Raises:
+            EngineError: If an engine fails to start.
+            RuntimeError: If the pool is closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Engine pool is closed")
+            if self._started:
+                return
+
+            engines = []
+            try:
+                for _ in range(self._size):
+                    engines.append(self._spawn())
+            except Exception:
+                for engine in engines:
+                    engine.quit()
+                raise
+
+            for engine in engines:
+                self._idle.put(engine)
+            self._started = True
+
+    def close(self) -> None:
+        """
+        Quit all idle engines.
+
+        Engines still in use are quit when they are returned.
+        """
+        with self._lock:
+            self._closed = True
+
+        for engine in self._drain():
+            if engine is not None:
+                engine.quit()
+
+    # ==================== Acquire / Release ====================
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator[EngineClient]:
+        """
+        Borrow an engine for the duration of a `with` block.
+
+        The engine is reset with RESTART when the block exits; if
+        the block raised, the engine is told to stop thinking first.
+
+        Args:
+            timeout: Maximum time to wait for an idle engine. None waits forever.
+
+        Raises:
+            TimeoutError: If no engine became available in time.
+            EngineError: If a dead engine could not be respawned.
+        """
+        engine = self._checkout(timeout)
+        failed = True
+        try:
+            yield engine
+            failed = False
+        finally:
+            self._checkin(engine, failed)
+
+    def check(self) -> int:
+        """
+        Health-check idle engines and respawn dead ones.
+
+        Returns:
+            Number of engines respawned.
+        """
+        respawned = 0
+        for engine in self._drain():
+            if engine is None or not engine.is_connected:
+                engine = self._replace(engine)
+                respawned += engine is not None
+            self._idle.put(engine)
+        return respawned
+
+    # ==================== Internal ====================
+
+    def _spawn(self) -> EngineClient:
+        """Start one engine, past START and INFO configuration."""
+        engine = EngineClient(self._executable_path, **self._transport_kwargs)
+        try:
+            if not engine.start(self._board_size, timeout=self._start_timeout):
+                raise EngineError(f"Engine '{self._executable_path}' did not answer START")
+            if self._options:
+                engine.configure(**self._options)
+        except EngineError:
+            engine.disconnect()
+            raise
+        except Exception as e:
+            engine.disconnect()
+            raise EngineError(f"Failed to start engine '{self._executable_path}': {e}") from e
+        return engine
+
+    def _replace(self, engine: Optional[EngineClient]) -> Optional[EngineClient]:
+        """Discard an engine and spawn a new one, or None if spawning fails."""
+        if engine is not None:
+            engine.disconnect()
+        try:
+            return self._spawn()
+        except EngineError:
+            return None
+
+    def _drain(self) -> list[Optional[EngineClient]]:
+        """Remove and return all idle engines."""
+        engines = []
+        while True:
+            try:
+                engines.append(self._idle.get_nowait())
+            except queue.Empty:
+                return engines
+
+    def _checkout(self, timeout: Optional[float]) -> EngineClient:
+        """Take an idle engine, respawning it if its process died."""
+        self.start()
+
+        try:
+            engine = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No engine available within {timeout}s") from None
+
+        if engine is not None and engine.is_connected:
+            return engine
+
+        if engine is not None:
+            engine.disconnect()
+        try:
+            return self._spawn()
+        except EngineError:
+            self._idle.put(None)  # Keep the slot for a later attempt
+            raise
+
+    def _checkin(self, engine: EngineClient, failed: bool) -> None:
+        """Reset a returned engine and put it back in the pool."""
+        if self._closed:
+            engine.quit()
+            return
+
+        if engine.is_connected:
+            if failed:
+                engine.stop()
+            engine.router.clear_all()
+            if engine.restart(timeout=self._reset_timeout):
+                engine.router.clear_all()
+                self._idle.put(engine)
+                return
+
+        self._idle.put(self._replace(engine))
+
+    # ==================== Context Manager ====================
+
+    def __enter__(self) -> "EnginePool":
+        """Context manager entry; starts all engines."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
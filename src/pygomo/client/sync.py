@@ -0,0 +1,193 @@
+"""
+Incremental position sync.
+
+This module provides PositionTracker, which follows the stones an
+engine holds, and whose they are, from the commands sent to it, and
+plans the shortest TAKEBACK / TURN sequence to move the engine to
+another position.
+Falling back to BOARD only when a position cannot be reached move
+by move keeps the engine's search state (hash table) warm while
+browsing a game tree.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from pygomo.command.interface import CommandContext, CommandResult
+from pygomo.protocol.models import BoardPosition, Move
+
+
+# Commands that never change the engine's board
+_PRESERVING = frozenset({"INFO", "ABOUT", "STOP", "YXSTOP", "YXNBEST"})
+
+
+@dataclass(frozen=True)
+class SyncStep:
+    """One command of a sync plan: TAKEBACK, TURN, BEGIN, BOARD or YXBOARD."""
+    command: str
+    move: Optional[Move] = None
+
+
+class PositionTracker:
+    """
+    Tracks the stones an engine holds, and which side owns each.
+
+    Positions are move sequences in playing order, first move black,
+    searched by the side to move (see `to_position`). The tracker is
+    updated with every command an EngineClient executes (see
+    `observe`): START and RESTART clear the board, BEGIN and TURN add
+    the opponent's move and the engine's reply, TAKEBACK removes the
+    last stone and BOARD / YXBOARD replace the stones. Anything it
+    cannot follow (a failed or timed out search, a custom command,
+    raw input) makes the position unknown until the next full sync.
+
+    Example::
+
+        tracker = PositionTracker()
+        tracker.observe(context, result)  # Done by EngineClient
+        for step in tracker.plan(target, think=True):
+            ...
+    """
+
+    def __init__(self):
+        # (move, BoardPosition.SELF / OPPONENT / WALL) in the order placed
+        self._stones: Optional[list[tuple[Move, int]]] = None
+
+    @property
+    def moves(self) -> Optional[tuple[Move, ...]]:
+        """Moves the engine holds, or None if unknown."""
+        return tuple(move for move, _ in self._stones) if self._stones is not None else None
+
+    @property
+    def position(self) -> Optional[BoardPosition]:
+        """Stones the engine holds with their owners, or None if unknown."""
+        return BoardPosition(moves=list(self._stones)) if self._stones is not None else None
+
+    @property
+    def is_known(self) -> bool:
+        return self._stones is not None
+
+    def invalidate(self) -> None:
+        """Forget the engine's position."""
+        self._stones = None
+
+    # ==================== Following ====================
+
+    def observe(self, context: CommandContext, result: CommandResult) -> None:
+        """Update the position after a command has been executed."""
+        command = context.command.upper()
+        if command in _PRESERVING:
+            return
+
+        if not result.is_success:
+            self._stones = None
+        elif command in ("START", "RESTART"):
+            self._stones = []
+        elif command == "BEGIN":
+            self._stones = [(result.data.move, BoardPosition.SELF)]
+        elif command == "TURN":
+            self._stones = self._extend(
+                (_as_move(context.args[0]), BoardPosition.OPPONENT),
+                (result.data.move, BoardPosition.SELF),
+            )
+        elif command == "TAKEBACK":
+            move = _as_move(context.args[0])
+            if self._stones and self._stones[-1][0] == move:
+                self._stones.pop()
+            else:
+                self._stones = None
+        elif command in ("BOARD", "YXBOARD"):
+            position = context.kwargs.get("position")
+            self._stones = list(position.moves) if position is not None else None
+            if self._stones is not None and result.data is not None:
+                self._stones.append((result.data.move, BoardPosition.SELF))
+        else:
+            self._stones = None
+
+    def _extend(self, *stones: tuple[Move, int]) -> Optional[list[tuple[Move, int]]]:
+        if self._stones is None:
+            return None
+        return self._stones + list(stones)
+
+    # ==================== Planning ====================
+
+    def plan(self, target: Sequence[Move], think: bool = True) -> list[SyncStep]:
+        """
+        Commands that bring the engine to a position.
+
+        Stones the engine holds beyond the common prefix with `target`
+        are taken back, last first. A held stone only counts as common
+        if it is owned by the same side as in `to_position(target)`,
+        so a position where the engine would play the other color is
+        never reached by TAKEBACK. With `think`, the last target move
+        is then (re)played with TURN, or the engine moves with BEGIN on
+        an empty board; without it, nothing more is sent. BOARD or
+        YXBOARD is used only when the position is unknown or more than
+        one stone must be added.
+
+        Args:
+            target: Moves of the position, in playing order.
+            think: Whether the engine should search the position.
+        """
+        held = self._stones
+        full = [SyncStep("BOARD" if think else "YXBOARD")]
+        if held is None:
+            return full
+
+        common = 0
+        for ours, theirs in zip(held, self.to_position(target).moves):
+            if ours != theirs:
+                break
+            common += 1
+
+        if think:
+            # TURN plays the last move; take it back too if it is held
+            keep = min(common, len(target) - 1) if target else 0
+            if len(target) - keep > 1:
+                return full
+        else:
+            if common < len(target):
+                return full
+            keep = common
+
+        steps = [SyncStep("TAKEBACK", move) for move, _ in reversed(held[keep:])]
+        if think:
+            steps.append(SyncStep("TURN", target[-1]) if target else SyncStep("BEGIN"))
+        return steps
+
+    # ==================== Conversion ====================
+
+    @staticmethod
+    def to_position(moves: Sequence[Move]) -> BoardPosition:
+        """BOARD position of a move sequence, for the side to move."""
+        position = BoardPosition()
+        to_move = len(moves) % 2
+        for index, move in enumerate(moves):
+            position.add_move(
+                move,
+                BoardPosition.SELF if index % 2 == to_move else BoardPosition.OPPONENT,
+            )
+        return position
+
+    @staticmethod
+    def to_moves(position: Optional[BoardPosition]) -> Optional[list[Move]]:
+        """
+        Move sequence of a BOARD position.
+
+        Returns:
+            The moves, or None unless the colors alternate as in a
+            game (the last stone being the opponent's).
+        """
+        if position is None:
+            return None
+        count = len(position.moves)
+        for index, (_, color) in enumerate(position.moves):
+            expected = BoardPosition.SELF if (count - index) % 2 == 0 else BoardPosition.OPPONENT
+            if color != expected:
+                return None
+        return [move for move, _ in position.moves]
+
+
+def _as_move(value) -> Move:
+    """Move from a command argument, as accepted by the handlers."""
+    return value if isinstance(value, Move) else Move(value)
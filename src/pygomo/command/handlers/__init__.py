@@ -3,7 +3,7 @@
 Built-in command handlers for Gomocup protocol.
 """
 
-from pygomo.command.handlers.base import BaseCommandHandler
+from pygomo.command.handlers.base import BaseCommandHandler, SearchInfoCollector, COLLECT_MODES
 from pygomo.command.handlers.lifecycle import (
     StartHandler,
     RestartHandler,
@@ -24,6 +24,8 @@ from pygomo.command.handlers.search import (
 
 __all__ = [
     "BaseCommandHandler",
+    "SearchInfoCollector",
+    "COLLECT_MODES",
     # Lifecycle
     "StartHandler",
     "RestartHandler",
@@ -5,14 +5,166 @@ This module provides a base class for command handlers
 with common functionality.
 """
 
+import time
 from abc import abstractmethod
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from pygomo.command.interface import (
     ICommandHandler,
     CommandContext,
     CommandResult,
 )
+from pygomo.protocol.interface import IProtocol
+from pygomo.protocol.models import LazySearchInfo, Move, PlayResult, SearchInfo
+
+
+# Valid values for the `collect` option of thinking commands
+COLLECT_MODES = ("last", "per_depth", "all")
+
+
+class SearchInfoCollector:
+    """
+    Collects the search info of one thinking command.
+    
+    How much history is kept depends on the mode:
+    
+    - ``"all"``: every info, in order (PlayResult.all_info as before).
+    - ``"per_depth"``: the latest info per (multipv, depth).
+    - ``"last"``: the latest info per multipv index only.
+    
+    Every line is stored as a LazySearchInfo. Lines are parsed to
+    plain fields when their key is needed ("per_depth", "last") or
+    an on_info callback is set, and in "all" mode only when the
+    history is read; Evaluate and PV Move objects are built only for
+    the infos whose `eval` / `pv` are actually read.
+    
+    Example:
+        collector = SearchInfoCollector(protocol, "last")
+        for line in router.get_all("message"):
+            collector.add(line)
+        result = collector.play_result(coord)
+    """
+    
+    def __init__(
+        self,
+        protocol: IProtocol,
+        mode: str = "all",
+        on_info: Optional[Callable[[SearchInfo], None]] = None,
+    ):
+        """
+        Args:
+            protocol: Protocol used to parse MESSAGE lines.
+            mode: One of "last", "per_depth", "all".
+            on_info: Optional callback, called with every parsed info;
+                exceptions it raises are ignored.
+            
+        Raises:
+            ValueError: If mode is unknown.
+        """
+        self._protocol = protocol
+        self._mode = self.check_mode(mode)
+        self._on_info = on_info
+        
+        self._entries: dict[Any, LazySearchInfo] = {}
+        self._last_key: Any = None
+        self._count = 0
+    
+    @staticmethod
+    def check_mode(mode: str) -> str:
+        """
+        Validate a collect mode.
+        
+        Raises:
+            ValueError: If mode is unknown.
+        """
+        if mode not in COLLECT_MODES:
+            raise ValueError(f"Unknown collect mode '{mode}'. Valid: {', '.join(COLLECT_MODES)}")
+        return mode
+    
+    @property
+    def mode(self) -> str:
+        return self._mode
+    
+    def add(self, line: str) -> None:
+        """Add one MESSAGE line; malformed lines are skipped."""
+        info = LazySearchInfo(line, self._protocol.parse_message)
+        
+        if self._mode == "all":
+            key: Any = self._count
+            if self._on_info is not None and not self._parses(info):
+                return
+        else:
+            if not self._parses(info):
+                return
+            key = info.multipv if self._mode == "last" else (info.multipv, info.depth)
+        
+        self._entries[key] = info
+        self._last_key = key
+        self._count += 1
+        
+        if self._on_info is not None:
+            try:
+                self._on_info(info)
+            except Exception:
+                pass  # A failing callback must not abort the search
+    
+    @staticmethod
+    def _parses(info: LazySearchInfo) -> bool:
+        """Parse the fields of an info; False if the line is malformed."""
+        try:
+            info.parsed
+        except Exception:
+            return False
+        return True
+    
+    def _info(self, key: Any) -> Optional[LazySearchInfo]:
+        """Return the info stored under key, dropping it if malformed."""
+        info = self._entries[key]
+        if not self._parses(info):
+            del self._entries[key]
+            return None
+        return info
+    
+    @property
+    def latest(self) -> Optional[SearchInfo]:
+        """The info of the most recent valid line, or None."""
+        if self._last_key in self._entries:
+            info = self._info(self._last_key)
+            if info is not None:
+                return info
+        
+        # Unparsed "all" entries: fall back to the last one that parses
+        for key in reversed(list(self._entries)):
+            info = self._info(key)
+            if info is not None:
+                return info
+        return None
+    
+    @property
+    def history(self) -> list[SearchInfo]:
+        """
+        Kept infos: in arrival order, by first appearance of each
+        (multipv, depth) in "per_depth" mode, by multipv in "last" mode.
+        """
+        keys = list(self._entries)
+        if self._mode == "last":
+            keys.sort()
+        infos = (self._info(key) for key in keys)
+        return [info for info in infos if info is not None]
+    
+    @property
+    def count(self) -> int:
+        """Number of lines added, including coalesced ones."""
+        return self._count
+    
+    def play_result(self, coord: str) -> PlayResult:
+        """Build the PlayResult for a coordinate reply."""
+        history = self.history
+        return PlayResult(
+            move=Move.parse(coord),
+            search_info=self.latest,
+            all_info=history,
+        )
 
 
 class BaseCommandHandler(ICommandHandler):
@@ -97,27 +249,89 @@ class BaseCommandHandler(ICommandHandler):
         
         return context.protocol.parse_coord(response)
     
+    def search_info_collector(self, context: CommandContext) -> SearchInfoCollector:
+        """
+        Create the collector for a thinking command.
+        
+        The mode comes from the `collect` keyword argument
+        ("last", "per_depth" or "all", default "all").
+        """
+        return SearchInfoCollector(
+            context.protocol,
+            context.kwargs.get("collect") or "all",
+            context.on_info,
+        )
+    
+    def wait_for_coord(
+        self,
+        context: CommandContext,
+        timeout: float,
+        collector: Optional[SearchInfoCollector] = None,
+    ) -> str:
+        """
+        Wait for a coordinate response while dispatching search info.
+        
+        Sleeps on the router until a coord or MESSAGE line arrives, so
+        each search info reaches on_info as soon as it is read. Info
+        printed before the coordinate is dispatched before returning.
+        
+        Args:
+            context: Execution context.
+            timeout: Timeout in seconds.
+            collector: Optional collector for the search info.
+            
+        Returns:
+            The coordinate line, or empty string on timeout or if the
+            engine output closed.
+        """
+        router = context.router
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            channel = router.wait_any(
+                ("coord", "message"),
+                timeout=deadline - time.monotonic(),
+            )
+            
+            if channel == "coord":
+                coord = router.get("coord")
+                self.collect_search_info(context, collector)
+                return coord
+            
+            if channel is None:
+                return ""
+            
+            self.collect_search_info(context, collector)
+    
+    def coord_failure(self, context: CommandContext) -> CommandResult:
+        """Result for a wait_for_coord() that got no coordinate."""
+        if context.router.is_closed:
+            return CommandResult.error("Engine output closed")
+        return CommandResult.timeout()
+    
     def collect_search_info(
         self,
         context: CommandContext,
+        collector: Optional[SearchInfoCollector] = None,
     ) -> None:
         """
         Collect and dispatch search info messages.
         
-        Polls message channel and invokes on_info callback.
+        Drains the message channel without blocking and feeds each
+        line to the collector, which invokes the on_info callback.
+        Without a collector, lines are only parsed for on_info.
         
         Args:
             context: Execution context.
+            collector: Optional collector for the search info.
         """
-        if not context.on_info:
-            return
-        
         # Get all available messages without blocking
         messages = context.router.get_all("message")
         
+        if collector is None:
+            if not context.on_info:
+                return
+            collector = SearchInfoCollector(context.protocol, "last", context.on_info)
+        
         for msg in messages:
-            try:
-                info = context.protocol.parse_search_info(msg)
-                context.on_info(info)
-            except Exception:
-                pass  # Skip malformed messages
+            collector.add(msg)
@@ -33,13 +33,10 @@ class InfoHandler(BaseCommandHandler):
             self.send_command(context, key, value)
         elif context.kwargs:
             # Support dict-style: INFO(timeout_turn=5000)
-            for key, value in context.kwargs.items():
-                cmd_str = context.protocol.serialize_command(
-                    "INFO",
-                    key.upper(),
-                    value,
-                )
-                context.transport.send(cmd_str)
+            context.transport.send_many(
+                context.protocol.serialize_command("INFO", key.upper(), value)
+                for key, value in context.kwargs.items()
+            )
         else:
             return CommandResult.error("INFO requires key and value")
         
@@ -5,12 +5,9 @@ Handlers for game-related commands:
 TURN, BEGIN, BOARD, TAKEBACK
 """
 
-import time
-from typing import Optional, Callable
-
 from pygomo.command.interface import CommandContext, CommandResult
 from pygomo.command.handlers.base import BaseCommandHandler
-from pygomo.protocol.models import Move, PlayResult, SearchInfo
+from pygomo.protocol.models import Move
 
 
 class TurnHandler(BaseCommandHandler):
@@ -44,63 +41,15 @@ class TurnHandler(BaseCommandHandler):
         else:
             return CommandResult.error(f"Invalid move: {move_arg}")
         
-        # Send command
-        self.send_command(context, move.to_numeric())
-        
         # Collect search info while waiting
-        all_info: list[SearchInfo] = []
-        last_info: Optional[SearchInfo] = None
-        
-        timeout = context.timeout or 60.0
-        start_time = time.time()
+        collector = self.search_info_collector(context)
+        self.send_command(context, move.to_numeric())
         
-        while True:
-            elapsed = time.time() - start_time
-            remaining = timeout - elapsed
-            
-            if remaining <= 0:
-                return CommandResult.timeout()
-            
-            # Check for final move
-            coord = context.router.get("coord", timeout=min(0.1, remaining))
-            
-            if coord:
-                # Got the result
-                result_move = Move(coord)
-                
-                # Collect any remaining messages
-                self._collect_all_info(context, all_info)
-                if all_info:
-                    last_info = all_info[-1]
-                
-                play_result = PlayResult(
-                    move=result_move,
-                    search_info=last_info,
-                    all_info=all_info,
-                )
-                
-                return CommandResult.success(play_result)
-            
-            # Collect search info
-            self._collect_all_info(context, all_info, context.on_info)
-    
-    def _collect_all_info(
-        self,
-        context: CommandContext,
-        all_info: list[SearchInfo],
-        callback: Optional[Callable[[SearchInfo], None]] = None,
-    ) -> None:
-        """Collect all available search info messages."""
-        messages = context.router.get_all("message")
+        coord = self.wait_for_coord(context, context.timeout or 60.0, collector)
+        if not coord:
+            return self.coord_failure(context)
         
-        for msg in messages:
-            try:
-                info = context.protocol.parse_search_info(msg)
-                all_info.append(info)
-                if callback:
-                    callback(info)
-            except Exception:
-                pass
+        return CommandResult.success(collector.play_result(coord))
 
 
 class BeginHandler(BaseCommandHandler):
@@ -119,59 +68,15 @@ class BeginHandler(BaseCommandHandler):
         return True
     
     def execute(self, context: CommandContext) -> CommandResult:
-        self.send_command(context)
-        
         # Similar to TURN, collect info while waiting
-        all_info: list[SearchInfo] = []
-        last_info: Optional[SearchInfo] = None
+        collector = self.search_info_collector(context)
+        self.send_command(context)
         
-        timeout = context.timeout or 60.0
-        start_time = time.time()
+        coord = self.wait_for_coord(context, context.timeout or 60.0, collector)
+        if not coord:
+            return self.coord_failure(context)
         
-        while True:
-            elapsed = time.time() - start_time
-            remaining = timeout - elapsed
-            
-            if remaining <= 0:
-                return CommandResult.timeout()
-            
-            coord = context.router.get("coord", timeout=min(0.1, remaining))
-            
-            if coord:
-                result_move = Move(coord)
-                
-                # Collect remaining messages
-                messages = context.router.get_all("message")
-                for msg in messages:
-                    try:
-                        info = context.protocol.parse_search_info(msg)
-                        all_info.append(info)
-                        if context.on_info:
-                            context.on_info(info)
-                    except Exception:
-                        pass
-                
-                if all_info:
-                    last_info = all_info[-1]
-                
-                play_result = PlayResult(
-                    move=result_move,
-                    search_info=last_info,
-                    all_info=all_info,
-                )
-                
-                return CommandResult.success(play_result)
-            
-            # Collect search info
-            messages = context.router.get_all("message")
-            for msg in messages:
-                try:
-                    info = context.protocol.parse_search_info(msg)
-                    all_info.append(info)
-                    if context.on_info:
-                        context.on_info(info)
-                except Exception:
-                    pass
+        return CommandResult.success(collector.play_result(coord))
 
 
 class BoardHandler(BaseCommandHandler):
@@ -201,61 +106,22 @@ class BoardHandler(BaseCommandHandler):
         if not position:
             return CommandResult.error("No position provided")
         
-        # Send BOARD or YXBOARD
-        cmd = "BOARD" if start_thinking else "YXBOARD"
-        context.transport.send(cmd)
+        collector = self.search_info_collector(context)
         
-        # Send position lines
-        position_str = position.to_protocol_string()
-        for line in position_str.split("\n"):
-            context.transport.send(line)
+        # Send BOARD or YXBOARD and the position lines in one write
+        cmd = "BOARD" if start_thinking else "YXBOARD"
+        lines = position.to_protocol_string().split("\n")
+        context.transport.send_many([cmd] + lines)
         
         if not start_thinking:
             return CommandResult.success()
         
         # Wait for response like TURN
-        all_info: list[SearchInfo] = []
-        timeout = context.timeout or 60.0
-        start_time = time.time()
+        coord = self.wait_for_coord(context, context.timeout or 60.0, collector)
+        if not coord:
+            return self.coord_failure(context)
         
-        while True:
-            elapsed = time.time() - start_time
-            remaining = timeout - elapsed
-            
-            if remaining <= 0:
-                return CommandResult.timeout()
-            
-            coord = context.router.get("coord", timeout=min(0.1, remaining))
-            
-            if coord:
-                result_move = Move(coord)
-                
-                messages = context.router.get_all("message")
-                for msg in messages:
-                    try:
-                        info = context.protocol.parse_search_info(msg)
-                        all_info.append(info)
-                    except Exception:
-                        pass
-                
-                play_result = PlayResult(
-                    move=result_move,
-                    search_info=all_info[-1] if all_info else None,
-                    all_info=all_info,
-                )
-                
-                return CommandResult.success(play_result)
-            
-            # Collect info
-            messages = context.router.get_all("message")
-            for msg in messages:
-                try:
-                    info = context.protocol.parse_search_info(msg)
-                    all_info.append(info)
-                    if context.on_info:
-                        context.on_info(info)
-                except Exception:
-                    pass
+        return CommandResult.success(collector.play_result(coord))
 
 
 class TakebackHandler(BaseCommandHandler):
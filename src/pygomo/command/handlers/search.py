@@ -5,12 +5,9 @@ Handlers for search-related commands:
 STOP, YXNBEST, YXBALANCEONE, YXBALANCETWO
 """
 
-import time
-from typing import Optional
-
 from pygomo.command.interface import CommandContext, CommandResult
 from pygomo.command.handlers.base import BaseCommandHandler
-from pygomo.protocol.models import Move, PlayResult, SearchInfo
+from pygomo.protocol.models import Move, PlayResult
 
 
 class StopHandler(BaseCommandHandler):
@@ -52,54 +49,15 @@ class NBestHandler(BaseCommandHandler):
     def execute(self, context: CommandContext) -> CommandResult:
         count = context.args[0] if context.args else 1
         
+        # Wait for coordinate response
+        collector = self.search_info_collector(context)
         self.send_command(context, count)
         
-        # Wait for coordinate response
-        all_info: list[SearchInfo] = []
-        timeout = context.timeout or 120.0
-        start_time = time.time()
+        coord = self.wait_for_coord(context, context.timeout or 120.0, collector)
+        if not coord:
+            return self.coord_failure(context)
         
-        while True:
-            elapsed = time.time() - start_time
-            remaining = timeout - elapsed
-            
-            if remaining <= 0:
-                return CommandResult.timeout()
-            
-            coord = context.router.get("coord", timeout=min(0.1, remaining))
-            
-            if coord:
-                result_move = Move(coord)
-                
-                # Collect remaining messages
-                messages = context.router.get_all("message")
-                for msg in messages:
-                    try:
-                        info = context.protocol.parse_search_info(msg)
-                        all_info.append(info)
-                        if context.on_info:
-                            context.on_info(info)
-                    except Exception:
-                        pass
-                
-                play_result = PlayResult(
-                    move=result_move,
-                    search_info=all_info[-1] if all_info else None,
-                    all_info=all_info,
-                )
-                
-                return CommandResult.success(play_result)
-            
-            # Collect search info
-            messages = context.router.get_all("message")
-            for msg in messages:
-                try:
-                    info = context.protocol.parse_search_info(msg)
-                    all_info.append(info)
-                    if context.on_info:
-                        context.on_info(info)
-                except Exception:
-                    pass
+        return CommandResult.success(collector.play_result(coord))
 
 
 class BalanceOneHandler(BaseCommandHandler):
@@ -123,31 +81,11 @@ class BalanceOneHandler(BaseCommandHandler):
         self.send_command(context, bias)
         
         # Similar to TURN
-        timeout = context.timeout or 120.0
-        start_time = time.time()
+        coord = self.wait_for_coord(context, context.timeout or 120.0)
+        if not coord:
+            return self.coord_failure(context)
         
-        while True:
-            elapsed = time.time() - start_time
-            remaining = timeout - elapsed
-            
-            if remaining <= 0:
-                return CommandResult.timeout()
-            
-            coord = context.router.get("coord", timeout=min(0.1, remaining))
-            
-            if coord:
-                result_move = Move(coord)
-                return CommandResult.success(PlayResult(move=result_move))
-            
-            # Collect info if callback provided
-            if context.on_info:
-                messages = context.router.get_all("message")
-                for msg in messages:
-                    try:
-                        info = context.protocol.parse_search_info(msg)
-                        context.on_info(info)
-                    except Exception:
-                        pass
+        return CommandResult.success(PlayResult(move=Move.parse(coord)))
 
 
 class BalanceTwoHandler(BaseCommandHandler):
@@ -169,29 +107,10 @@ class BalanceTwoHandler(BaseCommandHandler):
         
         self.send_command(context, bias)
         
-        timeout = context.timeout or 120.0
-        start_time = time.time()
+        coord = self.wait_for_coord(context, context.timeout or 120.0)
+        if not coord:
+            return self.coord_failure(context)
         
-        while True:
-            elapsed = time.time() - start_time
-            remaining = timeout - elapsed
-            
-            if remaining <= 0:
-                return CommandResult.timeout()
-            
-            coord = context.router.get("coord", timeout=min(0.1, remaining))
-            
-            if coord:
-                # BALANCE_TWO returns two moves
-                coords = coord.split()
-                moves = [Move(c) for c in coords]
-                return CommandResult.success({"moves": moves})
-            
-            if context.on_info:
-                messages = context.router.get_all("message")
-                for msg in messages:
-                    try:
-                        info = context.protocol.parse_search_info(msg)
-                        context.on_info(info)
-                    except Exception:
-                        pass
+        # BALANCE_TWO returns two moves
+        moves = [Move.parse(c) for c in coord.split()]
+        return CommandResult.success({"moves": moves})
@@ -0,0 +1,47 @@
+# PyGomo Match Layer
+"""
+Engine-vs-engine matches.
+
+Plays games between two engine configs on a pool of worker
+processes, with openings, color alternation, time control and
+board-library adjudication, and stops matches early with an SPRT.
+
+Example:
+    from pygomo.match import EngineConfig, MatchRunner
+
+    runner = MatchRunner(EngineConfig("./new"), EngineConfig("./base"),
+                         games=100, concurrency=8)
+    for result in runner.run():
+        print(result, runner.score)
+"""
+
+from pygomo.match.models import (
+    EngineConfig,
+    TimeControl,
+    Opening,
+    GameResult,
+    MatchScore,
+    RULE_FREESTYLE,
+    RULE_STANDARD,
+    RULE_RENJU,
+)
+from pygomo.match.game import play_game, new_board
+from pygomo.match.runner import MatchRunner
+from pygomo.match.sprt import SPRT, H0, H1
+
+__all__ = [
+    "EngineConfig",
+    "TimeControl",
+    "Opening",
+    "GameResult",
+    "MatchScore",
+    "RULE_FREESTYLE",
+    "RULE_STANDARD",
+    "RULE_RENJU",
+    "play_game",
+    "new_board",
+    "MatchRunner",
+    "SPRT",
+    "H0",
+    "H1",
+]
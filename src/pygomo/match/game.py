@@ -0,0 +1,202 @@
+"""
+Single engine-vs-engine game.
+
+This module plays one game between two connected EngineClients
+and adjudicates it with the board library: five in a row, Renju
+forbidden moves, illegal moves, time forfeits and crashes.
+"""
+
+import time
+from typing import Callable, Optional
+
+from pygomo.board import BitBoard, RenjuBitBoard, BLACK, WHITE, EMPTY
+from pygomo.client.engine import EngineClient
+from pygomo.exceptions import EngineError
+from pygomo.protocol.models import BoardPosition, Move, PlayResult
+from pygomo.match.models import (
+    GameResult,
+    Opening,
+    TimeControl,
+    RULE_FREESTYLE,
+    RULE_STANDARD,
+    RULE_RENJU,
+)
+
+
+class _ExactFiveBoard(BitBoard):
+    """BitBoard where only exactly five wins, for both colors (standard rule)."""
+
+    def _exact_five(self, color: int) -> bool:
+        return True
+
+
+def new_board(rule: int = RULE_FREESTYLE, board_size: int = 15) -> BitBoard:
+    """
+    Create the adjudication board for a Gomocup rule.
+
+    Args:
+        rule: INFO RULE value (0 freestyle, 1 standard, 4 renju).
+        board_size: Board size.
+    """
+    if rule & RULE_RENJU:
+        return RenjuBitBoard(_size=board_size)
+    if rule & RULE_STANDARD:
+        return _ExactFiveBoard(_size=board_size)
+    return BitBoard(_size=board_size)
+
+
+def play_game(
+    black: EngineClient,
+    white: EngineClient,
+    opening: Optional[Opening] = None,
+    rule: int = RULE_FREESTYLE,
+    board_size: int = 15,
+    time_control: Optional[TimeControl] = None,
+    max_moves: Optional[int] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> Optional[GameResult]:
+    """
+    Play one game between two connected engines.
+
+    Both engines are (re)started with START or RESTART and get the
+    rule and time control over INFO. Each engine receives BEGIN or
+    BOARD for its first move and TURN afterwards. With a match clock,
+    INFO TIME_LEFT is sent before every move.
+
+    An engine whose move times out is disconnected, since it may
+    still be thinking; callers reconnect it before the next game.
+
+    Args:
+        black: Engine playing black.
+        white: Engine playing white.
+        opening: Stones placed before the engines move.
+        rule: INFO RULE value (0 freestyle, 1 standard, 4 renju).
+        board_size: Board size.
+        time_control: Time limits; None plays without limits.
+        max_moves: Adjudicate a draw after this many stones.
+        should_stop: Polled before every move; the game is abandoned
+            when it returns True.
+
+    Returns:
+        GameResult (game_id, opening and names left at their
+        defaults), or None if the game was abandoned.
+
+    Raises:
+        ValueError: If the opening is illegal (off the board, occupied
+            or forbidden) or already won.
+        EngineError: If an engine does not answer START.
+    """
+    time_control = time_control or TimeControl()
+    board = new_board(rule, board_size)
+    engines = {BLACK: black, WHITE: white}
+
+    for engine in engines.values():
+        if not _new_game(engine, board_size):
+            raise EngineError("Engine did not answer START")
+        engine.set_rule(rule)
+        engine.set_time(
+            turn_time_ms=time_control.turn_ms,
+            match_time_ms=time_control.match_ms,
+        )
+
+    for move in (opening.moves if opening else []):
+        # place() also refuses a forbidden black stone under Renju
+        if not board.place(move):
+            raise ValueError(f"Illegal opening move {move}")
+        if board.check_win(move):
+            raise ValueError(f"Opening is already won at {move}")
+
+    clocks: dict[int, Optional[float]] = {
+        BLACK: time_control.match_ms,
+        WHITE: time_control.match_ms,
+    }
+    synced = {BLACK: False, WHITE: False}
+
+    while True:
+        if should_stop is not None and should_stop():
+            return None
+
+        color = board.current_player
+        opponent = WHITE if color == BLACK else BLACK
+        engine = engines[color]
+
+        if clocks[color] is not None:
+            engine.set_time(time_left_ms=max(int(clocks[color]), 0))
+
+        started = time.monotonic()
+        result = _request_move(
+            engine, board, color, synced[color],
+            time_control.move_timeout(clocks[color]),
+        )
+        elapsed = (time.monotonic() - started) * 1000
+        synced[color] = True
+
+        if result is None:
+            if not engine.is_connected:
+                return _finish(board, opponent, "crash")
+            engine.disconnect()
+            return _finish(board, opponent, "time")
+
+        if clocks[color] is not None:
+            clocks[color] -= elapsed
+            if clocks[color] < -time_control.margin_ms:
+                return _finish(board, opponent, "time")
+            clocks[color] += time_control.increment_ms
+        if time_control.turn_ms is not None and elapsed > time_control.turn_ms + time_control.margin_ms:
+            return _finish(board, opponent, "time")
+
+        move = result.move
+        if not board.is_valid(move) or not board.is_empty(move):
+            return _finish(board, opponent, "illegal", move)
+        if color == BLACK and isinstance(board, RenjuBitBoard) and board.is_forbidden(move):
+            return _finish(board, opponent, "forbidden", move)
+
+        board.place(move)
+        if board.check_win(move):
+            return _finish(board, color, "five")
+        if board.is_full():
+            return _finish(board, EMPTY, "full")
+        if max_moves is not None and board.move_count >= max_moves:
+            return _finish(board, EMPTY, "max_moves")
+
+
+def _new_game(engine: EngineClient, board_size: int) -> bool:
+    """Reset an engine for a new game, with START when needed."""
+    if engine.is_started and engine.restart():
+        return True
+    return engine.start(board_size)
+
+
+def _request_move(
+    engine: EngineClient,
+    board: BitBoard,
+    color: int,
+    synced: bool,
+    timeout: Optional[float],
+) -> Optional[PlayResult]:
+    """Ask an engine for its move: TURN once it knows the game, else BEGIN/BOARD."""
+    if synced:
+        return engine.turn(board.last_move, timeout=timeout, collect="last")
+    if board.move_count == 0:
+        return engine.begin(timeout=timeout, collect="last")
+
+    position = BoardPosition()
+    for index, move in enumerate(board.get_move_history()):
+        stone = BLACK if index % 2 == 0 else WHITE
+        position.add_move(
+            move, BoardPosition.SELF if stone == color else BoardPosition.OPPONENT,
+        )
+    return engine.board(position, timeout=timeout, collect="last")
+
+
+def _finish(
+    board: BitBoard,
+    winner: int,
+    reason: str,
+    last: Optional[Move] = None,
+) -> GameResult:
+    """Build the result; `last` is a rejected move to record."""
+    moves = board.get_move_history()
+    if last is not None:
+        moves.append(last)
+    return GameResult(winner=winner, reason=reason, moves=moves)
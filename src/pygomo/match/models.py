@@ -0,0 +1,179 @@
+"""
+Match data models.
+
+This module defines the configuration and result types of
+engine-vs-engine matches. All of them are plain dataclasses so
+they can be sent to and from match worker processes.
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Optional, Sequence, Union
+
+from pygomo.board.interface import BLACK, WHITE, EMPTY
+from pygomo.protocol.models import Move
+
+
+# Gomocup INFO RULE bits
+RULE_FREESTYLE = 0
+RULE_STANDARD = 1  # Exactly five wins
+RULE_RENJU = 4
+
+
+@dataclass
+class EngineConfig:
+    """
+    How to launch and configure one engine of a match.
+
+    Example:
+        config = EngineConfig("/path/to/rapfi", name="rapfi-dev",
+                              options={"thread_num": 1})
+    """
+    executable_path: str
+    name: Optional[str] = None
+    args: list[str] = field(default_factory=list)
+    options: dict[str, Any] = field(default_factory=dict)  # INFO options
+    working_directory: Optional[str] = None
+
+    def __post_init__(self):
+        if self.name is None:
+            self.name = os.path.basename(self.executable_path)
+
+
+@dataclass
+class TimeControl:
+    """
+    Match time control.
+
+    With `match_ms`, each engine has a clock: the time it used is
+    subtracted after every move, `increment_ms` is added back, and
+    INFO TIME_LEFT is sent before every move. With `turn_ms` alone,
+    every move must be played within `turn_ms`. `margin_ms` is the
+    lag tolerated on top of either limit before a game is lost on time.
+    """
+    turn_ms: Optional[int] = None
+    match_ms: Optional[int] = None
+    increment_ms: int = 0
+    margin_ms: int = 1000
+
+    def move_timeout(self, time_left_ms: Optional[float]) -> Optional[float]:
+        """Seconds to wait for one move, or None for no limit."""
+        limits = [
+            limit for limit in (self.turn_ms, time_left_ms) if limit is not None
+        ]
+        if not limits:
+            return None
+        return (min(limits) + self.margin_ms) / 1000
+
+
+@dataclass
+class Opening:
+    """
+    Stones placed before the engines take over, black first.
+
+    Example:
+        Opening.parse("h8 i9 h9")
+    """
+    moves: list[Move] = field(default_factory=list)
+
+    @classmethod
+    def parse(cls, text: Union[str, Sequence[Union[str, Move]]]) -> "Opening":
+        """
+        Parse an opening from space/comma-separated text or a move list.
+
+        Raises:
+            ValueError: If a move is not a valid coordinate.
+        """
+        if isinstance(text, str):
+            text = text.replace(",", " ").split()
+        return cls([
+            move if isinstance(move, Move) else Move.parse(move)
+            for move in text
+        ])
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+    def __str__(self) -> str:
+        return " ".join(str(move) for move in self.moves)
+
+
+@dataclass
+class GameResult:
+    """
+    Outcome of one game.
+
+    The first engine of the match is engine "A"; `first_is_black`
+    says which color it played. Games `2k` and `2k + 1` share an
+    opening with colors swapped.
+    """
+    winner: int  # BLACK, WHITE, or EMPTY for a draw
+    reason: str  # "five", "forbidden", "illegal", "time", "crash", "full", "max_moves"
+    moves: list[Move] = field(default_factory=list)
+    game_id: int = 0
+    opening: int = 0  # Index of the opening
+    first_is_black: bool = True
+    black: str = ""
+    white: str = ""
+
+    @property
+    def is_draw(self) -> bool:
+        return self.winner == EMPTY
+
+    @property
+    def first_won(self) -> bool:
+        """Whether the first engine won."""
+        return self.winner == (BLACK if self.first_is_black else WHITE)
+
+    @property
+    def score(self) -> float:
+        """Score of the first engine: 1, 0.5 or 0."""
+        if self.is_draw:
+            return 0.5
+        return 1.0 if self.first_won else 0.0
+
+    def __str__(self) -> str:
+        if self.is_draw:
+            outcome = "draw"
+        else:
+            outcome = f"{self.black if self.winner == BLACK else self.white} wins"
+        return f"Game {self.game_id}: {self.black} vs {self.white}, {outcome} ({self.reason})"
+
+
+@dataclass
+class MatchScore:
+    """
+    Running score of the first engine against the second.
+
+    Example:
+        score = MatchScore()
+        for result in runner.run():
+            score.add(result)
+            print(score)
+    """
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+
+    def add(self, result: GameResult) -> None:
+        """Count one game."""
+        if result.is_draw:
+            self.draws += 1
+        elif result.first_won:
+            self.wins += 1
+        else:
+            self.losses += 1
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.losses + self.draws
+
+    @property
+    def score(self) -> float:
+        """Score fraction of the first engine in [0, 1]."""
+        if not self.games:
+            return 0.5
+        return (self.wins + 0.5 * self.draws) / self.games
+
+    def __str__(self) -> str:
+        return f"+{self.wins} -{self.losses} ={self.draws} ({self.score * 100:.1f}%)"
@@ -0,0 +1,315 @@
+"""
+Parallel match runner.
+
+This module plays many engine-vs-engine games concurrently on a
+process pool. Every worker process owns one pair of EngineClients
+for its whole lifetime and plays the games it is given one after
+another, so engine startup is paid once per worker, not per game.
+"""
+
+import dataclasses
+import multiprocessing
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from multiprocessing.util import Finalize
+from typing import Callable, Iterator, Optional, Sequence, Union
+
+from pygomo.client.engine import EngineClient
+from pygomo.exceptions import EngineError
+from pygomo.match.game import play_game
+from pygomo.match.models import (
+    EngineConfig,
+    GameResult,
+    MatchScore,
+    Opening,
+    TimeControl,
+    RULE_FREESTYLE,
+)
+
+
+class MatchRunner:
+    """
+    Play a match between two engines on a pool of worker processes.
+
+    Games are played in pairs: games 2k and 2k + 1 use the same
+    opening (cycling through `openings`) with colors swapped. Up to
+    `concurrency` games run at once, each worker process owning one
+    engine of each config. Results are streamed by `run()` as games
+    finish, in completion order. A runner plays one match.
+
+    Example::
+
+        runner = MatchRunner(
+            EngineConfig("./rapfi-new"), EngineConfig("./rapfi-base"),
+            games=200, concurrency=16,
+            openings=["h8 h9", "h8 i9"], rule=RULE_RENJU,
+            time_control=TimeControl(match_ms=10000, increment_ms=100),
+        )
+        for result in runner.run():
+            print(result, runner.score)
+    """
+
+    def __init__(
+        self,
+        first: EngineConfig,
+        second: EngineConfig,
+        games: int,
+        concurrency: int = 2,
+        openings: Optional[Sequence[Union[Opening, str]]] = None,
+        rule: int = RULE_FREESTYLE,
+        board_size: int = 15,
+        time_control: Optional[TimeControl] = None,
+        max_moves: Optional[int] = None,
+        mp_context: Optional[multiprocessing.context.BaseContext] = None,
+    ):
+        """
+        Args:
+            first: Engine under test ("A"); scores are from its side.
+            second: Opponent engine ("B").
+            games: Number of games to play.
+            concurrency: Number of worker processes (concurrent games).
+            openings: Openings, as Opening or move text; None starts
+                every game from the empty board.
+            rule: INFO RULE value (0 freestyle, 1 standard, 4 renju).
+            board_size: Board size.
+            time_control: Time limits; None plays without limits.
+            max_moves: Adjudicate a draw after this many stones.
+            mp_context: multiprocessing context for the pool (e.g.
+                "spawn"); defaults to the platform default.
+        """
+        if games < 1:
+            raise ValueError("A match needs at least one game")
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+
+        self._first = first
+        self._second = second
+        self._games = games
+        self._concurrency = concurrency
+        self._openings = [
+            opening if isinstance(opening, Opening) else Opening.parse(opening)
+            for opening in (openings or [Opening()])
+        ]
+        self._rule = rule
+        self._board_size = board_size
+        self._time_control = time_control
+        self._max_moves = max_moves
+        self._mp_context = mp_context or multiprocessing.get_context()
+
+        self._results: list[GameResult] = []
+        self._score = MatchScore()
+        self._stopped = threading.Event()
+        self._stop_flag = self._mp_context.Event()
+
+    # ==================== Properties ====================
+
+    @property
+    def games(self) -> int:
+        """Number of games scheduled."""
+        return self._games
+
+    @property
+    def results(self) -> list[GameResult]:
+        """Results of the finished games, in completion order."""
+        return list(self._results)
+
+    @property
+    def score(self) -> MatchScore:
+        """Running score of the first engine."""
+        return self._score
+
+    @property
+    def is_stopped(self) -> bool:
+        """Whether stop() has been called."""
+        return self._stopped.is_set()
+
+    # ==================== Running ====================
+
+    def game(self, game_id: int) -> tuple[Opening, bool]:
+        """
+        Opening and color assignment of a game.
+
+        Returns:
+            (opening, first_is_black) for the game.
+        """
+        opening = self._openings[(game_id // 2) % len(self._openings)]
+        return opening, game_id % 2 == 0
+
+    def run(self) -> Iterator[GameResult]:
+        """
+        Play the match, yielding each result as its game finishes.
+
+        At most `concurrency` games are queued on the pool at a time,
+        so stop() (or leaving the loop) only waits for the games in
+        progress, which are abandoned at their next move.
+
+        Raises:
+            EngineError: If an engine fails to start in a worker.
+        """
+        executor = ProcessPoolExecutor(
+            max_workers=self._concurrency,
+            mp_context=self._mp_context,
+            initializer=_init_worker,
+            initargs=(self._first, self._second, self._stop_flag),
+        )
+        pending: set[Future] = set()
+        next_game = 0
+
+        try:
+            while True:
+                while (
+                    next_game < self._games
+                    and len(pending) < self._concurrency
+                    and not self.is_stopped
+                ):
+                    pending.add(executor.submit(_play, self._task(next_game)))
+                    next_game += 1
+
+                if not pending:
+                    return
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    if result is None:
+                        continue  # Abandoned by stop()
+                    self._results.append(result)
+                    self._score.add(result)
+                    yield result
+        finally:
+            self.stop()
+            executor.shutdown(wait=True)
+
+    def play(self, on_result: Optional[Callable[[GameResult], None]] = None) -> MatchScore:
+        """
+        Play the whole match.
+
+        Args:
+            on_result: Called with each result as its game finishes.
+
+        Returns:
+            Final score of the first engine.
+        """
+        for result in self.run():
+            if on_result is not None:
+                on_result(result)
+        return self._score
+
+    def stop(self) -> None:
+        """
+        Stop the match.
+
+        No new games are started and games in progress are abandoned
+        at their next move; run() returns once they have unwound.
+        Safe to call from another thread or an on_result callback.
+        """
+        self._stopped.set()
+        self._stop_flag.set()
+
+    def _task(self, game_id: int) -> "_GameTask":
+        opening, first_is_black = self.game(game_id)
+        return _GameTask(
+            game_id=game_id,
+            opening_index=(game_id // 2) % len(self._openings),
+            opening=opening,
+            first_is_black=first_is_black,
+            rule=self._rule,
+            board_size=self._board_size,
+            time_control=self._time_control,
+            max_moves=self._max_moves,
+        )
+
+
+@dataclasses.dataclass
+class _GameTask:
+    """One game, as sent to a worker process."""
+    game_id: int
+    opening_index: int
+    opening: Opening
+    first_is_black: bool
+    rule: int
+    board_size: int
+    time_control: Optional[TimeControl]
+    max_moves: Optional[int]
+
+
+# ==================== Worker Process ====================
+
+# Per-process state, set by _init_worker
+_configs: tuple[EngineConfig, ...] = ()
+_engines: list[Optional[EngineClient]] = []
+_stop_flag = None
+
+
+def _init_worker(first: EngineConfig, second: EngineConfig, stop_flag) -> None:
+    """Pool initializer: remember the configs; engines start lazily."""
+    global _configs, _engines, _stop_flag
+    _configs = (first, second)
+    _engines = [None, None]
+    _stop_flag = stop_flag
+    Finalize(None, _close_engines, exitpriority=10)
+
+
+def _close_engines() -> None:
+    for engine in _engines:
+        if engine is not None:
+            engine.quit()
+
+
+def _engine(index: int, board_size: int) -> EngineClient:
+    """The worker's engine for a config, (re)spawned if its process is gone."""
+    engine = _engines[index]
+    if engine is not None and engine.is_connected:
+        return engine
+
+    config = _configs[index]
+    engine = EngineClient(
+        config.executable_path,
+        args=config.args,
+        working_directory=config.working_directory,
+    )
+    try:
+        if not engine.start(board_size):
+            raise EngineError(f"Engine '{config.name}' did not answer START")
+        if config.options:
+            engine.configure(**config.options)
+    except EngineError:
+        engine.disconnect()
+        raise
+    except Exception as e:
+        engine.disconnect()
+        raise EngineError(f"Failed to start engine '{config.name}': {e}") from e
+    _engines[index] = engine
+    return engine
+
+
+def _play(task: _GameTask) -> Optional[GameResult]:
+    """Play one game in a worker process."""
+    if _stop_flag.is_set():
+        return None
+
+    first, second = _engine(0, task.board_size), _engine(1, task.board_size)
+    black, white = (first, second) if task.first_is_black else (second, first)
+    names = (_configs[0].name, _configs[1].name)
+
+    result = play_game(
+        black,
+        white,
+        task.opening,
+        rule=task.rule,
+        board_size=task.board_size,
+        time_control=task.time_control,
+        max_moves=task.max_moves,
+        should_stop=_stop_flag.is_set,
+    )
+    if result is None:
+        return None
+
+    return dataclasses.replace(
+        result,
+        game_id=task.game_id,
+        opening=task.opening_index,
+        first_is_black=task.first_is_black,
+        black=names[0] if task.first_is_black else names[1],
+        white=names[1] if task.first_is_black else names[0],
+    )
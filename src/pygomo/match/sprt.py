@@ -0,0 +1,254 @@
+"""
+Sequential probability ratio test for engine matches.
+
+This module implements the generalized SPRT used by engine testing
+frameworks: the log-likelihood ratio of "the first engine is elo1
+stronger" against "it is elo0 stronger" is updated as game results
+arrive, and the match stops as soon as it crosses either bound.
+"""
+
+import math
+from statistics import NormalDist
+from typing import Callable, Iterator, Optional, Protocol
+
+from pygomo.match.models import GameResult, MatchScore
+
+
+# Test outcomes
+H0 = "H0"  # Accept elo0: the change is not an improvement of elo1
+H1 = "H1"  # Accept elo1
+
+# Pair scores of the pentanomial model, as a fraction of 2 games
+_PAIR_SCORES = (0.0, 0.25, 0.5, 0.75, 1.0)
+_GAME_SCORES = (0.0, 0.5, 1.0)
+
+# Stand-in count for empty outcome categories
+_REGULARIZE = 1e-3
+
+
+class _Runner(Protocol):
+    def run(self) -> Iterator[GameResult]: ...
+    def stop(self) -> None: ...
+
+
+def expected_score(elo: float) -> float:
+    """Expected score of a side `elo` points stronger (logistic model)."""
+    return 1 / (1 + 10 ** (-elo / 400))
+
+
+def score_to_elo(score: float) -> float:
+    """Elo difference for an expected score; +/-inf at 1 and 0."""
+    if score <= 0:
+        return -math.inf
+    if score >= 1:
+        return math.inf
+    return -400 * math.log10(1 / score - 1)
+
+
+class SPRT:
+    """
+    Generalized SPRT on match results.
+
+    Tests H0: elo = elo0 against H1: elo = elo1 for the first engine,
+    with false positive rate `alpha` and false negative rate `beta`.
+    The log-likelihood ratio compares the maximum-likelihood outcome
+    distributions whose mean score is s0 and s1, the expected scores
+    under each hypothesis (multinomial GSPRT).
+
+    With `pentanomial=True` the samples are game pairs (games 2k and
+    2k + 1 of a MatchRunner share an opening with colors swapped),
+    scored 0, 0.5, 1, 1.5 or 2; this removes the opening bias from
+    the variance and needs fewer games. Results may arrive in any
+    order; a pair counts once both of its games are in.
+
+    Example::
+
+        sprt = SPRT(elo0=0, elo1=5)
+        status = sprt.run(runner, on_update=lambda s: print(s))
+        print(status, sprt.elo())
+    """
+
+    def __init__(
+        self,
+        elo0: float = 0.0,
+        elo1: float = 5.0,
+        alpha: float = 0.05,
+        beta: float = 0.05,
+        pentanomial: bool = True,
+    ):
+        """
+        Args:
+            elo0: Elo difference of the null hypothesis.
+            elo1: Elo difference of the alternative hypothesis.
+            alpha: Probability of accepting H1 when H0 holds.
+            beta: Probability of accepting H0 when H1 holds.
+            pentanomial: Use game-pair statistics instead of single games.
+        """
+        if elo0 >= elo1:
+            raise ValueError("elo0 must be below elo1")
+        if not (0 < alpha < 1 and 0 < beta < 1):
+            raise ValueError("alpha and beta must be in (0, 1)")
+
+        self.elo0 = elo0
+        self.elo1 = elo1
+        self.alpha = alpha
+        self.beta = beta
+        self.pentanomial = pentanomial
+
+        self._score = MatchScore()
+        self._pairs = [0] * 5  # Pair counts by number of half points
+        self._unpaired: dict[int, GameResult] = {}
+
+    # ==================== Results ====================
+
+    def add(self, result: GameResult) -> None:
+        """Count one game result."""
+        self._score.add(result)
+
+        pair = result.game_id // 2
+        other = self._unpaired.pop(pair, None)
+        if other is None:
+            self._unpaired[pair] = result
+        else:
+            self._pairs[int(2 * (result.score + other.score))] += 1
+
+    @property
+    def score(self) -> MatchScore:
+        """Win/loss/draw counts of the first engine."""
+        return self._score
+
+    @property
+    def pairs(self) -> tuple[int, ...]:
+        """Completed pair counts, from 0 to 2 points (pentanomial)."""
+        return tuple(self._pairs)
+
+    # ==================== Statistics ====================
+
+    @property
+    def bounds(self) -> tuple[float, float]:
+        """(lower, upper) LLR bounds: accept H0 below, H1 above."""
+        return (
+            math.log(self.beta / (1 - self.alpha)),
+            math.log((1 - self.beta) / self.alpha),
+        )
+
+    @property
+    def llr(self) -> float:
+        """Current log-likelihood ratio."""
+        counts, values = self._samples()
+        count = sum(counts)
+        if count == 0:
+            return 0.0
+
+        # Empty categories would make the sample look deterministic
+        counts = [c if c > 0 else _REGULARIZE for c in counts]
+        total = sum(counts)
+        freqs = [c / total for c in counts]
+
+        s0, s1 = expected_score(self.elo0), expected_score(self.elo1)
+        theta0 = _mle_multiplier(freqs, values, s0)
+        theta1 = _mle_multiplier(freqs, values, s1)
+        return count * sum(
+            f * math.log((1 + theta0 * (v - s0)) / (1 + theta1 * (v - s1)))
+            for f, v in zip(freqs, values)
+        )
+
+    @property
+    def status(self) -> Optional[str]:
+        """H0 or H1 once the LLR has crossed a bound, else None."""
+        lower, upper = self.bounds
+        llr = self.llr
+        if llr >= upper:
+            return H1
+        if llr <= lower:
+            return H0
+        return None
+
+    def elo(self, confidence: float = 0.95) -> tuple[float, float]:
+        """
+        Elo difference of the first engine and its error margin.
+
+        Args:
+            confidence: Two-sided confidence level of the margin.
+
+        Returns:
+            (elo, margin): the margin is the half-width of the
+            confidence interval in Elo (inf without enough games).
+        """
+        counts, values = self._samples()
+        count = sum(counts)
+        if count == 0:
+            return 0.0, math.inf
+
+        mean = sum(c * v for c, v in zip(counts, values)) / count
+        var = sum(c * (v - mean) ** 2 for c, v in zip(counts, values)) / count
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        spread = z * math.sqrt(var / count)
+        low, high = score_to_elo(mean - spread), score_to_elo(mean + spread)
+        return score_to_elo(mean), (high - low) / 2
+
+    def _samples(self) -> tuple[list[int], tuple[float, ...]]:
+        """Sample counts and their scores (as a fraction) for the chosen model."""
+        if self.pentanomial:
+            return list(self._pairs), _PAIR_SCORES
+        score = self._score
+        return [score.losses, score.draws, score.wins], _GAME_SCORES
+
+    # ==================== Driver ====================
+
+    def run(
+        self,
+        runner: _Runner,
+        on_update: Optional[Callable[["SPRT"], None]] = None,
+    ) -> Optional[str]:
+        """
+        Feed a match into the test until a bound is crossed.
+
+        Stops the runner as soon as the test concludes.
+
+        Args:
+            runner: MatchRunner (or anything with run() and stop()).
+            on_update: Called after every result, e.g. to print str(sprt).
+
+        Returns:
+            H0 or H1, or None if the match ended first.
+        """
+        for result in runner.run():
+            self.add(result)
+            if on_update is not None:
+                on_update(self)
+            if self.status is not None:
+                runner.stop()
+                break
+        return self.status
+
+    def __str__(self) -> str:
+        lower, upper = self.bounds
+        elo, margin = self.elo()
+        text = (
+            f"LLR {self.llr:.2f} [{lower:.2f}, {upper:.2f}] "
+            f"Elo {elo:.1f} +/- {margin:.1f} {self._score}"
+        )
+        if self.pentanomial:
+            text += f" pairs {list(self._pairs)}"
+        return text
+
+
+def _mle_multiplier(freqs: list[float], values: tuple[float, ...], mean: float) -> float:
+    """
+    Lagrange multiplier of the maximum-likelihood distribution with a given mean.
+
+    The distribution closest to `freqs` with expected value `mean`
+    is p_i = f_i / (1 + theta * (v_i - mean)); theta is found by
+    bisection on the (decreasing) mean constraint.
+    """
+    low = -1 / (max(values) - mean)
+    high = -1 / (min(values) - mean)
+    for _ in range(100):
+        theta = (low + high) / 2
+        excess = sum(f * (v - mean) / (1 + theta * (v - mean)) for f, v in zip(freqs, values))
+        if excess > 0:
+            low = theta
+        else:
+            high = theta
+    return (low + high) / 2
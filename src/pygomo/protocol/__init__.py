@@ -8,6 +8,7 @@ from pygomo.protocol.models import (
     Move,
     Evaluate,
     SearchInfo,
+    LazySearchInfo,
     PlayResult,
     BoardPosition,
 )
@@ -19,6 +20,7 @@ __all__ = [
     "Move",
     "Evaluate",
     "SearchInfo",
+    "LazySearchInfo",
     "PlayResult",
     "BoardPosition",
     "GomocupProtocol",
@@ -9,10 +9,10 @@ https://plastovicka.github.io/protocl2en.htm
 """
 
 import re
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from pygomo.protocol.interface import IProtocol, ResponseType
-from pygomo.protocol.models import Move, Evaluate, SearchInfo
+from pygomo.protocol.models import Move, Evaluate, SearchInfo, LazySearchInfo
 
 
 class GomocupProtocol(IProtocol):
@@ -54,6 +54,30 @@ class GomocupProtocol(IProtocol):
         "YXSHOWFORBID": ResponseType.TEXT,
     }
     
+    # Key/value MESSAGE fields: key -> (parse_message field, converter).
+    # "depth X-Y", "n" (node counts with K/M/G suffix) and "pv" are
+    # handled by _parse_fields itself
+    MESSAGE_FIELDS = {
+        "ev": ("eval", str),
+        "n/ms": ("nps", int),
+        "tm": ("time", int),
+        "multipv": ("multipv", int),
+        "seldepth": ("sel_depth", int),
+        "w": ("winrate", float),
+        "d": ("drawrate", float),
+    }
+    
+    # Node count suffixes
+    NODE_MULTIPLIERS = {
+        "K": 1_000,
+        "M": 1_000_000,
+        "G": 1_000_000_000,
+    }
+    
+    # Parser of the MESSAGE format seen last; set per instance, and each
+    # engine client has its own protocol instance
+    _message_format: Optional[Callable[[str], Optional[dict[str, Any]]]] = None
+    
     # UCI-like format patterns from Rapfi searchoutput.cpp
     # Format 1: depth 5-8 ev 123 n 1.5M n/ms 150 tm 1234 pv h8 i9
     # Format 2: depth 5-8 multipv 1 ev 123 n 1.5M n/ms 150 tm 1234 pv h8 i9
@@ -129,6 +153,12 @@ class GomocupProtocol(IProtocol):
         - UCILIKE MCTS: multipv X ev VAL w WR d DR stdev SD v V seldepth SD n N n/ms SPEED tm TIME prior P pv MOVES
         - NORMAL: Depth X-Y | Eval VAL | Time T | MOVES
         
+        Lines are tokenized in a single pass: key/value lines (UCILIKE)
+        by whitespace, column lines (NORMAL) by "|". The format that
+        matched last is tried first, since an engine keeps printing
+        the same one. Lines in neither format get a best-effort search
+        for eval, depth and PV.
+        
         Args:
             data: Raw MESSAGE line.
             
@@ -136,10 +166,28 @@ class GomocupProtocol(IProtocol):
             Dictionary with parsed fields.
         """
         # Remove MESSAGE prefix if present
-        if data.upper().startswith("MESSAGE"):
+        if data[:7].upper() == "MESSAGE":
             data = data[7:].strip()
         
-        result = {
+        cached = self._message_format
+        if cached is not None:
+            result = cached(data)
+            if result is not None:
+                return result
+        
+        for parser in (self._parse_fields, self._parse_columns):
+            if parser != cached:
+                result = parser(data)
+                if result is not None:
+                    self._message_format = parser
+                    return result
+        
+        return self._parse_fallback(data)
+    
+    @staticmethod
+    def _empty_message(data: str) -> dict[str, Any]:
+        """Default parse_message() fields."""
+        return {
             "depth": 0,
             "sel_depth": 0,
             "eval": "0",
@@ -152,115 +200,111 @@ class GomocupProtocol(IProtocol):
             "drawrate": None,
             "raw": data,
         }
+    
+    def _parse_fields(self, data: str) -> Optional[dict[str, Any]]:
+        """
+        Parse a key/value line (UCILIKE and MCTS formats).
         
-        # Try UCILIKE format with depth first
-        # Pattern: depth X-Y [multipv N] ev VAL n NODES n/ms SPEED tm TIME pv MOVES
-        uci_match = re.match(
-            r"depth\s+(\d+)-(\d+)\s+"
-            r"(?:multipv\s+(\d+)\s+)?"
-            r"ev\s+([+-]?\w*\d+)\s+"
-            r"n\s+([\d.]+[KMG]?)\s+"
-            r"n/ms\s+(\d+)\s+"
-            r"tm\s+(\d+)\s+"
-            r"pv\s+(.+)",
-            data, re.IGNORECASE
-        )
+        Returns:
+            Parsed fields, or None if the line is not in this format.
+        """
+        if "|" in data:
+            return None
+        tokens = data.split()
+        if not tokens or tokens[0].lower() not in ("depth", "multipv"):
+            return None
+        
+        fields = self.MESSAGE_FIELDS
+        result = self._empty_message(data)
+        try:
+            for i in range(0, len(tokens) - 1, 2):
+                key = tokens[i].lower()
+                value = tokens[i + 1]
+                spec = fields.get(key)
+                
+                if spec is not None:
+                    name, convert = spec
+                    result[name] = convert(value)
+                elif key == "n":
+                    result["nodes"] = self._parse_node_count(value)
+                elif key == "depth":
+                    depth, _, sel_depth = value.partition("-")
+                    result["depth"] = int(depth)
+                    result["sel_depth"] = int(sel_depth or depth)
+                elif key == "pv":
+                    pv = tokens[i + 1:]
+                    if "(" in data:
+                        pv = [m for m in pv if m.upper() != "(NONE)"]
+                    result["pv"] = pv
+                    break
+                # Other keys (stdev, v, prior) are not reported
+        except ValueError:
+            return None
         
-        if uci_match:
-            result["depth"] = int(uci_match.group(1))
-            result["sel_depth"] = int(uci_match.group(2))
-            if uci_match.group(3):
-                result["multipv"] = int(uci_match.group(3))
-            result["eval"] = uci_match.group(4)
-            result["nodes"] = self._parse_node_count(uci_match.group(5))
-            result["nps"] = int(uci_match.group(6))
-            result["time"] = int(uci_match.group(7))
-            result["pv"] = self._parse_pv(uci_match.group(8))
-            return result
-        
-        # Try MCTS format (multipv first, no depth at start)
-        # Pattern: multipv N ev VAL w WR d DR stdev SD v V seldepth SD n N n/ms SPEED tm TIME prior P pv MOVES
-        mcts_match = re.match(
-            r"multipv\s+(\d+)\s+"
-            r"ev\s+([+-]?\w*\d+)\s+"
-            r"w\s+([\d.]+)\s+"
-            r"d\s+([\d.]+)\s+"
-            r"stdev\s+([\d.]+)\s+"
-            r"v\s+([\d.]+[KMG]?)\s+"
-            r"seldepth\s+(\d+)\s+"
-            r"n\s+([\d.]+[KMG]?)\s+"
-            r"n/ms\s+(\d+)\s+"
-            r"tm\s+(\d+)\s+"
-            r"(?:prior\s+([\d.]+)\s+)?"
-            r"pv\s+(.+)",
-            data, re.IGNORECASE
-        )
+        return result
+    
+    def _parse_columns(self, data: str) -> Optional[dict[str, Any]]:
+        """
+        Parse a "|"-separated line (NORMAL, summary and indexed formats).
         
-        if mcts_match:
-            result["multipv"] = int(mcts_match.group(1))
-            result["eval"] = mcts_match.group(2)
-            result["winrate"] = float(mcts_match.group(3))
-            result["drawrate"] = float(mcts_match.group(4))
-            result["sel_depth"] = int(mcts_match.group(7))
-            result["nodes"] = self._parse_node_count(mcts_match.group(8))
-            result["nps"] = int(mcts_match.group(9))
-            result["time"] = int(mcts_match.group(10))
-            result["pv"] = self._parse_pv(mcts_match.group(12))
-            return result
-        
-        # Try NORMAL format: Depth X-Y | Eval VAL | Time T | MOVES
-        # Or: [Pondering] Depth X-Y | Eval VAL | Time T | MOVES
-        normal_match = re.match(
-            r"(?:\[Pondering\]\s*)?"
-            r"Depth\s+(\d+)-(\d+)\s+\|\s+"
-            r"Eval\s+([+-]?\w*\d+)\s+\|\s+"
-            r"Time\s+([\d.]+[sm]?)\s+\|\s+"
-            r"(.+)",
-            data, re.IGNORECASE
-        )
+        Returns:
+            Parsed fields, or None if the line is not in this format.
+        """
+        if "|" not in data:
+            return None
         
-        if normal_match:
-            result["depth"] = int(normal_match.group(1))
-            result["sel_depth"] = int(normal_match.group(2))
-            result["eval"] = normal_match.group(3)
-            result["pv"] = self._parse_pv(normal_match.group(5))
-            return result
-        
-        # Try summary format: Speed X | Depth Y-Z | Eval V | Node N | Time T
-        summary_match = re.match(
-            r"(?:\[Pondering\]\s*)?"
-            r"Speed\s+[\d.]+[KMG]?n/s\s+\|\s+"
-            r"Depth\s+(\d+)-(\d+)\s+\|\s+"
-            r"Eval\s+([+-]?\w*\d+)\s+\|\s+"
-            r"Node\s+([\d.]+[KMG]?)\s+\|\s+"
-            r"Time\s+([\d.]+[sm]?)",
-            data, re.IGNORECASE
-        )
+        columns = [column.strip() for column in data.split("|")]
+        head = columns[0]
+        if head[:11].lower() == "[pondering]":
+            columns[0] = head = head[11:].strip()
         
-        if summary_match:
-            result["depth"] = int(summary_match.group(1))
-            result["sel_depth"] = int(summary_match.group(2))
-            result["eval"] = summary_match.group(3)
-            result["nodes"] = self._parse_node_count(summary_match.group(4))
-            return result
-        
-        # Try indexed format: (1) 123 | 5-8 | h8 i9
-        indexed_match = re.match(
-            r"\((\d+)\)\s+([+-]?\w*\d+)\s+\|\s+"
-            r"(\d+)-(\d+)\s+\|\s+"
-            r"(.+)",
-            data, re.IGNORECASE
-        )
+        result = self._empty_message(data)
+        try:
+            if head.startswith("("):
+                # Indexed: (1) 123 | 5-8 | h8 i9
+                if len(columns) < 3:
+                    return None
+                index, _, value = head.partition(")")
+                result["multipv"] = int(index[1:])
+                result["eval"] = value.strip()
+                depth, _, sel_depth = columns[1].partition("-")
+                result["depth"] = int(depth)
+                result["sel_depth"] = int(sel_depth)
+                result["pv"] = self._parse_pv(columns[2])
+                return result
+            
+            labeled = False
+            for column in columns:
+                label, _, value = column.partition(" ")
+                label = label.lower()
+                value = value.strip()
+                
+                if label == "depth":
+                    depth, _, sel_depth = value.partition("-")
+                    result["depth"] = int(depth)
+                    result["sel_depth"] = int(sel_depth or depth)
+                elif label == "eval":
+                    result["eval"] = value
+                elif label == "node":
+                    result["nodes"] = self._parse_node_count(value)
+                elif label in ("time", "speed"):
+                    pass  # Human-readable units, not reported
+                elif labeled:
+                    # NORMAL: the unlabeled column after the fields is the PV
+                    result["pv"] = self._parse_pv(column)
+                    break
+                else:
+                    return None
+                labeled = True
+        except ValueError:
+            return None
         
-        if indexed_match:
-            result["multipv"] = int(indexed_match.group(1))
-            result["eval"] = indexed_match.group(2)
-            result["depth"] = int(indexed_match.group(3))
-            result["sel_depth"] = int(indexed_match.group(4))
-            result["pv"] = self._parse_pv(indexed_match.group(5))
-            return result
+        return result
+    
+    def _parse_fallback(self, data: str) -> dict[str, Any]:
+        """Extract whatever eval, depth and PV can be found in a free-form line."""
+        result = self._empty_message(data)
         
-        # Fallback: try to extract any eval we can find
         eval_match = re.search(r"(?:ev|eval)\s+([+-]?\w*\d+)", data, re.IGNORECASE)
         if eval_match:
             result["eval"] = eval_match.group(1)
@@ -276,18 +320,28 @@ class GomocupProtocol(IProtocol):
         
         return result
     
-    def parse_search_info(self, data: str) -> SearchInfo:
+    def parse_search_info(self, data: str, lazy: bool = False) -> SearchInfo:
         """
         Parse MESSAGE line into SearchInfo object.
         
         Args:
             data: Raw MESSAGE line.
+            lazy: Return a LazySearchInfo that parses on first field access.
             
         Returns:
             SearchInfo with parsed data.
         """
-        parsed = self.parse_message(data)
+        if lazy:
+            return LazySearchInfo(data, self.parse_message)
+        return self.build_search_info(self.parse_message(data))
+    
+    def build_search_info(self, parsed: dict[str, Any]) -> SearchInfo:
+        """
+        Build a SearchInfo from parse_message() output.
         
+        Split from parse_search_info so callers can look at the parsed
+        fields first and only build objects for the infos they keep.
+        """
         return SearchInfo(
             depth=parsed["depth"],
             sel_depth=parsed["sel_depth"],
@@ -295,7 +349,7 @@ class GomocupProtocol(IProtocol):
             nodes=parsed["nodes"],
             nps=parsed["nps"],
             time_ms=parsed["time"],
-            pv=[Move(m) for m in parsed["pv"] if m],
+            pv=[Move.parse(m) for m in parsed["pv"] if m],
             multipv=parsed["multipv"],
         )
     
@@ -314,18 +368,11 @@ class GomocupProtocol(IProtocol):
             Integer node count.
         """
         value = value.strip().upper()
-        
-        multipliers = {
-            'K': 1_000,
-            'M': 1_000_000,
-            'G': 1_000_000_000,
-        }
-        
-        for suffix, mult in multipliers.items():
-            if value.endswith(suffix):
-                return int(float(value[:-1]) * mult)
+        multiplier = self.NODE_MULTIPLIERS.get(value[-1:])
         
         try:
+            if multiplier:
+                return int(float(value[:-1]) * multiplier)
             return int(float(value))
         except ValueError:
             return 0
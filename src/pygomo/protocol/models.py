@@ -5,13 +5,14 @@ This module defines data classes for moves, evaluations,
 search information, and game state.
 """
 
-from dataclasses import dataclass, field
-from typing import Union, Optional
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import Callable, Optional, Union
 import math
 import re
 
 
-@dataclass
+@dataclass(frozen=True)
 class Move:
     """
     Represents a board position/move.
@@ -22,6 +23,10 @@ class Move:
         - String algebraic: "h8"
     
     Coordinates are 0-indexed internally.
+    
+    Moves are immutable. Hot paths should use the interned
+    constructors `Move.of` and `Move.from_index`, which return shared
+    instances instead of allocating.
     """
     col: int
     row: int
@@ -34,20 +39,70 @@ class Move:
             move: Move in tuple, numeric string, or algebraic notation.
         """
         if isinstance(move, tuple) and len(move) == 2:
-            self.col, self.row = move
+            col, row = move
         elif isinstance(move, str):
-            move = move.strip().replace(" ", "")
-            if "," in move:
-                # Numeric format: "7,8"
-                parts = move.split(",")
-                self.col = int(parts[0])
-                self.row = int(parts[1])
-            else:
-                # Algebraic format: "h8"
-                self.col = ord(move[0].lower()) - ord('a')
-                self.row = int(move[1:]) - 1
+            col, row = _parse_coord(move)
         else:
             raise ValueError(f"Invalid move format: {move}")
+        # Frozen dataclass: bypass __setattr__
+        object.__setattr__(self, "col", col)
+        object.__setattr__(self, "row", row)
+    
+    @classmethod
+    def parse(cls, text: str) -> "Move":
+        """
+        Parse a coordinate string ("7,8", "h8", "H8") to an interned move.
+        
+        Parsed strings are memoized, so repeated coordinates (engine
+        replies, PV tokens) cost a dictionary lookup.
+        
+        Raises:
+            ValueError: If the string is not a valid coordinate.
+        """
+        return _parse_move(text)
+    
+    @classmethod
+    def of(cls, col: int, row: int) -> "Move":
+        """
+        Get the interned move for (col, row).
+        
+        Does no parsing or validation. Coordinates outside the
+        interned range get a fresh instance.
+        """
+        if 0 <= col < _INTERN_SIZE and 0 <= row < _INTERN_SIZE:
+            return _INTERNED[row * _INTERN_SIZE + col]
+        return _new_move(col, row)
+    
+    @classmethod
+    def from_index(cls, index: int, size: int = 15) -> "Move":
+        """
+        Get the interned move for a bit index (row * size + col).
+        
+        Args:
+            index: Square index on a board of the given size.
+            size: Board size.
+        """
+        return cls.index_table(size)[index]
+    
+    @staticmethod
+    def index_table(size: int = 15) -> tuple["Move", ...]:
+        """
+        Get the interned moves of a board size, ordered by square index.
+        
+        Built once per size; `index_table(size)[i]` is the move at
+        bit index i.
+        """
+        table = _INDEX_TABLES.get(size)
+        if table is None:
+            table = tuple(
+                Move.of(i % size, i // size) for i in range(size * size)
+            )
+            _INDEX_TABLES[size] = table
+        return table
+    
+    def index(self, size: int = 15) -> int:
+        """Return the square index (row * size + col) on a board of `size`."""
+        return self.row * size + self.col
     
     def to_tuple(self) -> tuple[int, int]:
         """Return as (col, row) tuple."""
@@ -76,6 +131,49 @@ class Move:
         return hash((self.col, self.row))
 
 
+@lru_cache(maxsize=4096)
+def _parse_coord(text: str) -> tuple[int, int]:
+    """
+    Parse a numeric ("7,8") or algebraic ("h8") coordinate to (col, row).
+    
+    Memoized; invalid input raises ValueError and is not cached.
+    """
+    move = text.strip().replace(" ", "")
+    if "," in move:
+        # Numeric format: "7,8"
+        parts = move.split(",")
+        return int(parts[0]), int(parts[1])
+    
+    # Algebraic format: "h8"
+    if not move:
+        raise ValueError(f"Invalid move format: {text!r}")
+    return ord(move[0].lower()) - ord('a'), int(move[1:]) - 1
+
+
+@lru_cache(maxsize=4096)
+def _parse_move(text: str) -> Move:
+    """Memoized Move.parse: coordinate string to interned move."""
+    return Move.of(*_parse_coord(text))
+
+
+def _new_move(col: int, row: int) -> Move:
+    """Build a Move without going through __init__ parsing."""
+    move = object.__new__(Move)
+    object.__setattr__(move, "col", col)
+    object.__setattr__(move, "row", row)
+    return move
+
+
+# Interned moves for every (col, row) below this bound, which covers all
+# Gomocup board sizes; index tables per board size reuse them
+_INTERN_SIZE = 32
+_INTERNED: tuple[Move, ...] = tuple(
+    _new_move(i % _INTERN_SIZE, i // _INTERN_SIZE)
+    for i in range(_INTERN_SIZE * _INTERN_SIZE)
+)
+_INDEX_TABLES: dict[int, tuple[Move, ...]] = {}
+
+
 @dataclass
 class Evaluate:
     """
@@ -175,6 +273,21 @@ class MateScore:
         return f"{sign}M{self.steps()}"
 
 
+def _with_slots(cls: type) -> type:
+    """
+    Rebuild a dataclass with __slots__ for its fields.
+    
+    Same as dataclass(slots=True), which needs Python 3.10.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names + ("__dict__", "__weakref__"):
+        namespace.pop(name, None)
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_with_slots
 @dataclass
 class SearchInfo:
     """
@@ -182,6 +295,9 @@ class SearchInfo:
     
     Contains realtime search progress data including depth,
     evaluation, nodes, speed, and principal variation.
+    
+    Slotted, so that the many infos of a long search (and
+    LazySearchInfo) carry no per-instance __dict__.
     """
     depth: int = 0
     sel_depth: int = 0
@@ -212,6 +328,103 @@ class SearchInfo:
         )
 
 
+class LazySearchInfo(SearchInfo):
+    """
+    SearchInfo that keeps the raw MESSAGE line and parses on demand.
+
+    Nothing is parsed until a field is read. The first field access
+    runs the parser once for all plain fields and checks that the PV
+    tokens are coordinates; `eval` and `pv` build their Evaluate /
+    Move objects only when they are read themselves, so consumers
+    that only look at depth and eval never build PV moves.
+
+    Fields are read-only. Use to_search_info() for a plain SearchInfo.
+
+    Example:
+        info = LazySearchInfo(line, protocol.parse_message)
+        print(info.depth, info.eval)  # PV is never parsed
+    """
+
+    __slots__ = ("raw", "_parser", "_parsed", "_eval", "_pv")
+
+    def __init__(self, raw: str, parser: Callable[[str], dict]):
+        """
+        Args:
+            raw: Raw MESSAGE line.
+            parser: Function returning the parse_message() field dict.
+        """
+        self.raw = raw
+        self._parser = parser
+        self._parsed: Optional[dict] = None
+        self._eval: Optional[Evaluate] = None
+        self._pv: Optional[list[Move]] = None
+
+    @property
+    def parsed(self) -> dict:
+        """
+        Parsed field dict; the line is parsed on first access.
+        
+        Raises:
+            ValueError: If a PV token is not a coordinate.
+        """
+        if self._parsed is None:
+            parsed = self._parser(self.raw)
+            for token in parsed["pv"]:
+                if token:
+                    _parse_coord(token)  # Memoized; raises on a bad token
+            self._parsed = parsed
+        return self._parsed
+
+    @property
+    def depth(self) -> int:
+        return self.parsed["depth"]
+
+    @property
+    def sel_depth(self) -> int:
+        return self.parsed["sel_depth"]
+
+    @property
+    def eval(self) -> Evaluate:
+        if self._eval is None:
+            self._eval = Evaluate(self.parsed["eval"])
+        return self._eval
+
+    @property
+    def nodes(self) -> int:
+        return self.parsed["nodes"]
+
+    @property
+    def nps(self) -> int:
+        return self.parsed["nps"]
+
+    @property
+    def time_ms(self) -> int:
+        return self.parsed["time"]
+
+    @property
+    def pv(self) -> list[Move]:
+        if self._pv is None:
+            self._pv = [Move.parse(m) for m in self.parsed["pv"] if m]
+        return self._pv
+
+    @property
+    def multipv(self) -> int:
+        return self.parsed["multipv"]
+
+    def to_search_info(self) -> SearchInfo:
+        """Build an eager SearchInfo with the same fields."""
+        return SearchInfo(
+            depth=self.depth,
+            sel_depth=self.sel_depth,
+            eval=self.eval,
+            nodes=self.nodes,
+            nps=self.nps,
+            time_ms=self.time_ms,
+            pv=list(self.pv),
+            multipv=self.multipv,
+        )
+
+
 @dataclass
 class PlayResult:
     """
@@ -11,7 +11,9 @@ from pygomo.transport.interface import (
     TransportTimeoutError,
 )
 from pygomo.transport.subprocess import SubprocessTransport
-from pygomo.transport.reader import OutputChannelRouter
+from pygomo.transport.reader import OutputChannelRouter, OverflowPolicy, classify_line
+from pygomo.transport.binary import BinarySubprocessTransport, ChunkedLineReader
+from pygomo.transport.async_subprocess import AsyncSubprocessTransport, AsyncOutputRouter
 
 __all__ = [
     "ITransport",
@@ -21,4 +23,10 @@ __all__ = [
     "TransportTimeoutError",
     "SubprocessTransport",
     "OutputChannelRouter",
+    "OverflowPolicy",
+    "classify_line",
+    "BinarySubprocessTransport",
+    "ChunkedLineReader",
+    "AsyncSubprocessTransport",
+    "AsyncOutputRouter",
 ]
@@ -0,0 +1,444 @@
+"""
+asyncio-based subprocess transport.
+
+This module provides an engine transport that runs on an asyncio
+event loop instead of dedicated reader threads, so one process can
+drive hundreds of engines.
+"""
+
+import asyncio
+from typing import Callable, Iterable, Optional
+
+from pygomo.transport.interface import TransportError, TransportConnectionError
+from pygomo.transport.reader import (
+    OutputChannelRouter,
+    OverflowPolicy,
+    _OverflowMixin,
+    build_routing,
+    classify_line,
+)
+
+
+class AsyncChannelQueue(_OverflowMixin, asyncio.Queue):
+    """asyncio channel queue with an optional capacity and overflow policy."""
+
+    _Empty = asyncio.QueueEmpty
+
+    def __init__(self, maxsize: int = 0, policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST):
+        super().__init__(maxsize)
+        self.policy = policy
+        self.dropped = 0
+
+    def _resize(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+
+
+class AsyncOutputRouter:
+    """
+    Routes engine stdout lines to categorized asyncio channels.
+
+    The async counterpart of OutputChannelRouter: same default
+    channels and filters, but lines are read by a task on the
+    event loop and waiting methods are coroutines.
+
+    Example:
+        router = AsyncOutputRouter(process.stdout)
+
+        channel = await router.wait_any(["coord", "message"], timeout=5.0)
+        coord = await router.get("coord", timeout=5.0)
+    """
+
+    def __init__(self, stream: asyncio.StreamReader):
+        """
+        Initialize the router and start its reader task.
+
+        Must be called from a running event loop.
+
+        Args:
+            stream: The stdout stream of the engine process.
+        """
+        self._stream = stream
+        self._queues: dict[str, AsyncChannelQueue] = {}
+        self._filters: dict[str, Callable[[str], bool]] = {}
+        self._routing: tuple = (None, ())
+        self._routed = asyncio.Condition()
+        self._closed = False
+
+        # Same default channels and filters as the threaded router
+        for name, filter_func in OutputChannelRouter.default_filters():
+            maxsize, policy = OutputChannelRouter.DEFAULT_LIMITS.get(
+                name, (0, OverflowPolicy.DROP_OLDEST)
+            )
+            self.add_channel(name, filter_func, maxsize, policy)
+
+        self._task = asyncio.ensure_future(self._read_loop())
+
+    def add_channel(
+        self,
+        name: str,
+        filter_func: Callable[[str], bool],
+        maxsize: int = 0,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        """
+        Add a new output channel.
+
+        Args:
+            name: Channel name for retrieval.
+            filter_func: Function that returns True if a line belongs to this channel.
+            maxsize: Maximum pending lines, 0 for unbounded.
+            policy: What to do with new lines when the channel is full.
+
+        Raises:
+            ValueError: If channel already exists.
+        """
+        if name in self._queues:
+            raise ValueError(f"Channel '{name}' already exists")
+        self._queues[name] = AsyncChannelQueue(maxsize, policy)
+        self._filters[name] = filter_func
+        self._routing = build_routing(self._filters, self._queues)
+
+    def remove_channel(self, name: str) -> None:
+        """Remove an output channel."""
+        self._queues.pop(name, None)
+        self._filters.pop(name, None)
+        self._routing = build_routing(self._filters, self._queues)
+
+    def set_channel_limit(
+        self,
+        name: str,
+        maxsize: int,
+        policy: Optional[OverflowPolicy] = None,
+    ) -> None:
+        """Change the capacity and overflow policy of a channel."""
+        queue = self._queue(name)
+        queue.set_limit(maxsize, policy or queue.policy)
+
+    def dropped(self, name: str) -> int:
+        """Get the number of lines a channel has discarded on overflow."""
+        return self._queue(name).dropped
+
+    @property
+    def drop_counts(self) -> dict[str, int]:
+        """Lines discarded on overflow, per channel."""
+        return {name: queue.dropped for name, queue in self._queues.items()}
+
+    async def _read_loop(self) -> None:
+        """Reader task that reads and routes output lines."""
+        try:
+            while True:
+                raw = await self._stream.readline()
+
+                # EOF check
+                if not raw:
+                    break
+
+                line = raw.decode("utf-8", errors="replace").strip()
+                if not line:
+                    continue
+
+                fast, routes = self._routing
+                if fast is not None:
+                    queue = fast[classify_line(line)]
+                else:
+                    queue = next((q for f, q in routes if f(line)), None)
+
+                if queue is not None and not queue.offer(line):
+                    # Full BLOCK channel: let waiters run, then wait for room
+                    async with self._routed:
+                        self._routed.notify_all()
+                    await queue.put(line)
+
+                async with self._routed:
+                    self._routed.notify_all()
+        except (asyncio.CancelledError, ConnectionError, ValueError):
+            # Cancelled, stream closed or line over the buffer limit
+            pass
+        finally:
+            self._closed = True
+            async with self._routed:
+                self._routed.notify_all()
+
+    def _queue(self, channel: str) -> AsyncChannelQueue:
+        """Get a channel queue, raising ValueError for unknown names."""
+        if channel not in self._queues:
+            valid = ", ".join(self._queues.keys())
+            raise ValueError(f"Unknown channel '{channel}'. Valid: {valid}")
+        return self._queues[channel]
+
+    async def wait_any(
+        self,
+        channels: Iterable[str],
+        timeout: Optional[float] = None,
+    ) -> Optional[str]:
+        """
+        Wait until one of several channels has a line.
+
+        Lines are not consumed; read them with get() / get_all().
+
+        Args:
+            channels: Channel names, in priority order.
+            timeout: Maximum time to wait in seconds. None waits forever.
+
+        Returns:
+            The first listed channel with a pending line, or None on
+            timeout or when the stream has closed with nothing pending.
+        """
+        queues = [(channel, self._queue(channel)) for channel in channels]
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        async with self._routed:
+            while True:
+                for channel, queue in queues:
+                    if not queue.empty():
+                        return channel
+
+                if self._closed:
+                    return None
+
+                if deadline is None:
+                    await self._routed.wait()
+                    continue
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return None
+                try:
+                    await asyncio.wait_for(self._routed.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def get(self, channel: str, timeout: float = 0.0) -> str:
+        """
+        Get the next line from a channel.
+
+        Args:
+            channel: Channel name to read from.
+            timeout: Maximum time to wait in seconds. 0 means no wait.
+
+        Returns:
+            The next line, or empty string on timeout or EOF.
+        """
+        queue = self._queue(channel)
+        if timeout > 0 and queue.empty():
+            await self.wait_any([channel], timeout)
+
+        try:
+            return queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return ""
+
+    def get_nowait(self, channel: str) -> Optional[str]:
+        """Get a line without waiting, or None if the channel is empty."""
+        try:
+            return self._queue(channel).get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+
+    def get_all(self, channel: str) -> list[str]:
+        """Get all available lines from a channel."""
+        queue = self._queue(channel)
+        lines = []
+        while not queue.empty():
+            lines.append(queue.get_nowait())
+        return lines
+
+    def clear(self, channel: str) -> None:
+        """Clear all pending messages in a channel."""
+        if channel in self._queues:
+            self.get_all(channel)
+
+    def clear_all(self) -> None:
+        """Clear all pending messages in all channels."""
+        for channel in list(self._queues):
+            self.get_all(channel)
+
+    def stop(self) -> None:
+        """Cancel the reader task."""
+        self._task.cancel()
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the output stream has ended (EOF or read error)."""
+        return self._closed
+
+    @property
+    def channels(self) -> list[str]:
+        """Get list of available channel names."""
+        return list(self._queues.keys())
+
+
+class AsyncSubprocessTransport:
+    """
+    Engine transport on top of asyncio subprocesses.
+
+    Uses `asyncio.create_subprocess_exec`, so no threads are
+    spawned per engine. stderr is discarded so that a chatty
+    engine can never block on a full pipe.
+
+    Example:
+        transport = AsyncSubprocessTransport("/path/to/engine")
+        await transport.start()
+        await transport.send("START 15")
+        response = await transport.router.get("output", timeout=5.0)
+        await transport.stop()
+    """
+
+    # StreamReader line limit; long PVs or ABOUT strings must fit
+    LINE_LIMIT = 1 << 20
+
+    def __init__(
+        self,
+        executable_path: str,
+        args: Optional[list[str]] = None,
+        working_directory: Optional[str] = None,
+    ):
+        """
+        Initialize async subprocess transport.
+
+        Args:
+            executable_path: Path to the engine executable.
+            args: Optional command line arguments.
+            working_directory: Optional working directory for the process.
+        """
+        self._executable_path = executable_path
+        self._args = args or []
+        self._working_directory = working_directory
+
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._router: Optional[AsyncOutputRouter] = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the engine process is running."""
+        return self._process is not None and self._process.returncode is None
+
+    @property
+    def process_id(self) -> Optional[int]:
+        """Get the process ID of the engine."""
+        return self._process.pid if self._process else None
+
+    @property
+    def router(self) -> AsyncOutputRouter:
+        """
+        Get the output channel router.
+
+        Raises:
+            TransportError: If not running.
+        """
+        if self._router is None:
+            raise TransportError("Transport is not running")
+        return self._router
+
+    async def start(self) -> None:
+        """
+        Start the engine subprocess.
+
+        Raises:
+            TransportError: If already running.
+            TransportConnectionError: If process fails to start.
+        """
+        if self.is_running:
+            raise TransportError("Transport is already running")
+
+        try:
+            self._process = await asyncio.create_subprocess_exec(
+                self._executable_path,
+                *self._args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                cwd=self._working_directory,
+                limit=self.LINE_LIMIT,
+            )
+        except OSError as e:
+            raise TransportConnectionError(
+                f"Failed to start engine '{self._executable_path}': {e}"
+            ) from e
+
+        self._router = AsyncOutputRouter(self._process.stdout)
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the engine subprocess.
+
+        Attempts graceful shutdown first, then forces termination.
+
+        Args:
+            timeout: Time to wait for graceful shutdown.
+        """
+        process = self._process
+        if process is None:
+            return
+
+        if process.returncode is None:
+            try:
+                process.terminate()
+                await asyncio.wait_for(process.wait(), timeout)
+            except ProcessLookupError:
+                pass
+            except asyncio.TimeoutError:
+                # Force kill if graceful shutdown fails
+                process.kill()
+                await process.wait()
+
+        if process.stdin is not None:
+            process.stdin.close()
+        if self._router is not None:
+            self._router.stop()
+
+        self._process = None
+        self._router = None
+
+    async def send(self, data: str) -> None:
+        """
+        Send a command to the engine.
+
+        Args:
+            data: Command string (newline appended automatically).
+
+        Raises:
+            TransportError: If not running or the pipe is closed.
+        """
+        if not self.is_running:
+            raise TransportError("Transport is not running")
+
+        try:
+            self._process.stdin.write(f"{data}\n".encode())
+            await self._process.stdin.drain()
+        except (ConnectionError, RuntimeError) as e:
+            raise TransportError(f"Failed to write to engine: {e}") from e
+
+    async def send_many(self, lines: Iterable[str]) -> None:
+        """
+        Send several lines to the engine in one write.
+
+        Args:
+            lines: Command lines (newline appended to each).
+
+        Raises:
+            TransportError: If not running or the pipe is closed.
+        """
+        if not self.is_running:
+            raise TransportError("Transport is not running")
+
+        lines = list(lines)
+        if not lines:
+            return
+        await self.send("\n".join(lines))
+
+    async def wait(self) -> Optional[int]:
+        """Wait for the engine process to exit and return its exit code."""
+        if self._process is None:
+            return None
+        return await self._process.wait()
+
+    async def __aenter__(self) -> "AsyncSubprocessTransport":
+        """Async context manager entry."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.stop()
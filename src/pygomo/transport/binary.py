@@ -0,0 +1,184 @@
+"""
+Binary-mode subprocess transport.
+
+This module provides a transport that talks to the engine over
+unbuffered byte pipes. Output is read in large chunks with
+`os.read` and split into lines here, instead of going through
+a TextIOWrapper one `readline` at a time.
+"""
+
+import os
+import subprocess
+from collections import deque
+from threading import Lock
+from typing import Any, Iterable, Optional
+
+from pygomo.transport.interface import IStreamWriter, TransportError
+from pygomo.transport.reader import OutputChannelRouter
+from pygomo.transport.subprocess import SubprocessTransport
+
+
+class ChunkedLineReader:
+    """
+    Line reader over a raw file descriptor.
+
+    Reads up to CHUNK_SIZE bytes per syscall and splits complete
+    lines itself. Only complete lines are decoded; a trailing
+    partial line is kept as bytes until the rest arrives. Lines
+    are stripped, so `\\r\\n` endings from Windows-built engines
+    (e.g. run under Wine) are handled, and blank lines are dropped.
+
+    OutputChannelRouter routes each `read_batch()` into the channel
+    queues without holding its lock, then wakes waiters once per batch.
+    """
+
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, fd: int, encoding: str = "utf-8"):
+        """
+        Args:
+            fd: File descriptor to read from (e.g. `process.stdout.fileno()`).
+            encoding: Text encoding of the engine output.
+        """
+        self._fd = fd
+        self._encoding = encoding
+        self._pending = b""
+        self._lines: deque[str] = deque()
+
+    def read_batch(self) -> Optional[list[str]]:
+        """
+        Read the next batch of complete lines.
+
+        Blocks until at least one newline (or EOF) is read.
+
+        Returns:
+            Stripped, non-empty lines (possibly an empty list), or None at EOF.
+        """
+        while True:
+            chunk = os.read(self._fd, self.CHUNK_SIZE)
+
+            if not chunk:
+                # EOF: flush an unterminated last line
+                if not self._pending:
+                    return None
+                data, self._pending = self._pending, b""
+                return self._split(data)
+
+            data = self._pending + chunk if self._pending else chunk
+            end = data.rfind(b"\n")
+            if end < 0:
+                self._pending = data
+                continue
+
+            self._pending = data[end + 1:]
+            return self._split(data[:end])
+
+    def _split(self, data: bytes) -> list[str]:
+        """Decode complete lines and drop blank ones."""
+        text = data.decode(self._encoding, errors="replace")
+        return [line for line in map(str.strip, text.split("\n")) if line]
+
+    def readline(self) -> str:
+        """
+        Read one line, file-style.
+
+        Returns:
+            The next stripped line, or empty string at EOF.
+        """
+        while not self._lines:
+            batch = self.read_batch()
+            if batch is None:
+                return ""
+            self._lines.extend(batch)
+        return self._lines.popleft()
+
+
+class BinaryStreamWriter(IStreamWriter):
+    """
+    Stream writer that writes encoded lines straight to the stdin fd.
+
+    Each line (or `writelines` batch) is one `os.write` call; there
+    is no userspace buffer to flush.
+    """
+
+    def __init__(self, stdin, encoding: str = "utf-8"):
+        self._stdin = stdin
+        self._fd = stdin.fileno()
+        self._encoding = encoding
+        self._lock = Lock()
+
+    def writeline(self, data: str) -> None:
+        """Write a line to stdin with newline appended."""
+        self._write(f"{data}\n".encode(self._encoding))
+
+    def writelines(self, lines: Iterable[str]) -> None:
+        """Write several lines with a single `os.write` call."""
+        self._write("".join(f"{line}\n" for line in lines).encode(self._encoding))
+
+    def _write(self, payload: bytes) -> None:
+        """Write all bytes, retrying on partial writes."""
+        with self._lock:
+            if self._stdin is None or self._stdin.closed:
+                raise TransportError("Writer is closed")
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(self._fd, view):]
+            except OSError as e:
+                raise TransportError(f"Failed to write to engine: {e}") from e
+
+    def flush(self) -> None:
+        """Nothing to flush; writes are unbuffered."""
+        pass
+
+    def close(self) -> None:
+        """Close the stdin stream."""
+        with self._lock:
+            if self._stdin and not self._stdin.closed:
+                try:
+                    self._stdin.close()
+                except OSError:
+                    pass  # Engine already gone
+            self._stdin = None
+
+
+class BinarySubprocessTransport(SubprocessTransport):
+    """
+    Subprocess transport over unbuffered byte pipes.
+
+    Same interface as SubprocessTransport, but stdout is read with
+    ChunkedLineReader and stdin is written with BinaryStreamWriter,
+    bypassing the text I/O layer. Prefer it for verbose engines that
+    print thousands of MESSAGE lines per second.
+
+    Example:
+        client = EngineClient("/path/to/engine", transport_class=BinarySubprocessTransport)
+    """
+
+    def __init__(
+        self,
+        executable_path: str,
+        args: Optional[list[str]] = None,
+        working_directory: Optional[str] = None,
+        encoding: str = "utf-8",
+    ):
+        """
+        Initialize binary subprocess transport.
+
+        Args:
+            executable_path: Path to the engine executable.
+            args: Optional command line arguments.
+            working_directory: Optional working directory for the process.
+            encoding: Text encoding used by the engine.
+        """
+        super().__init__(executable_path, args, working_directory)
+        self._encoding = encoding
+
+    def _popen_options(self) -> dict[str, Any]:
+        return {"bufsize": 0}
+
+    def _create_router(self, process: subprocess.Popen) -> OutputChannelRouter:
+        return OutputChannelRouter(ChunkedLineReader(process.stdout.fileno(), self._encoding))
+
+    def _create_writer(self, process: subprocess.Popen) -> BinaryStreamWriter:
+        return BinaryStreamWriter(process.stdin, self._encoding)
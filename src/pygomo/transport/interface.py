@@ -6,7 +6,7 @@ following the Interface Segregation Principle (ISP).
 """
 
 from abc import ABC, abstractmethod
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
 
 
 class TransportError(Exception):
@@ -71,6 +71,22 @@ class IStreamWriter(ABC):
         """
         ...
     
+    def writelines(self, lines: Iterable[str]) -> None:
+        """
+        Write several lines as one batch.
+        
+        The default writes them one by one; implementations should
+        override this to issue a single write.
+        
+        Args:
+            lines: The lines to write (a newline is appended to each).
+            
+        Raises:
+            TransportError: If write fails.
+        """
+        for line in lines:
+            self.writeline(line)
+    
     @abstractmethod
     def flush(self) -> None:
         """Flush the write buffer."""
@@ -136,6 +152,23 @@ class ITransport(ABC):
         """
         ...
     
+    def send_many(self, lines: Iterable[str]) -> None:
+        """
+        Send several lines to the engine's stdin as one batch.
+        
+        Used for multi-line commands such as a BOARD ... DONE block.
+        The default sends them one by one; implementations should
+        override this to write the whole batch at once.
+        
+        Args:
+            lines: The lines to send (a newline is appended to each).
+            
+        Raises:
+            TransportError: If engine is not running.
+        """
+        for line in lines:
+            self.send(line)
+    
     @abstractmethod
     def receive(self, timeout: Optional[float] = None) -> str:
         """
@@ -6,9 +6,189 @@ that categorizes engine output lines based on patterns.
 """
 
 import re
-from queue import Queue, Empty
-from threading import Thread, Lock
-from typing import TextIO, Callable, Optional
+import time
+from abc import ABC, abstractmethod
+from enum import Enum, auto
+from queue import Queue, Empty, Full
+from threading import Thread, Lock, Condition
+from typing import TextIO, Callable, Iterable, Optional
+
+
+# Common patterns for Gomocup protocol
+COORD_PATTERN = re.compile(r"^\d+\s*,\s*\d+(\s+\d+\s*,\s*\d+)*$")
+
+# Keyword prefixes of the default channels, keyed by first letter
+_PREFIXES = {
+    "M": ("MESSAGE", "message"),
+    "I": ("INFO ", "info"),
+    "E": ("ERROR", "error"),
+    "R": ("REALTIME", "realtime"),
+}
+
+
+class OverflowPolicy(Enum):
+    """What a bounded channel does with a new line when it is full."""
+    DROP_OLDEST = auto()  # Discard the oldest pending line
+    DROP_NEWEST = auto()  # Discard the incoming line
+    KEEP_LATEST = auto()  # Keep only the newest line, whatever the capacity
+    BLOCK = auto()        # Stall the reader until a consumer makes room
+
+
+class _OverflowMixin(ABC):
+    """
+    Overflow handling shared by the threaded and asyncio channel queues.
+    
+    The generic `offer` checks fullness before each step, which is
+    exact for single-threaded (asyncio) use; ChannelQueue overrides
+    it to apply the policy under the queue mutex.
+    """
+    
+    _Empty: type = Empty
+    
+    policy: OverflowPolicy
+    dropped: int
+    
+    def offer(self, item: str) -> bool:
+        """
+        Add an item, applying the overflow policy.
+        
+        Returns:
+            False only for a full BLOCK queue; the caller must then
+            wait for room with a blocking put.
+        """
+        policy = self.policy
+        
+        if policy is OverflowPolicy.KEEP_LATEST:
+            self.dropped += self._discard(None)
+        elif self.full():
+            if policy is OverflowPolicy.DROP_NEWEST:
+                self.dropped += 1
+                return True
+            if policy is OverflowPolicy.BLOCK:
+                return False
+            self.dropped += self._discard(self.qsize() - self.maxsize + 1)
+        
+        self.put_nowait(item)
+        return True
+    
+    def _discard(self, count: Optional[int]) -> int:
+        """Drop up to count oldest items (all if None), returning how many."""
+        dropped = 0
+        while count is None or dropped < count:
+            try:
+                self.get_nowait()
+            except self._Empty:
+                break
+            dropped += 1
+        return dropped
+    
+    @abstractmethod
+    def _resize(self, maxsize: int) -> None:
+        """Set the queue capacity."""
+        ...
+    
+    def set_limit(self, maxsize: int, policy: OverflowPolicy) -> None:
+        """Change capacity and policy, trimming the oldest excess lines."""
+        self._resize(maxsize)
+        self.policy = policy
+        if maxsize > 0:
+            excess = self.qsize() - maxsize
+            if excess > 0 and policy is not OverflowPolicy.BLOCK:
+                self.dropped += self._discard(excess)
+
+
+class ChannelQueue(_OverflowMixin, Queue):
+    """
+    Thread-safe channel queue with an optional capacity.
+    
+    `maxsize=0` means unbounded. `dropped` counts lines discarded
+    by the overflow policy.
+    """
+    
+    def __init__(self, maxsize: int = 0, policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST):
+        super().__init__(maxsize)
+        self.policy = policy
+        self.dropped = 0
+    
+    def offer(self, item: str) -> bool:
+        """Add an item, applying the overflow policy atomically."""
+        with self.mutex:
+            policy = self.policy
+            size = self._qsize()
+            
+            if policy is OverflowPolicy.KEEP_LATEST:
+                self.queue.clear()
+                self.dropped += size
+            elif 0 < self.maxsize <= size:
+                if policy is OverflowPolicy.DROP_NEWEST:
+                    self.dropped += 1
+                    return True
+                if policy is OverflowPolicy.BLOCK:
+                    return False
+                excess = size - self.maxsize + 1
+                self.dropped += excess
+                while excess:
+                    self._get()
+                    excess -= 1
+            
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+            return True
+    
+    def _resize(self, maxsize: int) -> None:
+        with self.mutex:
+            self.maxsize = maxsize
+            self.not_full.notify_all()
+
+
+def classify_line(line: str) -> str:
+    """
+    Get the default channel for a non-empty output line.
+    
+    Equivalent to trying the default channel filters in order, but
+    looks at the first character once and upper-cases only the
+    keyword prefix.
+    
+    Args:
+        line: A stripped, non-empty engine output line.
+        
+    Returns:
+        One of "coord", "message", "info", "error", "realtime", "output".
+    """
+    first = line[0]
+    if first.isdigit():
+        return "coord" if COORD_PATTERN.match(line) else "output"
+    
+    entry = _PREFIXES.get(first.upper())
+    if entry is not None:
+        prefix, channel = entry
+        if line[:len(prefix)].upper() == prefix:
+            return channel
+    return "output"
+
+
+def build_routing(
+    filters: dict[str, Callable[[str], bool]],
+    queues: dict[str, object],
+) -> tuple[Optional[dict[str, object]], tuple]:
+    """
+    Precompute how lines are routed for the current channel set.
+    
+    When the default channels are still first and unchanged, every
+    line ends up in one of them (the "output" catch-all takes all
+    but ERROR lines), so `classify_line` is used directly. Otherwise
+    the filters are tried in order.
+    
+    Returns:
+        (default queues by name or None, ((filter, queue), ...)).
+    """
+    defaults = OutputChannelRouter.default_filters()
+    items = list(filters.items())
+    fast = None
+    if items[:len(defaults)] == defaults:
+        fast = {name: queues[name] for name, _ in defaults}
+    return fast, tuple((func, queues[name]) for name, func in items)
 
 
 class OutputChannelRouter:
@@ -34,23 +214,43 @@ class OutputChannelRouter:
         
         # Get realtime search info
         message = router.get("message", timeout=0.1)
+        
+        # Sleep until either channel has a line
+        channel = router.wait_any(["coord", "message"], timeout=5.0)
     """
     
-    # Common patterns for Gomocup protocol
-    COORD_PATTERN = re.compile(r"^\d+\s*,\s*\d+(\s+\d+\s*,\s*\d+)*$")
+    COORD_PATTERN = COORD_PATTERN
+    
+    # Default (capacity, policy) per channel. Coordinates are never
+    # dropped; channels nobody may read are bounded so a long-running
+    # engine cannot grow memory without limit.
+    DEFAULT_LIMITS: dict[str, tuple[int, OverflowPolicy]] = {
+        "message": (10000, OverflowPolicy.DROP_OLDEST),
+        "info": (1000, OverflowPolicy.DROP_OLDEST),
+        "error": (1000, OverflowPolicy.DROP_OLDEST),
+        "realtime": (1000, OverflowPolicy.DROP_OLDEST),
+        "output": (1000, OverflowPolicy.DROP_OLDEST),
+    }
     
     def __init__(self, stream: TextIO):
         """
         Initialize the router with an output stream.
         
         Args:
-            stream: The stdout stream from the engine process.
+            stream: The stdout stream from the engine process. Any
+                object with `readline()`; if it also has `read_batch()`
+                (see ChunkedLineReader), lines are read in batches.
         """
         self._stream = stream
-        self._queues: dict[str, Queue] = {}
+        self._queues: dict[str, ChannelQueue] = {}
         self._filters: dict[str, Callable[[str], bool]] = {}
+        # Immutable routing snapshot, replaced whenever channels change
+        self._routing: tuple = (None, ())
         self._lock = Lock()
+        # Notified (under _lock) whenever a line is routed or the stream ends
+        self._routed = Condition(self._lock)
         self._running = True
+        self._closed = False
         
         # Setup default channels
         self._setup_default_channels()
@@ -61,41 +261,58 @@ class OutputChannelRouter:
     
     def _setup_default_channels(self) -> None:
         """Setup the default protocol channels."""
-        self.add_channel("coord", self._is_coord)
-        self.add_channel("message", self._is_message)
-        self.add_channel("info", self._is_info)
-        self.add_channel("error", self._is_error)
-        self.add_channel("realtime", self._is_realtime)
-        self.add_channel("output", self._is_output)  # Catch-all, must be last
-    
-    def _is_coord(self, line: str) -> bool:
+        for name, filter_func in self.default_filters():
+            maxsize, policy = self.DEFAULT_LIMITS.get(name, (0, OverflowPolicy.DROP_OLDEST))
+            self.add_channel(name, filter_func, maxsize, policy)
+    
+    @classmethod
+    def default_filters(cls) -> list[tuple[str, Callable[[str], bool]]]:
+        """Default (channel, filter) pairs, in routing order."""
+        return [
+            ("coord", cls._is_coord),
+            ("message", cls._is_message),
+            ("info", cls._is_info),
+            ("error", cls._is_error),
+            ("realtime", cls._is_realtime),
+            ("output", cls._is_output),  # Catch-all, must be last
+        ]
+    
+    @classmethod
+    def _is_coord(cls, line: str) -> bool:
         """Check if line is a coordinate response."""
-        return bool(self.COORD_PATTERN.match(line))
+        return bool(cls.COORD_PATTERN.match(line))
     
-    def _is_message(self, line: str) -> bool:
+    @staticmethod
+    def _is_message(line: str) -> bool:
         """Check if line is a MESSAGE output."""
         return line.upper().startswith("MESSAGE")
     
-    def _is_info(self, line: str) -> bool:
+    @staticmethod
+    def _is_info(line: str) -> bool:
         """Check if line is an INFO output."""
         return line.upper().startswith("INFO ")
     
-    def _is_error(self, line: str) -> bool:
+    @staticmethod
+    def _is_error(line: str) -> bool:
         """Check if line is an ERROR output."""
         return line.upper().startswith("ERROR")
     
-    def _is_realtime(self, line: str) -> bool:
+    @staticmethod
+    def _is_realtime(line: str) -> bool:
         """Check if line is a REALTIME output."""
         return line.upper().startswith("REALTIME")
     
-    def _is_output(self, line: str) -> bool:
+    @classmethod
+    def _is_output(cls, line: str) -> bool:
         """Catch-all for other outputs (OK, ABOUT, etc.)."""
-        return not self._is_error(line)
+        return not cls._is_error(line)
     
     def add_channel(
         self,
         name: str,
         filter_func: Callable[[str], bool],
+        maxsize: int = 0,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
     ) -> None:
         """
         Add a new output channel.
@@ -103,6 +320,8 @@ class OutputChannelRouter:
         Args:
             name: Channel name for retrieval.
             filter_func: Function that returns True if a line belongs to this channel.
+            maxsize: Maximum pending lines, 0 for unbounded.
+            policy: What to do with new lines when the channel is full.
             
         Raises:
             ValueError: If channel already exists.
@@ -110,8 +329,9 @@ class OutputChannelRouter:
         with self._lock:
             if name in self._queues:
                 raise ValueError(f"Channel '{name}' already exists")
-            self._queues[name] = Queue()
+            self._queues[name] = ChannelQueue(maxsize, policy)
             self._filters[name] = filter_func
+            self._routing = build_routing(self._filters, self._queues)
     
     def remove_channel(self, name: str) -> None:
         """
@@ -123,31 +343,121 @@ class OutputChannelRouter:
         with self._lock:
             self._queues.pop(name, None)
             self._filters.pop(name, None)
+            self._routing = build_routing(self._filters, self._queues)
+    
+    def set_channel_limit(
+        self,
+        name: str,
+        maxsize: int,
+        policy: Optional[OverflowPolicy] = None,
+    ) -> None:
+        """
+        Change the capacity and overflow policy of a channel.
+        
+        Example:
+            # Only keep the newest search progress line
+            router.set_channel_limit("message", 1, OverflowPolicy.KEEP_LATEST)
+        
+        Args:
+            name: Channel name.
+            maxsize: Maximum pending lines, 0 for unbounded.
+            policy: New overflow policy, or None to keep the current one.
+            
+        Raises:
+            ValueError: If channel doesn't exist.
+        """
+        with self._lock:
+            queue = self._channel_queue(name)
+            queue.set_limit(maxsize, policy or queue.policy)
+    
+    def dropped(self, name: str) -> int:
+        """
+        Get the number of lines a channel has discarded on overflow.
+        
+        Raises:
+            ValueError: If channel doesn't exist.
+        """
+        with self._lock:
+            return self._channel_queue(name).dropped
+    
+    @property
+    def drop_counts(self) -> dict[str, int]:
+        """Lines discarded on overflow, per channel."""
+        with self._lock:
+            return {name: queue.dropped for name, queue in self._queues.items()}
+    
+    def _channel_queue(self, name: str) -> ChannelQueue:
+        """Look up a channel queue (caller holds the lock)."""
+        if name not in self._queues:
+            valid = ", ".join(self._queues.keys())
+            raise ValueError(f"Unknown channel '{name}'. Valid: {valid}")
+        return self._queues[name]
     
     def _read_loop(self) -> None:
         """Background thread that reads and routes output lines."""
+        # Chunked readers hand over several stripped lines per call
+        read_batch = getattr(self._stream, "read_batch", None)
+        
         while self._running:
             try:
-                line = self._stream.readline()
-                
-                # EOF check
-                if line == "":
-                    break
+                if read_batch is not None:
+                    lines = read_batch()
+                    
+                    # EOF check
+                    if lines is None:
+                        break
+                    if not lines:
+                        continue
+                else:
+                    line = self._stream.readline()
+                    
+                    # EOF check
+                    if line == "":
+                        break
+                    
+                    line = line.strip()
+                    if not line:
+                        continue
+                    lines = (line,)
                 
-                line = line.strip()
-                if not line:
-                    continue
+                # Route to appropriate channel; queues are thread-safe,
+                # so only the wake-up needs the lock
+                fast, routes = self._routing
+                for line in lines:
+                    if fast is not None:
+                        queue = fast[classify_line(line)]
+                    else:
+                        queue = next((q for f, q in routes if f(line)), None)
+                        if queue is None:
+                            continue
+                    if not queue.offer(line):
+                        self._wait_for_room(queue, line)
                 
-                # Route to appropriate channel
                 with self._lock:
-                    for name, filter_func in self._filters.items():
-                        if filter_func(line):
-                            self._queues[name].put(line)
-                            break
+                    self._routed.notify_all()
                             
             except Exception:
                 # Stream closed or error
                 break
+        
+        # Wake up any waiters so they can see the stream is gone
+        with self._lock:
+            self._closed = True
+            self._routed.notify_all()
+    
+    def _wait_for_room(self, queue: ChannelQueue, line: str) -> None:
+        """Block the reader until a full BLOCK channel accepts the line."""
+        # Wake waiters first: they may need lines routed earlier in
+        # this batch before they drain the full channel
+        with self._lock:
+            self._routed.notify_all()
+        
+        while self._running:
+            try:
+                queue.put(line, timeout=0.1)
+                return
+            except Full:
+                continue
     
     def get(
         self,
@@ -185,6 +495,55 @@ class OutputChannelRouter:
         except Empty:
             return ""
     
+    def wait_any(
+        self,
+        channels: Iterable[str],
+        timeout: Optional[float] = None,
+    ) -> Optional[str]:
+        """
+        Block until one of several channels has a line.
+        
+        Wakes as soon as the reader thread routes a line, instead of
+        polling each channel with short timeouts. Lines are not
+        consumed; read them with get() / get_all().
+        
+        Args:
+            channels: Channel names, in priority order.
+            timeout: Maximum time to wait in seconds. None waits forever.
+            
+        Returns:
+            The first listed channel with a pending line, or None on
+            timeout or when the stream has closed with nothing pending.
+            
+        Raises:
+            ValueError: If a channel doesn't exist.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        
+        with self._routed:
+            queues = []
+            for channel in channels:
+                if channel not in self._queues:
+                    valid = ", ".join(self._queues.keys())
+                    raise ValueError(f"Unknown channel '{channel}'. Valid: {valid}")
+                queues.append((channel, self._queues[channel]))
+            
+            while True:
+                for channel, queue in queues:
+                    if not queue.empty():
+                        return channel
+                
+                if self._closed:
+                    return None
+                
+                if deadline is None:
+                    self._routed.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    self._routed.wait(remaining)
+    
     def get_nowait(self, channel: str) -> Optional[str]:
         """
         Get a line without waiting.
@@ -239,7 +598,7 @@ class OutputChannelRouter:
                 self._clear_queue(queue)
     
     @staticmethod
-    def _clear_queue(queue: Queue) -> None:
+    def _clear_queue(queue: ChannelQueue) -> None:
         """Clear a queue without blocking."""
         while not queue.empty():
             try:
@@ -251,6 +610,11 @@ class OutputChannelRouter:
         """Stop the background reader thread."""
         self._running = False
     
+    @property
+    def is_closed(self) -> bool:
+        """Whether the output stream has ended (EOF or read error)."""
+        return self._closed
+    
     @property
     def channels(self) -> list[str]:
         """Get list of available channel names."""
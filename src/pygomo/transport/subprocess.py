@@ -7,7 +7,7 @@ an engine as a subprocess and communicates via stdin/stdout.
 
 import subprocess
 from threading import Lock
-from typing import Optional
+from typing import Any, Iterable, Optional
 
 from pygomo.transport.interface import (
     ITransport,
@@ -37,6 +37,15 @@ class SubprocessStreamWriter(IStreamWriter):
             self._stdin.write(f"{data}\n")
             self._stdin.flush()
     
+    def writelines(self, lines: Iterable[str]) -> None:
+        """Write several lines with a single write and flush."""
+        payload = "".join(f"{line}\n" for line in lines)
+        with self._lock:
+            if self._stdin is None or self._stdin.closed:
+                raise TransportError("Writer is closed")
+            self._stdin.write(payload)
+            self._stdin.flush()
+    
     def flush(self) -> None:
         """Flush the stdin buffer."""
         with self._lock:
@@ -113,7 +122,7 @@ class SubprocessTransport(ITransport):
         
         self._process: Optional[subprocess.Popen] = None
         self._router: Optional[OutputChannelRouter] = None
-        self._writer: Optional[SubprocessStreamWriter] = None
+        self._writer: Optional[IStreamWriter] = None
         self._lock = Lock()
     
     @property
@@ -148,22 +157,32 @@ class SubprocessTransport(ITransport):
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
                     cwd=self._working_directory,
-                    bufsize=1,
-                    universal_newlines=True,
-                    text=True,
+                    **self._popen_options(),
                 )
                 
                 # Initialize router for stdout
-                self._router = OutputChannelRouter(self._process.stdout)
+                self._router = self._create_router(self._process)
                 
                 # Initialize writer for stdin
-                self._writer = SubprocessStreamWriter(self._process.stdin)
+                self._writer = self._create_writer(self._process)
                 
             except OSError as e:
                 raise TransportConnectionError(
                     f"Failed to start engine '{self._executable_path}': {e}"
                 ) from e
     
+    def _popen_options(self) -> dict[str, Any]:
+        """Pipe mode options for Popen; subclasses may override."""
+        return {"bufsize": 1, "universal_newlines": True, "text": True}
+    
+    def _create_router(self, process: subprocess.Popen) -> OutputChannelRouter:
+        """Create the stdout router for a started process."""
+        return OutputChannelRouter(process.stdout)
+    
+    def _create_writer(self, process: subprocess.Popen) -> IStreamWriter:
+        """Create the stdin writer for a started process."""
+        return SubprocessStreamWriter(process.stdin)
+    
     def stop(self, timeout: float = 5.0) -> None:
         """
         Stop the engine subprocess.
@@ -207,6 +226,18 @@ class SubprocessTransport(ITransport):
         
         self._writer.writeline(data)
     
+    def send_many(self, lines: Iterable[str]) -> None:
+        """
+        Send several lines to the engine in one write.
+        
+        Args:
+            lines: Command lines (newline appended to each).
+        """
+        if not self.is_running:
+            raise TransportError("Transport is not running")
+        
+        self._writer.writelines(lines)
+    
     def receive(self, timeout: Optional[float] = None) -> str:
         """
         Receive a line from the engine's default output.
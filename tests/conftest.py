@@ -29,3 +29,10 @@ def empty_renju_board():
     """Create an empty 15x15 RenjuBitBoard."""
     from pygomo.board import RenjuBitBoard
     return RenjuBitBoard(_size=15)
+
+
+@pytest.fixture
+def fake_engine():
+    """Command line (executable, args) of the scripted test engine."""
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_engine.py")
+    return sys.executable, [script]
@@ -0,0 +1,122 @@
+"""
+Minimal Gomocup engine used by the client tests.
+
+Plays the empty square closest to the center (or always the
+--fixed square, even when occupied) and prints a few MESSAGE lines
+before every move. Stones are kept with their owner; with --near-own
+the engine plays next to its own stones instead, so its answer
+depends on which side holds each stone.
+
+Usage:
+    python fake_engine.py [--messages N] [--delay SECONDS] [--name NAME] [--fixed X,Y]
+                          [--no-takeback] [--slow-at X,Y] [--near-own]
+"""
+
+import argparse
+import sys
+import time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=2)
+    parser.add_argument("--delay", type=float, default=0.0)
+    parser.add_argument("--name", default="fake")
+    parser.add_argument("--fixed", default=None)
+    parser.add_argument("--no-takeback", action="store_true")
+    parser.add_argument("--slow-at", default=None)  # Only delay with this stone on the board
+    parser.add_argument("--near-own", action="store_true")
+    options = parser.parse_args()
+
+    size = 15
+    stones: dict[tuple[int, int], int] = {}  # 1 own, 2 opponent, 3 wall
+    slow_at = tuple(int(v) for v in options.slow_at.split(",")) if options.slow_at else None
+
+    def say(line: str) -> None:
+        sys.stdout.write(line + "\n")
+        sys.stdout.flush()
+
+    def play(commit: bool = True) -> None:
+        center = size // 2
+        empty = [
+            (x, y)
+            for y in range(size)
+            for x in range(size)
+            if (x, y) not in stones
+        ]
+        if not empty:
+            say("ERROR board is full")
+            return
+        own = [p for p, color in stones.items() if color == 1] if options.near_own else []
+
+        def distance(p, q):
+            return max(abs(p[0] - q[0]), abs(p[1] - q[1]))
+
+        x, y = min(empty, key=lambda p: (
+            min((distance(p, q) for q in own), default=0),
+            distance(p, (center, center)), p[1], p[0],
+        ))
+        if options.fixed:
+            x, y = (int(v) for v in options.fixed.split(","))
+        for depth in range(1, options.messages + 1):
+            say(
+                f"MESSAGE depth {depth}-{depth + 2} ev {depth * 10} n {depth * 100} "
+                f"n/ms 50 tm {depth} pv {chr(ord('a') + x)}{y + 1}"
+            )
+        if options.delay and (slow_at is None or slow_at in stones):
+            time.sleep(options.delay)
+        if commit:
+            stones[x, y] = 1
+        say(f"{x},{y}")
+
+    def read_position() -> None:
+        for line in sys.stdin:
+            line = line.strip()
+            if line.upper() == "DONE":
+                return
+            x, y, color = (int(v) for v in line.split(","))
+            stones[x, y] = color
+
+    for line in sys.stdin:
+        parts = line.strip().split(maxsplit=1)
+        if not parts:
+            continue
+        command = parts[0].upper()
+        arg = parts[1] if len(parts) > 1 else ""
+
+        if command == "START":
+            size = int(arg)
+            stones.clear()
+            say("OK")
+        elif command == "RESTART":
+            stones.clear()
+            say("OK")
+        elif command == "BEGIN":
+            play()
+        elif command == "TURN":
+            x, y = (int(v) for v in arg.split(","))
+            stones[x, y] = 2
+            play()
+        elif command in ("BOARD", "YXBOARD"):
+            stones.clear()
+            read_position()
+            if command == "BOARD":
+                play()
+        elif command == "YXNBEST":
+            play(commit=False)
+        elif command == "TAKEBACK" and not options.no_takeback:
+            x, y = (int(v) for v in arg.split(","))
+            stones.pop((x, y), None)
+            say("OK")
+        elif command == "ABOUT":
+            say(f'name="{options.name}", version="1.0"')
+        elif command == "END":
+            return
+        elif command in ("INFO", "STOP", "YXSTOP"):
+            pass
+        else:
+            say(f"UNKNOWN {command}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Tests for Analyzer.
+
+Tests cover:
+- Completion and input order
+- Multi-line analysis with YXNBEST
+- Lazy input consumption and early exit
+- Positions that time out
+"""
+
+import pytest
+from pygomo import BoardPosition, EnginePool, Move
+from pygomo.client import Analyzer
+
+
+def make_pool(fake_engine, *extra, size=2):
+    executable, args = fake_engine
+    pool = EnginePool(executable, size=size, args=args + ["--messages", "2"] + list(extra))
+    pool.start()
+    return pool
+
+
+@pytest.fixture
+def pool(fake_engine):
+    pool = make_pool(fake_engine)
+    yield pool
+    pool.close()
+
+
+def positions(count):
+    """Positions with one stone on the bottom row, at a different column each."""
+    for index in range(count):
+        position = BoardPosition()
+        position.add_move(Move((index % 15, 0)), BoardPosition.OPPONENT)
+        yield position
+
+
+class TestAnalyzer:
+    """Tests for batch analysis on a pool."""
+
+    def test_completion_order(self, pool):
+        """Test that every position is analyzed exactly once."""
+        results = list(Analyzer(pool, time_ms=100).analyze(positions(20)))
+
+        assert sorted(result.index for result in results) == list(range(20))
+        for result in results:
+            assert result.ok
+            assert result.move == Move("h8")
+            assert result.position.moves[0][0] == Move((result.index % 15, 0))
+            assert result.lines[0].depth == 2
+
+    def test_ordered(self, pool):
+        """Test that ordered mode yields results in input order."""
+        results = list(Analyzer(pool, time_ms=100, ordered=True).analyze(positions(20)))
+        assert [result.index for result in results] == list(range(20))
+
+    def test_nbest(self, pool):
+        """Test that multi-line analysis goes through YXBOARD + YXNBEST."""
+        results = list(Analyzer(pool, nbest=2).analyze(positions(4)))
+        assert all(result.move == Move("h8") for result in results)
+
+        # YXBOARD does not commit the position: the engines still answer BEGIN
+        with pool.acquire() as engine:
+            assert engine.begin().move == Move("h8")
+
+    def test_back_pressure(self, pool):
+        """Test that the input is only read up to the in-flight window."""
+        pulled = []
+
+        def source():
+            for index, position in enumerate(positions(100)):
+                pulled.append(index)
+                yield position
+
+        analysis = Analyzer(pool, max_pending=3).analyze(source())
+        next(analysis)
+        assert len(pulled) <= 4
+        analysis.close()
+        assert len(pulled) < 100
+
+    def test_ordered_back_pressure(self, fake_engine):
+        """Test that results held behind a slow position count against the window."""
+        pool = make_pool(fake_engine, "--delay", "0.5", "--slow-at", "0,0")
+        pulled = []
+
+        def source():
+            for index, position in enumerate(positions(10)):
+                pulled.append(index)
+                yield position
+
+        try:
+            analysis = Analyzer(pool, ordered=True, max_pending=3).analyze(source())
+            assert next(analysis).index == 0  # Slow: the others finish first
+            assert len(pulled) == 3
+            assert [result.index for result in analysis] == list(range(1, 10))
+        finally:
+            pool.close()
+
+    def test_early_exit(self, pool):
+        """Test that leaving the loop returns the engines to the pool."""
+        for _ in Analyzer(pool).analyze(positions(100)):
+            break
+        assert pool.available == pool.size
+
+    def test_restores_turn_time(self, fake_engine):
+        """Test that engines go back to the pool with their own TIMEOUT_TURN."""
+        executable, args = fake_engine
+        with EnginePool(executable, size=2, args=args, options={"timeout_turn": 100}) as pool:
+            list(Analyzer(pool, time_ms=500).analyze(positions(4)))
+            for _ in range(pool.size):
+                with pool.acquire() as engine:
+                    assert engine.settings["TIMEOUT_TURN"] == 100
+
+    def test_timeout(self, fake_engine):
+        """Test that an unanswered position yields result None."""
+        pool = make_pool(fake_engine, "--delay", "0.5", size=1)
+        try:
+            analyzer = Analyzer(pool, time_ms=0, timeout_margin=0.1)
+            (result,) = analyzer.analyze(positions(1))
+            assert not result.ok
+            assert result.move is None and result.lines == []
+        finally:
+            pool.close()
+
+    def test_invalid_arguments(self, pool):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            Analyzer(pool, nbest=0)
+        with pytest.raises(ValueError):
+            Analyzer(pool, workers=4, max_pending=2)
@@ -0,0 +1,254 @@
+"""
+Tests for AsyncEngineClient and the asyncio transport.
+
+Tests cover:
+- Lifecycle commands against a scripted engine
+- Awaiting and iterating thinking commands
+- Driving several engines from one event loop
+"""
+
+import asyncio
+
+import pytest
+from pygomo import AsyncEngineClient, BoardPosition, Move
+from pygomo.transport import AsyncSubprocessTransport, OverflowPolicy
+
+
+def run(coro):
+    """Run a coroutine to completion on a fresh event loop."""
+    return asyncio.run(coro)
+
+
+class TestAsyncTransport:
+    """Tests for AsyncSubprocessTransport."""
+    
+    def test_send_and_route(self, fake_engine):
+        """Test that replies are routed to the expected channels."""
+        executable, args = fake_engine
+        
+        async def main():
+            async with AsyncSubprocessTransport(executable, args) as transport:
+                await transport.send("START 15")
+                assert await transport.router.get("output", timeout=5.0) == "OK"
+                
+                await transport.send("BEGIN")
+                assert await transport.router.wait_any(["coord"], timeout=5.0) == "coord"
+                assert len(transport.router.get_all("message")) == 2
+                assert transport.router.get_nowait("coord") == "7,7"
+        
+        run(main())
+    
+    def test_keep_latest_message(self, fake_engine):
+        """Test overflow policies on the async router."""
+        executable, args = fake_engine
+        
+        async def main():
+            async with AsyncSubprocessTransport(executable, args + ["--messages", "5"]) as transport:
+                router = transport.router
+                router.set_channel_limit("message", 1, OverflowPolicy.KEEP_LATEST)
+                
+                await transport.send("BEGIN")
+                assert await router.wait_any(["coord"], timeout=5.0) == "coord"
+                assert router.get_all("message") == [
+                    "MESSAGE depth 5-7 ev 50 n 500 n/ms 50 tm 5 pv h8"
+                ]
+                assert router.dropped("message") == 4
+        
+        run(main())
+    
+    def test_send_many_empty(self, fake_engine):
+        """Test that sending no lines writes nothing."""
+        executable, args = fake_engine
+        
+        async def main():
+            async with AsyncSubprocessTransport(executable, args) as transport:
+                sent = []
+                
+                async def record(line):
+                    sent.append(line)
+                
+                transport.send = record
+                await transport.send_many([])
+                assert sent == []
+        
+        run(main())
+    
+    def test_eof_closes_router(self, fake_engine):
+        """Test that engine exit wakes waiters with None."""
+        executable, args = fake_engine
+        
+        async def main():
+            async with AsyncSubprocessTransport(executable, args) as transport:
+                await transport.send("END")
+                assert await transport.router.wait_any(["coord"], timeout=5.0) is None
+                assert transport.router.is_closed
+        
+        run(main())
+
+
+class TestAsyncEngineClient:
+    """Tests for AsyncEngineClient commands."""
+    
+    def test_start_and_about(self, fake_engine):
+        """Test START and ABOUT."""
+        executable, args = fake_engine
+        
+        async def main():
+            async with AsyncEngineClient(executable, args=args) as engine:
+                assert await engine.start(15)
+                assert engine.is_started
+                assert 'name="fake"' in await engine.about()
+        
+        run(main())
+    
+    def test_not_connected(self, fake_engine):
+        """Test that commands before connect() fail with a clear error."""
+        executable, args = fake_engine
+        engine = AsyncEngineClient(executable, args=args)
+        
+        with pytest.raises(RuntimeError, match="Not connected"):
+            run(engine.about())
+        with pytest.raises(RuntimeError, match="Not connected"):
+            run(engine.set_position(BoardPosition()))
+    
+    def test_turn_and_begin(self, fake_engine):
+        """Test awaiting thinking commands."""
+        executable, args = fake_engine
+        
+        async def main():
+            async with AsyncEngineClient(executable, args=args) as engine:
+                await engine.start(15)
+                
+                result = await engine.begin()
+                assert result.move == Move("h8")
+                
+                result = await engine.turn("g7")
+                assert result.move.to_tuple() == (7, 6)
+                assert len(result.all_info) == 2
+                assert result.search_info.depth == 2
+        
+        run(main())
+    
+    def test_iterate_search_info(self, fake_engine):
+        """Test that iterating yields each info before the result."""
+        executable, args = fake_engine
+        received = []
+        
+        async def main():
+            async with AsyncEngineClient(executable, args=args + ["--messages", "4"]) as engine:
+                await engine.start(15)
+                
+                search = engine.turn("h8", on_info=received.append)
+                depths = [info.depth async for info in search]
+                result = await search
+                
+                assert depths == [1, 2, 3, 4]
+                assert search.done
+                assert result.all_info == received
+        
+        run(main())
+    
+    def test_collect_last(self, fake_engine):
+        """Test that iteration sees every info while the result keeps the last."""
+        executable, args = fake_engine
+        
+        async def main():
+            async with AsyncEngineClient(executable, args=args + ["--messages", "4"]) as engine:
+                await engine.start(15)
+                
+                search = engine.begin(collect="last")
+                depths = [info.depth async for info in search]
+                result = await search
+                
+                assert depths == [1, 2, 3, 4]
+                assert [info.depth for info in result.all_info] == [4]
+        
+        run(main())
+    
+    def test_board_and_nbest(self, fake_engine):
+        """Test BOARD and YXNBEST."""
+        executable, args = fake_engine
+        
+        async def main():
+            async with AsyncEngineClient(executable, args=args) as engine:
+                await engine.start(15)
+                
+                position = BoardPosition()
+                position.add_move(Move("h8"), 1)
+                result = await engine.board(position)
+                assert result.move.to_tuple() == (6, 6)
+                
+                await engine.set_position(position)
+                result = await engine.nbest(3)
+                assert result.move.to_tuple() == (6, 6)
+        
+        run(main())
+    
+    def test_takeback(self, fake_engine):
+        """Test TAKEBACK replies OK."""
+        executable, args = fake_engine
+        
+        async def main():
+            async with AsyncEngineClient(executable, args=args) as engine:
+                await engine.start(15)
+                await engine.turn("h8")
+                assert await engine.takeback("h8")
+        
+        run(main())
+    
+    def test_stop_command(self, fake_engine):
+        """Test that stop() sends STOP, like EngineClient.stop()."""
+        executable, args = fake_engine
+        
+        async def main():
+            async with AsyncEngineClient(executable, args=args) as engine:
+                await engine.start(15)
+                sent = []
+                send = engine._transport.send
+                
+                async def record(line):
+                    sent.append(line)
+                    await send(line)
+                
+                engine._transport.send = record
+                await engine.stop()
+                assert sent == ["STOP"]
+        
+        run(main())
+    
+    def test_timeout_returns_none(self, fake_engine):
+        """Test that a slow engine gives None on timeout."""
+        executable, args = fake_engine
+        
+        async def main():
+            async with AsyncEngineClient(executable, args=args + ["--delay", "2"]) as engine:
+                await engine.start(15)
+                assert await engine.begin(timeout=0.2) is None
+        
+        run(main())
+    
+    def test_many_engines_concurrently(self, fake_engine):
+        """Test driving several engines from one event loop."""
+        executable, args = fake_engine
+        
+        async def play(engine):
+            await engine.start(15)
+            return await engine.begin()
+        
+        async def main():
+            engines = [
+                AsyncEngineClient(executable, args=args + ["--delay", "0.3"])
+                for _ in range(4)
+            ]
+            try:
+                loop = asyncio.get_running_loop()
+                start = loop.time()
+                results = await asyncio.gather(*(play(engine) for engine in engines))
+                elapsed = loop.time() - start
+            finally:
+                await asyncio.gather(*(engine.quit() for engine in engines))
+            
+            assert all(result.move == Move("h8") for result in results)
+            assert elapsed < 4 * 0.3 + 1.0
+        
+        run(main())
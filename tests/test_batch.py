@@ -0,0 +1,138 @@
+"""
+Tests for the NumPy batch board.
+
+Tests cover:
+- Batch placement semantics (occupied, off-board, alternation)
+- Win detection in all 4 directions, cross-checked against BitBoard
+- Legal move masks
+- Conversion to and from BitBoard
+"""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pygomo.board import BitBoard, BLACK, WHITE, EMPTY
+from pygomo.board.batch import BatchBoard
+from pygomo.protocol.models import Move
+
+
+class TestBatchPlacement:
+    """Test place_many semantics."""
+    
+    def test_colors_alternate(self):
+        """Test that the default color follows each board's move count."""
+        batch = BatchBoard(count=2, size=15)
+        batch.place_many([(7, 7), (0, 0)])
+        batch.place_many([(8, 7), (1, 0)])
+        
+        assert batch.stones[0, 7, 7] == BLACK
+        assert batch.stones[0, 7, 8] == WHITE
+        assert batch.stones[1, 0, 1] == WHITE
+        assert list(batch.move_count) == [2, 2]
+        assert list(batch.current_player) == [BLACK, BLACK]
+    
+    def test_rejects_occupied_and_off_board(self):
+        """Test that invalid placements fail per board."""
+        batch = BatchBoard(count=3, size=15)
+        batch.place_many([(7, 7), (7, 7), (7, 7)])
+        
+        ok = batch.place_many([(7, 7), (15, 0), (-1, 3)])
+        
+        assert list(ok) == [False, False, False]
+        assert list(batch.move_count) == [1, 1, 1]
+    
+    def test_active_mask_and_explicit_color(self):
+        """Test placing only on selected boards with a fixed color."""
+        batch = BatchBoard(count=2, size=15)
+        ok = batch.place_many([(3, 3), (3, 3)], colors=WHITE, active=[False, True])
+        
+        assert list(ok) == [False, True]
+        assert batch.stones[0, 3, 3] == EMPTY
+        assert batch.stones[1, 3, 3] == WHITE
+    
+    def test_wrong_shape_raises(self):
+        """Test that moves must have one (col, row) per board."""
+        batch = BatchBoard(count=2, size=15)
+        with pytest.raises(ValueError):
+            batch.place_many([(3, 3)])
+
+
+class TestBatchWin:
+    """Test check_win_many."""
+    
+    @pytest.mark.parametrize("dx, dy", [(1, 0), (0, 1), (1, 1), (-1, 1)])
+    def test_five_in_each_direction(self, dx, dy):
+        """Test that a five is found in every direction."""
+        batch = BatchBoard(count=2, size=15)
+        for i in range(5):
+            batch.place_many([(7 + dx * i, 3 + dy * i), (7 + dx * i, 3 + dy * i)],
+                             colors=[BLACK, WHITE])
+        
+        assert list(batch.check_win_many()) == [BLACK, WHITE]
+    
+    def test_four_is_not_a_win(self):
+        """Test that four in a row is not reported."""
+        batch = BatchBoard(count=1, size=15)
+        for i in range(4):
+            batch.place_many([(i, 0)], colors=BLACK)
+        assert list(batch.check_win_many()) == [EMPTY]
+    
+    def test_matches_bitboard_on_random_games(self):
+        """Test that results agree with BitBoard on random positions."""
+        rng = random.Random(7)
+        size, count = 9, 64
+        boards = [BitBoard(_size=size) for _ in range(count)]
+        batch = BatchBoard(count=count, size=size)
+        
+        for _ in range(40):
+            moves = []
+            for board in boards:
+                legal = board.get_legal_moves()
+                move = rng.choice(legal)
+                board.place(move)
+                moves.append(move.to_tuple())
+            batch.place_many(moves)
+            
+            expected = []
+            for board in boards:
+                win = board.check_win()
+                expected.append(win.winner if win else EMPTY)
+            # BitBoard reports black first when both have five
+            assert list(batch.check_win_many()) == expected
+
+
+class TestBatchConversion:
+    """Test legal masks and conversion helpers."""
+    
+    def test_legal_mask(self):
+        """Test that the legal mask excludes occupied squares."""
+        batch = BatchBoard(count=1, size=15)
+        batch.place_many([(7, 7)])
+        legal = batch.legal_mask_many()
+        
+        assert legal.shape == (1, 15, 15)
+        assert legal.sum() == 15 * 15 - 1
+        assert not legal[0, 7, 7]
+    
+    def test_round_trip_with_bitboard(self):
+        """Test from_boards / to_board preserve stones."""
+        board = BitBoard(_size=15)
+        for coord in ("h8", "i8", "h9", "j10"):
+            board.place(Move(coord))
+        
+        batch = BatchBoard.from_boards([board, BitBoard(_size=15)])
+        restored = batch.to_board(0)
+        
+        assert list(batch.move_count) == [4, 0]
+        assert restored.hash == board.hash
+        assert restored.get(Move("i8")) == WHITE
+    
+    def test_copy_is_independent(self):
+        """Test that copy does not share the cell array."""
+        batch = BatchBoard(count=1, size=15)
+        clone = batch.copy()
+        batch.place_many([(0, 0)])
+        assert clone.stones[0, 0, 0] == EMPTY
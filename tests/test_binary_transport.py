@@ -0,0 +1,108 @@
+"""
+Tests for the binary-mode subprocess transport.
+
+Tests cover:
+- Chunked line splitting (CRLF, partial lines, split UTF-8)
+- Routing batches through OutputChannelRouter
+- EngineClient over BinarySubprocessTransport
+"""
+
+import os
+
+import pytest
+from pygomo import EngineClient, Move
+from pygomo.transport import BinarySubprocessTransport, ChunkedLineReader, OutputChannelRouter
+
+
+@pytest.fixture
+def pipe():
+    read_fd, write_fd = os.pipe()
+    yield read_fd, write_fd
+    for fd in (read_fd, write_fd):
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+class TestChunkedLineReader:
+    """Tests for ChunkedLineReader."""
+    
+    def test_crlf_and_blank_lines(self, pipe):
+        """Test that CRLF endings are stripped and blank lines dropped."""
+        read_fd, write_fd = pipe
+        os.write(write_fd, b"OK\r\n\r\nMESSAGE hi\r\n7,7\n")
+        os.close(write_fd)
+        
+        reader = ChunkedLineReader(read_fd)
+        assert reader.read_batch() == ["OK", "MESSAGE hi", "7,7"]
+        assert reader.read_batch() is None
+    
+    def test_partial_line_waits_for_newline(self, pipe):
+        """Test that a line split across writes is joined."""
+        read_fd, write_fd = pipe
+        reader = ChunkedLineReader(read_fd)
+        
+        os.write(write_fd, b"7,")
+        os.write(write_fd, b"8\nMESS")
+        assert reader.read_batch() == ["7,8"]
+        
+        os.write(write_fd, b"AGE x\n")
+        assert reader.readline() == "MESSAGE x"
+    
+    def test_utf8_split_across_chunks(self, pipe, monkeypatch):
+        """Test that multi-byte characters split between reads decode."""
+        read_fd, write_fd = pipe
+        monkeypatch.setattr(ChunkedLineReader, "CHUNK_SIZE", 3)
+        
+        os.write(write_fd, "MESSAGE đi\n".encode())
+        os.close(write_fd)
+        
+        reader = ChunkedLineReader(read_fd)
+        assert reader.readline() == "MESSAGE đi"
+        assert reader.readline() == ""
+    
+    def test_unterminated_last_line(self, pipe):
+        """Test that a final line without newline is returned at EOF."""
+        read_fd, write_fd = pipe
+        os.write(write_fd, b"OK\nbye")
+        os.close(write_fd)
+        
+        reader = ChunkedLineReader(read_fd)
+        assert reader.readline() == "OK"
+        assert reader.readline() == "bye"
+        assert reader.readline() == ""
+    
+    def test_router_routes_batches(self, pipe):
+        """Test that the router routes every line of a batch."""
+        read_fd, write_fd = pipe
+        router = OutputChannelRouter(ChunkedLineReader(read_fd))
+        
+        os.write(write_fd, b"MESSAGE a\r\nMESSAGE b\r\n7,7\r\nOK\r\n")
+        assert router.wait_any(["coord"], timeout=5.0) == "coord"
+        assert router.get_all("message") == ["MESSAGE a", "MESSAGE b"]
+        assert router.get_nowait("coord") == "7,7"
+        assert router.get("output", timeout=1.0) == "OK"
+        
+        os.close(write_fd)
+        assert router.wait_any(["coord"], timeout=5.0) is None
+        assert router.is_closed
+
+
+class TestBinarySubprocessTransport:
+    """Tests for BinarySubprocessTransport with a real process."""
+    
+    def test_engine_client(self, fake_engine):
+        """Test a game through EngineClient over binary pipes."""
+        executable, args = fake_engine
+        
+        with EngineClient(executable, transport_class=BinarySubprocessTransport, args=args) as engine:
+            assert engine.start(15)
+            assert 'name="fake"' in engine.about()
+            
+            result = engine.begin()
+            assert result.move == Move("h8")
+            assert len(result.all_info) == 2
+            
+            result = engine.turn("g7")
+            assert result.move.to_tuple() == (7, 6)
@@ -9,8 +9,10 @@ Tests cover:
 - Multi-size support
 """
 
+import random
+
 import pytest
-from pygomo.board import BitBoard, BLACK, WHITE, EMPTY
+from pygomo.board import BitBoard, BLACK, WHITE, EMPTY, get_line_masks
 from pygomo.protocol.models import Move
 
 
@@ -286,6 +288,76 @@ class TestZobristHashing:
         assert board1.hash == board2.hash
 
 
+class TestCanonicalHash:
+    """Test symmetry-canonical Zobrist hashing."""
+    
+    @staticmethod
+    def _transforms(size):
+        """The 8 dihedral maps on (col, row)."""
+        n = size - 1
+        return [
+            lambda c, r: (c, r),
+            lambda c, r: (n - r, c),
+            lambda c, r: (n - c, n - r),
+            lambda c, r: (r, n - c),
+            lambda c, r: (n - c, r),
+            lambda c, r: (c, n - r),
+            lambda c, r: (r, c),
+            lambda c, r: (n - r, n - c),
+        ]
+    
+    @pytest.mark.parametrize("size", [15, 20])
+    def test_symmetric_positions_share_canonical_hash(self, size):
+        """Test all 8 rotations/reflections of random positions."""
+        rng = random.Random(size)
+        for _ in range(10):
+            moves = [
+                (rng.randrange(size), rng.randrange(size)) for _ in range(12)
+            ]
+            
+            hashes = set()
+            canonical = set()
+            for transform in self._transforms(size):
+                board = BitBoard(_size=size)
+                for col, row in moves:
+                    board.place(Move(transform(col, row)))
+                hashes.add(board.hash)
+                canonical.add(board.canonical_hash)
+            
+            assert len(canonical) == 1
+            assert canonical.pop() == min(hashes)
+    
+    def test_identity_lane_is_plain_hash(self, empty_board):
+        """Test that the identity symmetry hash equals the plain hash."""
+        empty_board.place(Move("c4"))
+        empty_board.place(Move("h8"))
+        sym = empty_board._zobrist.symmetric_hashes(empty_board._sym_hash)
+        
+        assert sym[0] == empty_board.hash
+        assert len(set(sym)) == 8
+    
+    def test_undo_and_copy_keep_canonical_hash(self, empty_board):
+        """Test incremental updates through undo and copy."""
+        start = empty_board.canonical_hash
+        empty_board.place(Move("c3"))
+        clone = empty_board.copy()
+        
+        assert clone.canonical_hash == empty_board.canonical_hash
+        empty_board.undo()
+        assert empty_board.canonical_hash == start
+    
+    def test_asymmetric_positions_differ(self):
+        """Test that non-symmetric positions keep distinct hashes."""
+        board1 = BitBoard(_size=15)
+        board2 = BitBoard(_size=15)
+        board1.place(Move("h8"))
+        board1.place(Move("i8"))
+        board2.place(Move("h8"))
+        board2.place(Move("j8"))
+        
+        assert board1.canonical_hash != board2.canonical_hash
+
+
 class TestCopy:
     """Test board copying."""
     
@@ -358,3 +430,202 @@ class TestStringRepresentation:
         r = repr(empty_board)
         assert "BitBoard" in r
         assert "size=15" in r
+
+
+class TestLineMasks:
+    """Test precomputed five-in-a-row window tables."""
+    
+    def test_tables_are_cached_per_size(self):
+        """Test that boards of the same size share one table."""
+        assert get_line_masks(15) is get_line_masks(15)
+        assert get_line_masks(15) is not get_line_masks(19)
+        assert BitBoard(_size=15)._lines is get_line_masks(15)
+    
+    def test_window_counts(self):
+        """Test number of windows through corner and center squares."""
+        lines = get_line_masks(15)
+        corner = lines.through[0]
+        center = lines.through[7 * 15 + 7]
+        
+        # Corner: one window each horizontally, vertically and diagonally
+        assert [len(w) for w in corner] == [1, 1, 1, 0]
+        # Center: five windows in every direction
+        assert [len(w) for w in center] == [5, 5, 5, 5]
+    
+    def test_windows_do_not_wrap(self):
+        """Test that horizontal windows never span two rows."""
+        lines = get_line_masks(15)
+        for window in lines.five[0]:
+            if window:
+                rows = {i // 15 for i in range(225) if window >> i & 1}
+                assert len(rows) == 1
+    
+    def test_check_win_at_move_returns_line(self, empty_board):
+        """Test that the winning line holds the five stones."""
+        for i in range(5):
+            empty_board.place(Move((3 + i, 3 + i)))
+            if i < 4:
+                empty_board.place(Move((0, i)))
+        
+        win = empty_board.check_win(Move((5, 5)))
+        assert win is not None
+        assert win.direction == "diagonal"
+        assert sorted(m.to_tuple() for m in win.line) == [
+            (3 + i, 3 + i) for i in range(5)
+        ]
+    
+    def test_check_win_at_move_anti_diagonal(self, empty_board):
+        """Test anti-diagonal win through a middle stone."""
+        for i in range(5):
+            empty_board.place(Move((11 - i, 3 + i)))
+            if i < 4:
+                empty_board.place(Move((0, i)))
+        
+        win = empty_board.check_win(Move((9, 5)))
+        assert win is not None
+        assert win.direction == "anti-diagonal"
+        assert len(win.line) == 5
+    
+    def test_check_win_at_empty_or_invalid(self, empty_board):
+        """Test that empty and off-board squares never win."""
+        assert empty_board.check_win(Move("h8")) is None
+        assert empty_board.check_win(Move((20, 20))) is None
+    
+    def test_check_win_at_edge(self, empty_board):
+        """Test win along the board edge."""
+        for i in range(5):
+            empty_board.place(Move((14, 10 + i)))
+            if i < 4:
+                empty_board.place(Move((0, i)))
+        
+        win = empty_board.check_win(Move((14, 14)))
+        assert win is not None
+        assert win.direction == "vertical"
+
+
+class TestEdgeWrap:
+    """Test that runs crossing the board edge are never a win."""
+    
+    def _place_black(self, board, squares):
+        """Place black stones with scattered white replies."""
+        filler = iter((c, r) for r in range(board.size - 1, 0, -1)
+                      for c in range(0, board.size, 2))
+        for sq in squares:
+            board.place(Move(sq), BLACK)
+            board.place(Move(next(filler)), WHITE)
+    
+    @pytest.mark.parametrize("size", [15, 19, 20])
+    def test_horizontal_wrap_is_not_five(self, size):
+        """Test run from right edge of one row to left edge of next."""
+        board = BitBoard(_size=size)
+        self._place_black(board, [(size - 3, 0), (size - 2, 0), (size - 1, 0), (0, 1), (1, 1)])
+        assert board.check_win() is None
+    
+    @pytest.mark.parametrize("size", [15, 19, 20])
+    def test_diagonal_wrap_is_not_five(self, size):
+        """Test diagonal run that wraps past the last column."""
+        board = BitBoard(_size=size)
+        self._place_black(board, [(size - 2, 0), (size - 1, 1), (0, 3), (1, 4), (2, 5)])
+        assert board.check_win() is None
+    
+    @pytest.mark.parametrize("size", [15, 19, 20])
+    def test_anti_diagonal_wrap_is_not_five(self, size):
+        """Test anti-diagonal run that wraps past column A."""
+        board = BitBoard(_size=size)
+        self._place_black(board, [(1, 0), (0, 1), (size - 1, 1), (size - 2, 2), (size - 3, 3)])
+        assert board.check_win() is None
+    
+    def test_full_board_win_returns_exact_line(self):
+        """Test that the full-board scan reports the real five."""
+        board = BitBoard(_size=20)
+        self._place_black(board, [(15 + i, 2) for i in range(5)])
+        win = board.check_win()
+        assert win is not None
+        assert win.direction == "horizontal"
+        assert [m.to_tuple() for m in win.line] == [(15 + i, 2) for i in range(5)]
+
+
+class TestCandidateMoves:
+    """Test bit-iteration move generation."""
+    
+    def test_legal_moves_in_index_order(self, empty_board):
+        """Test that legal moves keep row-major order and skip stones."""
+        empty_board.place(Move((0, 0)))
+        legal = empty_board.get_legal_moves()
+        
+        assert legal[0] == Move((1, 0))
+        assert legal[-1] == Move((14, 14))
+        assert Move((0, 0)) not in legal
+    
+    def test_empty_board_candidate_is_center(self, empty_board):
+        """Test that the center is the only candidate on an empty board."""
+        assert empty_board.get_candidate_moves() == [Move((7, 7))]
+    
+    def test_candidates_around_single_stone(self, empty_board):
+        """Test the 5x5 square around one stone."""
+        empty_board.place(Move("h8"))
+        candidates = empty_board.get_candidate_moves(radius=2)
+        
+        assert len(candidates) == 5 * 5 - 1
+        assert Move("h8") not in candidates
+        assert Move("f6") in candidates
+        assert Move("e8") not in candidates
+    
+    def test_candidates_clipped_at_edge(self, empty_board):
+        """Test that candidates never wrap to the other side of the board."""
+        empty_board.place(Move((14, 5)))
+        candidates = empty_board.get_candidate_moves(radius=1)
+        
+        assert sorted(m.to_tuple() for m in candidates) == [
+            (13, 4), (13, 5), (13, 6), (14, 4), (14, 6),
+        ]
+    
+    def test_candidates_match_brute_force(self, empty_board_19):
+        """Test dilation against a direct distance check."""
+        board = empty_board_19
+        for coord in ("a1", "s19", "j10", "k12", "a10"):
+            board.place(Move(coord))
+        
+        stones = board.get_move_history()
+        expected = [
+            Move((col, row))
+            for row in range(19)
+            for col in range(19)
+            if board.is_empty(Move((col, row)))
+            and any(max(abs(col - s.col), abs(row - s.row)) <= 2 for s in stones)
+        ]
+        assert board.get_candidate_moves(radius=2) == expected
+
+
+class TestIndexOperations:
+    """Test raw square-index operations."""
+    
+    def test_place_index_matches_place(self, empty_board):
+        """Test that index-based placement matches Move-based placement."""
+        other = BitBoard(_size=15)
+        for col, row in [(7, 7), (8, 7), (7, 8)]:
+            assert empty_board.place_index(row * 15 + col) is True
+            other.place(Move((col, row)))
+        
+        assert empty_board.hash == other.hash
+        assert empty_board.get_move_history() == other.get_move_history()
+        assert empty_board.get_index(7 * 15 + 8) == WHITE
+        assert empty_board.place_index(7 * 15 + 7) is False
+    
+    def test_remove_index_and_undo(self, empty_board):
+        """Test index-based removal keeps history and hash in sync."""
+        start_hash = empty_board.hash
+        empty_board.place_index(112)
+        empty_board.place_index(113)
+        
+        assert empty_board.remove_index(113) is True
+        assert empty_board.remove_index(113) is False
+        assert empty_board.last_move == Move("h8")
+        assert empty_board.undo() == Move("h8")
+        assert empty_board.hash == start_hash
+    
+    def test_generated_moves_are_interned(self, empty_board):
+        """Test that boards return shared Move instances."""
+        empty_board.place(Move("h8"))
+        assert empty_board.last_move is Move.of(7, 7)
+        assert empty_board.get_legal_moves()[0] is Move.of(0, 0)
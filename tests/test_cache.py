@@ -0,0 +1,200 @@
+"""
+Tests for AnalysisCache.
+
+Tests cover:
+- Position keys and serialization
+- Cached BOARD and YXNBEST searches on EngineClient
+- Keys that change with settings
+- Persistence across cache instances
+"""
+
+import sqlite3
+
+import pytest
+from pygomo import BoardPosition, EngineClient, GomocupProtocol, Move, SearchInfo, Evaluate, PlayResult
+from pygomo.board import BitBoard, BLACK, WHITE
+from pygomo.client import AnalysisCache
+from pygomo.command import HookType
+
+
+def position(*moves):
+    """Position with alternating own / opponent stones."""
+    result = BoardPosition()
+    for index, move in enumerate(moves):
+        result.add_move(Move(move), BoardPosition.SELF if index % 2 == 0 else BoardPosition.OPPONENT)
+    return result
+
+
+@pytest.fixture
+def engine(fake_engine):
+    """Started fake engine with an in-memory cache; records commands sent."""
+    executable, args = fake_engine
+    cache = AnalysisCache()
+    engine = EngineClient(executable, args=args + ["--messages", "2"], cache=cache)
+    engine.start(15)
+    engine.sent = []
+
+    @engine.hooks.on(HookType.PRE_EXECUTE)
+    def record(context, _):
+        engine.sent.append(context.command)
+
+    yield engine
+    engine.quit()
+    cache.close()
+
+
+class TestAnalysisCache:
+    """Tests for keys and storage."""
+
+    def test_position_hash(self):
+        """Test that the key is the board hash with own stones as black."""
+        board = BitBoard(_size=15)
+        board.place(Move("h8"), BLACK)
+        board.place(Move("i9"), WHITE)
+        key = AnalysisCache.position_hash(position("h8", "i9"))
+        assert key % (1 << 64) == board.hash
+        assert key != AnalysisCache.position_hash(position("i9", "h8"))
+
+    def test_walls_not_cached(self):
+        """Test that positions with walls have no key."""
+        walled = position("h8")
+        walled.add_move(Move("a1"), BoardPosition.WALL)
+        assert AnalysisCache.key(walled, "BOARD", "engine", {}) is None
+
+    def test_round_trip(self):
+        """Test that a result keeps its move and the last info of each line."""
+        infos = [
+            SearchInfo(depth=depth, eval=Evaluate(str(depth)), pv=[Move("h8")], multipv=pv)
+            for depth in (1, 2) for pv in (1, 2)
+        ]
+        result = PlayResult(Move("h8"), search_info=infos[-1], all_info=infos)
+        key = AnalysisCache.key(position("a1"), "YXNBEST 2", "engine", {"TIMEOUT_TURN": 100})
+
+        with AnalysisCache() as cache:
+            cache.put(key, result)
+            cached = cache.get(key)
+            assert len(cache) == 1
+
+        assert cached.move == Move("h8")
+        assert [(i.depth, i.multipv) for i in cached.all_info] == [(2, 1), (2, 2)]
+        assert cached.search_info == infos[-1]
+        assert cached.eval.raw_value == "2"
+
+    def test_malformed_info_skipped(self):
+        """Test that infos that cannot be read are left out of the stored result."""
+        protocol = GomocupProtocol()
+        good = protocol.parse_search_info("MESSAGE depth 5-7 ev 30 n 10 pv h8", lazy=True)
+        bad = protocol.parse_search_info("MESSAGE depth 6-8 ev 35 n 10 pv none", lazy=True)
+        key = AnalysisCache.key(position("a1"), "BOARD", "engine", {})
+
+        with AnalysisCache() as cache:
+            cache.put(key, PlayResult(Move("h8"), search_info=bad, all_info=[good, bad]))
+            cached = cache.get(key)
+
+        assert cached.search_info is None
+        assert [(info.depth, info.pv) for info in cached.all_info] == [(5, [Move("h8")])]
+
+    def test_persistent(self, tmp_path):
+        """Test that results survive reopening the database file."""
+        path = str(tmp_path / "analysis.db")
+        key = AnalysisCache.key(position("h8"), "BOARD", "engine", {})
+        with AnalysisCache(path) as cache:
+            cache.put(key, PlayResult(Move("i9")))
+        with AnalysisCache(path) as cache:
+            assert cache.get(key).move == Move("i9")
+            assert cache.get(AnalysisCache.key(position("h9"), "BOARD", "engine", {})) is None
+            assert (cache.hits, cache.misses) == (1, 1)
+
+
+class TestCachedEngine:
+    """Tests for EngineClient searches through a cache."""
+
+    def test_board_cached(self, engine):
+        """Test that a repeated BOARD search is not sent to the engine."""
+        first = engine.board(position("a1", "b2"))
+        streamed = []
+        second = engine.board(position("a1", "b2"), on_info=streamed.append)
+
+        assert engine.sent == ["BOARD", "BOARD"]  # Search, then YXBOARD
+        assert engine.cache.hits == 1
+        assert second.move == first.move
+        assert second.search_info.depth == first.search_info.depth == 2
+        assert [info.depth for info in streamed] == [2]
+
+    def test_turn_after_cached_board(self, engine, fake_engine):
+        """Test that a cached board() leaves the engine ready for turn()."""
+        executable, args = fake_engine
+        with EngineClient(executable, args=args) as reference:
+            reference.start(15)
+            reference.board(position("a1"))
+            expected = reference.turn("a2")
+
+        engine.board(position("a1"))
+        engine.board(position("h8"))
+        engine.board(position("a1"))  # Cached
+        assert engine.cache.hits == 1
+        assert engine.turn("a2").move == expected.move
+
+    def test_failing_callback(self, engine):
+        """Test that a raising on_info does not fail a cached search."""
+        first = engine.board(position("a1"))
+
+        def on_info(info):
+            raise RuntimeError("callback failed")
+
+        assert engine.board(position("a1"), on_info=on_info).move == first.move
+
+    def test_failed_write(self, engine, monkeypatch):
+        """Test that a failing cache write does not fail the search."""
+        def put(key, result):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(engine.cache, "put", put)
+        assert engine.board(position("a1")).move == Move("h8")
+
+    def test_settings_change_key(self, engine):
+        """Test that time budget and rule are part of the key."""
+        engine.board(position("a1"))
+        engine.set_time(turn_time_ms=100)
+        engine.board(position("a1"))
+        engine.set_rule(4)
+        engine.board(position("a1"))
+        engine.set_rule(4)
+        engine.board(position("a1"))
+        assert (engine.cache.hits, engine.cache.misses) == (1, 3)
+        assert len(engine.cache) == 3
+
+    def test_time_left_not_keyed(self, engine):
+        """Test that the clock of a timed game does not change the key."""
+        engine.set_time(time_left_ms=60000)
+        engine.board(position("a1"))
+        engine.set_time(time_left_ms=59000)
+        engine.board(position("a1"))
+        assert engine.cache.hits == 1
+
+    def test_nbest_cached(self, engine):
+        """Test that YXNBEST on a YXBOARD position is cached per count."""
+        engine.board(position("a1"), start_thinking=False)
+        first = engine.nbest(2)
+        engine.board(position("a1"), start_thinking=False)
+        assert engine.nbest(2).move == first.move
+        engine.nbest(3)
+        assert engine.sent.count("YXNBEST") == 2
+
+    def test_nbest_after_turn(self, engine):
+        """Test that YXNBEST after TURN is keyed on the stones the engine holds."""
+        engine.board(position("a1"), start_thinking=False)
+        engine.turn("b2")
+        first = engine.nbest(2)
+        assert engine.nbest(2).move == first.move
+        assert engine.sent.count("YXNBEST") == 1
+
+    def test_nbest_unknown_not_cached(self, engine):
+        """Test that YXNBEST is not cached once the position is unknown."""
+        engine.board(position("a1"), start_thinking=False)
+        engine.turn("b2")
+        engine.takeback("o15")  # Not the last move
+        engine.nbest(2)
+        engine.nbest(2)
+        assert engine.sent.count("YXNBEST") == 2
+        assert len(engine.cache) == 0
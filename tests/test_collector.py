@@ -0,0 +1,170 @@
+"""
+Tests for SearchInfoCollector and the `collect` option.
+
+Tests cover:
+- "all", "per_depth" and "last" coalescing
+- Deferred parsing and malformed lines
+- collect modes through EngineClient
+"""
+
+import pytest
+from pygomo import EngineClient, GomocupProtocol, Move, SearchInfo
+from pygomo.command.handlers import SearchInfoCollector
+
+
+def indexed(multipv, depth, ev, pv="h8 i9"):
+    """MESSAGE line in the indexed (multipv) format."""
+    return f"MESSAGE ({multipv}) {ev} | {depth}-{depth + 4} | {pv}"
+
+
+LINES = [
+    indexed(1, 5, 10),
+    indexed(2, 5, -20),
+    indexed(1, 6, 15),
+    indexed(2, 6, -25),
+    indexed(1, 6, 18, "j10 k11"),
+]
+
+
+def collect(mode, lines=LINES, on_info=None):
+    collector = SearchInfoCollector(GomocupProtocol(), mode, on_info)
+    for line in lines:
+        collector.add(line)
+    return collector
+
+
+class TestSearchInfoCollector:
+    """Tests for the collector modes."""
+    
+    def test_all_keeps_everything(self):
+        """Test that "all" keeps every info in order."""
+        collector = collect("all")
+        assert [info.eval.raw_value for info in collector.history] == [
+            "10", "-20", "15", "-25", "18",
+        ]
+        assert collector.count == 5
+    
+    def test_per_depth(self):
+        """Test that "per_depth" keeps the latest info per multipv and depth."""
+        history = collect("per_depth").history
+        assert [(i.multipv, i.depth, i.eval.raw_value) for i in history] == [
+            (1, 5, "10"), (2, 5, "-20"), (1, 6, "18"), (2, 6, "-25"),
+        ]
+    
+    def test_last_per_multipv(self):
+        """Test that "last" keeps one info per multipv line."""
+        collector = collect("last")
+        assert [(i.multipv, i.eval.raw_value) for i in collector.history] == [
+            (1, "18"), (2, "-25"),
+        ]
+        assert collector.latest.pv == [Move("j10"), Move("k11")]
+    
+    def test_latest_is_most_recent_line(self):
+        """Test that latest follows arrival order, not multipv."""
+        collector = collect("last", LINES[:4])
+        assert (collector.latest.multipv, collector.latest.depth) == (2, 6)
+    
+    def test_infos_built_once(self):
+        """Test that deferred infos are built once and then reused."""
+        collector = collect("last")
+        assert collector.latest is collector.latest
+        assert collector.history[0] is collector.latest
+    
+    def test_on_info_gets_every_line(self):
+        """Test that the callback sees every line, even when coalescing."""
+        received = []
+        collector = collect("last", on_info=received.append)
+        assert len(received) == 5
+        assert all(isinstance(info, SearchInfo) for info in received)
+        assert len(collector.history) == 2
+    
+    def test_malformed_last_line(self):
+        """Test that a malformed final line falls back to the last valid info."""
+        class Protocol(GomocupProtocol):
+            def parse_message(self, data):
+                if "broken" in data:
+                    raise ValueError("malformed line")
+                return super().parse_message(data)
+        
+        collector = SearchInfoCollector(Protocol(), "all")
+        for line in LINES + ["MESSAGE broken"]:
+            collector.add(line)
+        assert collector.latest.eval.raw_value == "18"
+        assert len(collector.history) == 5
+    
+    @pytest.mark.parametrize("mode", ["all", "per_depth", "last"])
+    def test_invalid_pv_skipped(self, mode):
+        """Test that a line whose PV is not a move does not replace a valid info."""
+        collector = collect(mode, [LINES[0], "MESSAGE depth 6-8 ev 35 n 10 pv none"])
+        result = collector.play_result("7,7")
+        assert result.pv == [Move("h8"), Move("i9")]
+        assert [info.depth for info in result.all_info] == [5]
+    
+    def test_failing_callback(self):
+        """Test that an exception in the callback does not stop collection."""
+        def on_info(info):
+            raise RuntimeError("callback failed")
+        
+        collector = collect("all", on_info=on_info)
+        assert len(collector.history) == 5
+    
+    @pytest.mark.parametrize("mode", ["all", "last"])
+    def test_play_result(self, mode):
+        """Test PlayResult construction."""
+        result = collect(mode).play_result("7,7")
+        assert result.move == Move("h8")
+        assert result.search_info.eval.raw_value == "18"
+    
+    def test_empty(self):
+        """Test a search without MESSAGE lines."""
+        result = collect("last", []).play_result("7,7")
+        assert result.search_info is None
+        assert result.all_info == []
+    
+    def test_unknown_mode(self):
+        """Test that unknown modes are rejected."""
+        with pytest.raises(ValueError):
+            SearchInfoCollector(GomocupProtocol(), "first")
+
+
+class TestCollectOption:
+    """Tests for collect modes through EngineClient."""
+    
+    def test_modes(self, fake_engine):
+        """Test that the collect option shapes all_info."""
+        executable, args = fake_engine
+        
+        with EngineClient(executable, args=args + ["--messages", "4"]) as engine:
+            engine.start(15)
+            
+            result = engine.begin(collect="last")
+            assert [info.depth for info in result.all_info] == [4]
+            assert result.search_info.depth == 4
+            
+            result = engine.turn("g7", collect="per_depth")
+            assert [info.depth for info in result.all_info] == [1, 2, 3, 4]
+            
+            result = engine.turn("i9")
+            assert len(result.all_info) == 4
+    
+    def test_failing_callback(self, fake_engine):
+        """Test that a failing on_info callback does not abort the search."""
+        executable, args = fake_engine
+        
+        def on_info(info):
+            raise RuntimeError("callback failed")
+        
+        with EngineClient(executable, args=args) as engine:
+            engine.start(15)
+            assert engine.begin(on_info=on_info).move == Move("h8")
+            assert engine.turn("g7").move == Move((7, 6))
+    
+    def test_invalid_mode(self, fake_engine):
+        """Test that an invalid mode raises before sending."""
+        executable, args = fake_engine
+        
+        with EngineClient(executable, args=args) as engine:
+            engine.start(15)
+            with pytest.raises(ValueError):
+                engine.begin(collect="first")
+            assert engine.begin().move == Move("h8")
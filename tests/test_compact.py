@@ -0,0 +1,119 @@
+"""
+Tests for CompactBitBoard.
+
+Tests cover:
+- Slotted instances (no __dict__)
+- O(1) copy with shared, persistent history
+- Parity with BitBoard on random games
+"""
+
+import random
+
+import pytest
+from pygomo.board import BitBoard, CompactBitBoard, BLACK, WHITE, EMPTY
+from pygomo.protocol.models import Move
+
+
+class TestCompactBasics:
+    """Test basic CompactBitBoard operations."""
+    
+    def test_has_no_instance_dict(self):
+        """Test that instances are fully slotted."""
+        board = CompactBitBoard()
+        assert not hasattr(board, "__dict__")
+        with pytest.raises(AttributeError):
+            board.extra = 1
+    
+    def test_place_get_remove(self):
+        """Test placing, reading and removing stones."""
+        board = CompactBitBoard(size=15)
+        assert board.place(Move("h8")) is True
+        assert board.place(Move("h8")) is False
+        assert board.place(Move((20, 20))) is False
+        assert board.get(Move("h8")) == BLACK
+        assert board.current_player == WHITE
+        assert board.last_move == Move("h8")
+        
+        assert board.remove(Move("h8")) is True
+        assert board.get(Move("h8")) == EMPTY
+        assert board.move_count == 0
+        assert board.last_move is None
+    
+    def test_undo_restores_hash(self):
+        """Test that undo walks back history and hash."""
+        board = CompactBitBoard()
+        empty_hash = board.hash
+        board.place(Move("h8"))
+        board.place(Move("i9"))
+        
+        assert board.undo() == Move("i9")
+        assert board.undo() == Move("h8")
+        assert board.undo() is None
+        assert board.hash == empty_hash
+    
+    def test_check_win(self):
+        """Test five in a row with and without a move hint."""
+        board = CompactBitBoard()
+        for col in range(5):
+            board.place(Move((col, 7)), BLACK)
+        
+        win = board.check_win(Move((2, 7)))
+        assert win.winner == BLACK
+        assert win.direction == "horizontal"
+        assert board.check_win().line == [Move((c, 7)) for c in range(5)]
+
+
+class TestCompactCopy:
+    """Test O(1) copy with a shared history."""
+    
+    def test_copy_shares_history(self):
+        """Test that copy shares history nodes instead of duplicating."""
+        board = CompactBitBoard()
+        for move in ("h8", "i8", "h7"):
+            board.place(Move(move))
+        
+        child = board.copy()
+        assert child._history is board._history
+    
+    def test_copies_are_independent(self):
+        """Test that moves and undos on a copy do not affect the original."""
+        board = CompactBitBoard()
+        board.place(Move("h8"))
+        board.place(Move("i8"))
+        
+        child = board.copy()
+        child.undo()
+        child.place(Move("j9"))
+        child.place(Move("k10"))
+        
+        assert board.get_move_history() == [Move("h8"), Move("i8")]
+        assert child.get_move_history() == [Move("h8"), Move("j9"), Move("k10")]
+        assert board.get(Move("j9")) == EMPTY
+        assert board.move_count == 2
+
+
+class TestCompactParity:
+    """Test CompactBitBoard against BitBoard."""
+    
+    def test_matches_bitboard_on_random_games(self):
+        """Test identical state after random place/undo sequences."""
+        rng = random.Random(11)
+        for size in (15, 20):
+            board = BitBoard(_size=size)
+            compact = CompactBitBoard(size=size)
+            for _ in range(150):
+                if board.move_count and rng.random() < 0.3:
+                    assert compact.undo() == board.undo()
+                else:
+                    move = Move((rng.randrange(size), rng.randrange(size)))
+                    assert compact.place(move) == board.place(move)
+                
+                assert compact.hash == board.hash
+                assert compact.canonical_hash == board.canonical_hash
+                assert compact.get_move_history() == board.get_move_history()
+                assert compact.check_win() == board.check_win()
+            
+            assert compact.get_legal_moves() == board.get_legal_moves()
+            assert compact.get_candidate_moves() == board.get_candidate_moves()
+            assert list(compact.stones(WHITE)) == list(board.stones(WHITE))
+            assert str(compact) == str(board)
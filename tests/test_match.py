@@ -0,0 +1,184 @@
+"""
+Tests for the match runner.
+
+Tests cover:
+- Single games: adjudication, openings, time control
+- Opening and color assignment
+- Parallel matches, streaming and stop
+"""
+
+import pytest
+from pygomo import EngineClient, Move, BLACK, WHITE
+from pygomo.board import RenjuBitBoard
+from pygomo.command import HookType
+from pygomo.exceptions import EngineError
+from pygomo.match import (
+    EngineConfig,
+    MatchRunner,
+    Opening,
+    TimeControl,
+    new_board,
+    play_game,
+    RULE_STANDARD,
+    RULE_RENJU,
+)
+
+
+@pytest.fixture
+def engines(fake_engine):
+    """Black and white fake engines, connected."""
+    executable, args = fake_engine
+    black = EngineClient(executable, args=args + ["--messages", "1"])
+    white = EngineClient(executable, args=args + ["--messages", "1"])
+    yield black, white
+    black.quit()
+    white.quit()
+
+
+def configs(fake_engine, *extra):
+    executable, args = fake_engine
+    return (
+        EngineConfig(executable, name="A", args=args + list(extra)),
+        EngineConfig(executable, name="B", args=args + list(extra)),
+    )
+
+
+class TestPlayGame:
+    """Tests for one game between two engines."""
+
+    def test_game_to_five(self, engines):
+        """Test a game that ends with five in a row."""
+        black, white = engines
+        result = play_game(black, white, board_size=9)
+
+        assert result.reason == "five"
+        assert result.winner in (BLACK, WHITE)
+        board = new_board(board_size=9)
+        for move in result.moves:
+            assert board.place(move)
+        assert board.check_win(result.moves[-1]).winner == result.winner
+
+    def test_opening(self, engines):
+        """Test that the opening is played first and BOARD syncs both engines."""
+        black, white = engines
+        opening = Opening.parse("a1 i9 a9")
+        result = play_game(black, white, opening, board_size=9)
+        assert result.moves[:3] == opening.moves
+        assert len(result.moves) > 3
+
+    def test_illegal_opening(self, engines):
+        """Test that an opening with a repeated stone is rejected."""
+        black, white = engines
+        with pytest.raises(ValueError):
+            play_game(black, white, Opening.parse("h8 h8"))
+
+    def test_forbidden_opening(self, engines):
+        """Test that a Renju opening with a forbidden black stone is rejected."""
+        black, white = engines
+        opening = Opening.parse("h6 a1 h7 a3 f8 a5 g8 a7 h8")  # Double three
+        with pytest.raises(ValueError, match="h8"):
+            play_game(black, white, opening, rule=RULE_RENJU)
+
+    def test_illegal_move_loses(self, fake_engine, engines):
+        """Test that playing on an occupied square loses."""
+        executable, args = fake_engine
+        _, white = engines
+        with EngineClient(executable, args=args + ["--fixed", "4,4"]) as black:
+            result = play_game(black, white, board_size=9)
+        assert (result.winner, result.reason) == (WHITE, "illegal")
+        assert result.moves[-1] == Move((4, 4))
+
+    def test_time_forfeit(self, fake_engine, engines):
+        """Test that a move over the turn limit loses on time."""
+        executable, args = fake_engine
+        _, white = engines
+        with EngineClient(executable, args=args + ["--delay", "0.3"]) as black:
+            result = play_game(
+                black, white, board_size=9,
+                time_control=TimeControl(turn_ms=50, margin_ms=0),
+            )
+            assert not black.is_connected  # Still thinking, so disconnected
+        assert (result.winner, result.reason) == (WHITE, "time")
+
+    def test_time_left_sent(self, engines):
+        """Test that INFO TIME_LEFT counts down before every move."""
+        black, white = engines
+        sent = []
+
+        @black.hooks.on(HookType.PRE_EXECUTE)
+        def record(context, _):
+            if context.command == "INFO" and context.args[0] == "TIME_LEFT":
+                sent.append(context.args[1])
+
+        result = play_game(
+            black, white, board_size=9, max_moves=10,
+            time_control=TimeControl(match_ms=60000, increment_ms=0),
+        )
+        assert result.reason == "max_moves"
+        assert len(sent) == 5
+        assert sent[0] == 60000
+        assert sent == sorted(sent, reverse=True)
+
+    def test_should_stop(self, engines):
+        """Test that a stopped game is abandoned."""
+        black, white = engines
+        assert play_game(black, white, should_stop=lambda: True) is None
+
+
+class TestBoards:
+    """Tests for rule-specific adjudication boards."""
+
+    def test_rule_boards(self):
+        """Test the board created for each rule."""
+        assert isinstance(new_board(RULE_RENJU), RenjuBitBoard)
+
+        board = new_board(RULE_STANDARD, 9)
+        for col in (0, 1, 2, 4, 5):
+            board.place(Move((col, 0)), BLACK)
+        board.place(Move((3, 0)), BLACK)
+        assert board.check_win(Move((3, 0))) is None  # Overline
+        assert new_board(board_size=9).copy().size == 9
+
+
+class TestMatchRunner:
+    """Tests for parallel matches."""
+
+    def test_colors_alternate(self, fake_engine):
+        """Test that game pairs share an opening with colors swapped."""
+        runner = MatchRunner(*configs(fake_engine), games=4, openings=["h8", "a1 b2"])
+        assert runner.game(0) == (Opening.parse("h8"), True)
+        assert runner.game(1) == (Opening.parse("h8"), False)
+        assert runner.game(2) == (Opening.parse("a1 b2"), True)
+        assert runner.game(4) == (Opening.parse("h8"), True)
+
+    def test_match(self, fake_engine):
+        """Test a full match on two worker processes."""
+        runner = MatchRunner(
+            *configs(fake_engine, "--messages", "1"),
+            games=4, concurrency=2, board_size=9, openings=["a1", "i9 a9"],
+        )
+        streamed = []
+        score = runner.play(on_result=streamed.append)
+
+        assert sorted(result.game_id for result in streamed) == [0, 1, 2, 3]
+        assert runner.results == streamed
+        assert score.games == 4
+        for result in streamed:
+            assert result.first_is_black == (result.game_id % 2 == 0)
+            assert (result.black, result.white) == (("A", "B") if result.first_is_black else ("B", "A"))
+            assert result.opening == result.game_id // 2
+
+    def test_stop(self, fake_engine):
+        """Test that leaving the result loop stops the match."""
+        runner = MatchRunner(*configs(fake_engine), games=50, concurrency=2, board_size=9)
+        for _ in runner.run():
+            break
+        assert runner.is_stopped
+        assert len(runner.results) < 50
+
+    def test_engine_failure(self, tmp_path):
+        """Test that an engine that cannot start fails the match."""
+        missing = EngineConfig(str(tmp_path / "missing"))
+        runner = MatchRunner(missing, missing, games=2, concurrency=1)
+        with pytest.raises(EngineError):
+            runner.play()
@@ -0,0 +1,138 @@
+"""
+Tests for protocol data models.
+
+Tests cover:
+- Move parsing and formatting
+- Interned moves and square index conversion
+- Lazy search info parsing
+"""
+
+import dataclasses
+
+import pytest
+from pygomo.protocol import GomocupProtocol
+from pygomo.protocol.models import LazySearchInfo, Move, SearchInfo
+
+
+class TestMoveParsing:
+    """Test Move construction from the supported formats."""
+    
+    def test_formats_are_equal(self):
+        """Test tuple, numeric and algebraic input."""
+        assert Move((7, 7)) == Move("7,7") == Move("h8")
+        assert Move("h8").to_numeric() == "7,7"
+        assert Move((7, 7)).to_algebraic() == "h8"
+    
+    def test_invalid_format(self):
+        """Test that unsupported input raises ValueError."""
+        with pytest.raises(ValueError):
+            Move(7)
+
+
+class TestMoveInterning:
+    """Test interned moves and index conversion."""
+    
+    def test_of_returns_singleton(self):
+        """Test that Move.of returns the same instance every time."""
+        assert Move.of(7, 8) is Move.of(7, 8)
+        assert Move.of(7, 8) == Move((7, 8))
+    
+    def test_interned_moves_are_immutable(self):
+        """Test that a shared move cannot be modified."""
+        move = Move.of(7, 8)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            move.col = 0
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            Move("h8").row = 0
+        assert Move.of(7, 8).to_tuple() == (7, 8)
+    
+    def test_of_outside_interned_range(self):
+        """Test that large coordinates still build valid moves."""
+        move = Move.of(100, 3)
+        assert (move.col, move.row) == (100, 3)
+        assert move == Move((100, 3))
+    
+    @pytest.mark.parametrize("size", [15, 19, 20])
+    def test_index_round_trip(self, size):
+        """Test index <-> move conversion for every square."""
+        for index in range(size * size):
+            move = Move.from_index(index, size)
+            assert move is Move.of(index % size, index // size)
+            assert move.index(size) == index
+    
+    def test_index_table_is_shared(self):
+        """Test that the per-size table is built once."""
+        assert Move.index_table(15) is Move.index_table(15)
+        assert len(Move.index_table(15)) == 225
+
+
+class TestMoveParse:
+    """Test memoized coordinate parsing."""
+    
+    @pytest.mark.parametrize("text", ["7,8", " 7, 8 ", "h9", "H9"])
+    def test_parse_formats(self, text):
+        """Test that every format parses to the same interned move."""
+        assert Move.parse(text) is Move.of(7, 8)
+        assert Move(text) == Move.of(7, 8)
+    
+    def test_parse_large_coordinates(self):
+        """Test coordinates outside the interned range."""
+        assert Move.parse("40,2") == Move((40, 2))
+    
+    @pytest.mark.parametrize("text", ["", "h", "7", "x,y"])
+    def test_parse_invalid(self, text):
+        """Test that malformed coordinates raise ValueError."""
+        with pytest.raises(ValueError):
+            Move.parse(text)
+
+
+UCI_LINE = "MESSAGE depth 12-20 multipv 2 ev 35 n 1.5M n/ms 150 tm 1234 pv h8 i9 j10"
+
+
+class TestLazySearchInfo:
+    """Test deferred parsing of MESSAGE lines."""
+    
+    def test_parses_on_first_access(self):
+        """Test that nothing is parsed until a field is read."""
+        calls = []
+        
+        def parser(line):
+            calls.append(line)
+            return GomocupProtocol().parse_message(line)
+        
+        info = LazySearchInfo(UCI_LINE, parser)
+        assert calls == []
+        assert (info.depth, info.multipv, info.eval.raw_value) == (12, 2, "35")
+        assert info.nodes == 1_500_000
+        assert calls == [UCI_LINE]
+    
+    def test_pv_built_on_access(self):
+        """Test that PV moves are only built when pv is read."""
+        info = GomocupProtocol().parse_search_info(UCI_LINE, lazy=True)
+        assert info.depth == 12
+        assert info._pv is None
+        assert info.pv == [Move("h8"), Move("i9"), Move("j10")]
+        assert info.pv is info.pv
+    
+    def test_invalid_pv(self):
+        """Test that a PV token that is not a move makes the line malformed."""
+        info = LazySearchInfo("MESSAGE depth 6-8 ev 35 n 10 pv none", GomocupProtocol().parse_message)
+        with pytest.raises(ValueError):
+            info.depth
+    
+    def test_matches_eager(self):
+        """Test that lazy and eager parsing agree."""
+        protocol = GomocupProtocol()
+        lazy = protocol.parse_search_info(UCI_LINE, lazy=True)
+        eager = protocol.parse_search_info(UCI_LINE)
+        assert isinstance(lazy, SearchInfo)
+        assert lazy.to_search_info() == eager
+        assert str(lazy) == str(eager)
+        assert lazy.winrate == eager.winrate
+    
+    def test_slots(self):
+        """Test that the raw line is kept and lazy state uses slots."""
+        info = LazySearchInfo(UCI_LINE, GomocupProtocol().parse_message)
+        assert info.raw == UCI_LINE
+        assert not hasattr(info, "__dict__")
+        assert not hasattr(SearchInfo(), "__dict__")
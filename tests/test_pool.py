@@ -0,0 +1,139 @@
+"""
+Tests for EnginePool.
+
+Tests cover:
+- Warm start and configuration
+- Acquire / release with RESTART
+- Respawning dead engines
+"""
+
+import os
+import signal
+import threading
+import time
+
+import pytest
+from pygomo import EnginePool, Move
+from pygomo.exceptions import EngineError, TimeoutError
+
+
+@pytest.fixture
+def pool(fake_engine):
+    executable, args = fake_engine
+    pool = EnginePool(executable, size=2, options={"timeout_turn": 100}, args=args)
+    pool.start()
+    yield pool
+    pool.close()
+
+
+def kill(engine):
+    """Kill an engine process and wait until it is gone."""
+    os.kill(engine.process_id, signal.SIGKILL)
+    deadline = time.monotonic() + 5.0
+    while engine.is_connected and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestEnginePool:
+    """Tests for pool lifecycle and reuse."""
+    
+    def test_engines_are_warm(self, pool):
+        """Test that start() leaves every engine started."""
+        assert pool.available == 2
+        with pool.acquire() as engine:
+            assert engine.is_started
+            assert pool.available == 1
+            assert engine.begin().move == Move("h8")
+        assert pool.available == 2
+    
+    def test_release_restarts_engine(self, pool):
+        """Test that a returned engine starts from an empty board."""
+        with pool.acquire() as engine:
+            pid = engine.process_id
+            engine.turn("h8")
+        
+        # Both engines are idle; find the one used above
+        with pool.acquire() as first, pool.acquire() as second:
+            engine = first if first.process_id == pid else second
+            assert engine.process_id == pid
+            assert engine.begin().move == Move("h8")
+    
+    def test_release_after_error(self, pool):
+        """Test that an engine is returned to the pool when the block raises."""
+        with pytest.raises(ValueError):
+            with pool.acquire() as engine:
+                pid = engine.process_id
+                raise ValueError("boom")
+        
+        assert pool.available == 2
+        with pool.acquire() as first, pool.acquire() as second:
+            assert pid in (first.process_id, second.process_id)
+    
+    def test_acquire_timeout(self, pool):
+        """Test that an exhausted pool times out."""
+        with pool.acquire(), pool.acquire():
+            with pytest.raises(TimeoutError):
+                with pool.acquire(timeout=0.05):
+                    pass
+    
+    def test_waiting_acquire_gets_released_engine(self, fake_engine):
+        """Test that a blocked acquire wakes when an engine is returned."""
+        executable, args = fake_engine
+        with EnginePool(executable, size=1, args=args) as pool:
+            acquired = []
+            
+            with pool.acquire() as engine:
+                def borrow():
+                    with pool.acquire(timeout=5.0) as other:
+                        acquired.append(other.process_id)
+                
+                thread = threading.Thread(target=borrow)
+                thread.start()
+                time.sleep(0.05)
+                assert not acquired
+                pid = engine.process_id
+            
+            thread.join(5.0)
+            assert acquired == [pid]
+    
+    def test_dead_engine_respawned_on_acquire(self, fake_engine):
+        """Test that a killed idle engine is replaced transparently."""
+        executable, args = fake_engine
+        with EnginePool(executable, size=1, args=args) as pool:
+            with pool.acquire() as engine:
+                pid = engine.process_id
+            kill(engine)
+            
+            with pool.acquire() as engine:
+                assert engine.process_id != pid
+                assert engine.begin().move == Move("h8")
+    
+    def test_dead_engine_respawned_on_release(self, pool):
+        """Test that an engine dying in use is replaced on release."""
+        with pool.acquire() as engine:
+            kill(engine)
+        
+        assert pool.available == 2
+        assert pool.check() == 0
+    
+    def test_check_respawns_idle(self, pool):
+        """Test that check() replaces dead idle engines."""
+        with pool.acquire() as engine:
+            pass
+        kill(engine)
+        
+        assert pool.check() == 1
+        assert pool.available == 2
+    
+    def test_start_failure(self, tmp_path):
+        """Test that a missing executable raises EngineError."""
+        pool = EnginePool(str(tmp_path / "missing"), size=1)
+        with pytest.raises(EngineError):
+            pool.start()
+    
+    def test_closed_pool(self, pool):
+        """Test that acquire fails after close()."""
+        pool.close()
+        with pytest.raises(RuntimeError):
+            with pool.acquire():
+                pass
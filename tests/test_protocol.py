@@ -0,0 +1,119 @@
+"""
+Tests for GomocupProtocol MESSAGE parsing.
+
+Tests cover:
+- UCILIKE, MCTS, NORMAL, summary and indexed formats
+- Format detection and the per-instance format cache
+- Free-form and malformed lines
+"""
+
+import pytest
+from pygomo.protocol import GomocupProtocol
+
+
+@pytest.fixture
+def protocol():
+    return GomocupProtocol()
+
+
+class TestParseMessage:
+    """Test each Rapfi output format."""
+    
+    def test_ucilike(self, protocol):
+        """Test the UCILIKE key/value format."""
+        result = protocol.parse_message(
+            "MESSAGE depth 12-20 ev 35 n 1.5M n/ms 150 tm 1234 pv h8 i9 j10"
+        )
+        assert (result["depth"], result["sel_depth"], result["eval"]) == (12, 20, "35")
+        assert (result["nodes"], result["nps"], result["time"]) == (1_500_000, 150, 1234)
+        assert result["pv"] == ["h8", "i9", "j10"]
+        assert result["multipv"] == 1
+    
+    def test_ucilike_multipv(self, protocol):
+        """Test UCILIKE with a multipv index."""
+        result = protocol.parse_message("depth 8-11 multipv 3 ev -M7 n 900 n/ms 90 tm 10 pv g7")
+        assert (result["multipv"], result["eval"], result["nodes"]) == (3, "-M7", 900)
+    
+    def test_mcts(self, protocol):
+        """Test the MCTS format."""
+        result = protocol.parse_message(
+            "MESSAGE multipv 2 ev 40 w 55.5 d 10.2 stdev 0.05 v 1M seldepth 15 "
+            "n 2M n/ms 200 tm 5000 prior 0.3 pv h8 i9"
+        )
+        assert (result["multipv"], result["eval"]) == (2, "40")
+        assert (result["winrate"], result["drawrate"]) == (55.5, 10.2)
+        assert (result["depth"], result["sel_depth"]) == (0, 15)
+        assert (result["nodes"], result["nps"], result["time"]) == (2_000_000, 200, 5000)
+        assert result["pv"] == ["h8", "i9"]
+    
+    @pytest.mark.parametrize("prefix", ["", "[Pondering] "])
+    def test_normal(self, protocol, prefix):
+        """Test the NORMAL column format."""
+        result = protocol.parse_message(f"MESSAGE {prefix}Depth 9-14 | Eval -120 | Time 1.5s | h8 i9")
+        assert (result["depth"], result["sel_depth"], result["eval"]) == (9, 14, "-120")
+        assert result["pv"] == ["h8", "i9"]
+    
+    def test_summary(self, protocol):
+        """Test the NORMAL search summary line."""
+        result = protocol.parse_message(
+            "MESSAGE Speed 450Kn/s | Depth 20-31 | Eval 88 | Node 12.5M | Time 27.80s"
+        )
+        assert (result["depth"], result["sel_depth"], result["eval"]) == (20, 31, "88")
+        assert result["nodes"] == 12_500_000
+        assert result["pv"] == []
+    
+    def test_indexed(self, protocol):
+        """Test the indexed multipv column format."""
+        result = protocol.parse_message("MESSAGE (2) -35 | 7-12 | g7 f6 e5")
+        assert (result["multipv"], result["eval"]) == (2, "-35")
+        assert (result["depth"], result["sel_depth"]) == (7, 12)
+        assert result["pv"] == ["g7", "f6", "e5"]
+    
+    def test_none_pv(self, protocol):
+        """Test that a "(none)" PV is dropped."""
+        assert protocol.parse_message("depth 1-1 ev 0 n 1 n/ms 1 tm 0 pv (none)")["pv"] == []
+    
+    def test_keys_ignore_case(self, protocol):
+        """Test that keys and labels are case-insensitive."""
+        result = protocol.parse_message("DEPTH 5-6 EV 10 N 2K N/MS 1 TM 3 PV h8")
+        assert (result["depth"], result["eval"], result["nodes"]) == (5, "10", 2000)
+        assert result["pv"] == ["h8"]
+
+
+class TestFormatDetection:
+    """Test format detection, caching and fallbacks."""
+    
+    def test_switching_formats(self, protocol):
+        """Test that the cached format does not capture other formats."""
+        normal = "Depth 3-5 | Eval 12 | Time 0.1s | h8"
+        uci = "depth 3-5 ev 12 n 10 n/ms 1 tm 1 pv h8"
+        for line in [uci, normal, normal, uci, "(1) 12 | 3-5 | h8"]:
+            result = protocol.parse_message(line)
+            assert (result["depth"], result["eval"], result["pv"]) == (3, "12", ["h8"])
+    
+    def test_cache_is_per_instance(self, protocol):
+        """Test that each protocol instance caches its own format."""
+        protocol.parse_message("Depth 3-5 | Eval 12 | Time 0.1s | h8")
+        other = GomocupProtocol()
+        assert other.parse_message("depth 4-5 ev 1 n 1 n/ms 1 tm 1 pv h8")["depth"] == 4
+        assert protocol._message_format != other._message_format
+    
+    def test_free_form(self, protocol):
+        """Test that free-form lines get the best-effort fields."""
+        result = protocol.parse_message("MESSAGE Rapfi by Rapfi Team")
+        assert (result["depth"], result["eval"], result["pv"]) == (0, "0", [])
+        
+        result = protocol.parse_message("MESSAGE searching 6-9 ev 15 pv h8")
+        assert (result["depth"], result["sel_depth"], result["eval"]) == (6, 9, "15")
+        assert result["pv"] == ["h8"]
+    
+    def test_malformed_values_fall_back(self, protocol):
+        """Test that unparsable key/value lines do not raise."""
+        result = protocol.parse_message("depth limit reached")
+        assert result["depth"] == 0
+        result = protocol.parse_message("depth 5-7 ev 3 n/ms fast pv h8")
+        assert (result["depth"], result["eval"], result["pv"]) == (5, "3", ["h8"])
+    
+    def test_raw_kept(self, protocol):
+        """Test that the raw line without the MESSAGE prefix is kept."""
+        assert protocol.parse_message("MESSAGE (1) 5 | 1-1 | h8")["raw"] == "(1) 5 | 1-1 | h8"
@@ -0,0 +1,265 @@
+"""
+Tests for OutputChannelRouter and event-driven coord waiting.
+
+Tests cover:
+- Channel routing and the default line classifier
+- wait_any wake-up, timeout and EOF behavior
+- Bounded channels and overflow policies
+- Command handlers dispatching search info while waiting
+"""
+
+import io
+import os
+import threading
+import time
+
+import pytest
+from pygomo.transport import OutputChannelRouter, OverflowPolicy, classify_line
+from pygomo.transport.reader import ChannelQueue
+from pygomo.protocol import GomocupProtocol
+from pygomo.command import CommandContext
+from pygomo.command.interface import CommandStatus
+from pygomo.command.handlers import TurnHandler
+
+
+MESSAGE = "MESSAGE depth 5-9 ev 30 n 1200 n/ms 300 tm 4 pv h8 i9"
+
+
+class PipeEngine:
+    """Fake engine stdout backed by an OS pipe."""
+    
+    def __init__(self):
+        read_fd, self._write_fd = os.pipe()
+        self.stdout = os.fdopen(read_fd, "r")
+        self.router = OutputChannelRouter(self.stdout)
+    
+    def write(self, *lines):
+        os.write(self._write_fd, "".join(f"{line}\n" for line in lines).encode())
+    
+    def close(self):
+        os.close(self._write_fd)
+
+
+class FakeTransport:
+    """Transport stub that records sent commands."""
+    
+    def __init__(self):
+        self.sent = []
+    
+    def send(self, data):
+        self.sent.append(data)
+
+
+@pytest.fixture
+def engine():
+    engine = PipeEngine()
+    yield engine
+    try:
+        engine.close()
+    except OSError:
+        pass
+
+
+class TestRouting:
+    """Test line categorization."""
+    
+    def test_lines_reach_their_channels(self):
+        """Test the default channels."""
+        stream = io.StringIO(f"OK\n7,8\n{MESSAGE}\nERROR bad\nINFO x 1\n")
+        router = OutputChannelRouter(stream)
+        assert router.wait_any(["info"], timeout=1.0) == "info"
+        
+        assert router.get("output") == "OK"
+        assert router.get("coord") == "7,8"
+        assert router.get("message") == MESSAGE
+        assert router.get("error") == "ERROR bad"
+        assert router.get("info") == "INFO x 1"
+    
+    @pytest.mark.parametrize("line", [
+        "OK", "7,8", "7 , 8", "1,2 3,4", "7,8,", "12", "7,8x", "message x",
+        "MESSAGE", "Messages", "INFO", "INFO x", "info x", "INFOX", "error",
+        "ERRORS", "realtime pos 7,7", "REALTIMEX", "m", "name=\"x\"", "\u0663,\u0664",
+        "\u00df", "-1,2",
+    ])
+    def test_classifier_matches_filters(self, line):
+        """Test that classify_line agrees with the default filter chain."""
+        for name, filter_func in OutputChannelRouter.default_filters():
+            if filter_func(line):
+                break
+        assert classify_line(line) == name
+    
+    def test_custom_channel_before_catch_all(self, engine):
+        """Test that altered channel sets fall back to the filter chain."""
+        router = engine.router
+        router.remove_channel("output")
+        router.add_channel("debug", lambda line: line.startswith("DEBUG"))
+        router.add_channel("output", OutputChannelRouter._is_output)
+        
+        engine.write("DEBUG hello", "OK", "7,8")
+        assert router.wait_any(["coord"], timeout=1.0) == "coord"
+        assert router.get("debug") == "DEBUG hello"
+        assert router.get("output") == "OK"
+
+
+class TestWaitAny:
+    """Test the condition-variable based wait."""
+    
+    def test_returns_pending_channel_in_priority_order(self, engine):
+        """Test that listed order decides between pending channels."""
+        engine.write(MESSAGE, "7,8")
+        assert engine.router.wait_any(["message"], timeout=1.0) == "message"
+        assert engine.router.wait_any(["coord"], timeout=1.0) == "coord"
+        assert engine.router.wait_any(["coord", "message"], timeout=0) == "coord"
+    
+    def test_wakes_when_line_arrives(self, engine):
+        """Test that a waiter wakes right after the line is routed."""
+        timer = threading.Timer(0.05, engine.write, args=("7,8",))
+        timer.start()
+        
+        start = time.monotonic()
+        assert engine.router.wait_any(["coord", "message"], timeout=5.0) == "coord"
+        assert time.monotonic() - start < 1.0
+    
+    def test_timeout(self, engine):
+        """Test that wait_any returns None after the timeout."""
+        start = time.monotonic()
+        assert engine.router.wait_any(["coord"], timeout=0.05) is None
+        assert time.monotonic() - start >= 0.04
+    
+    def test_eof_wakes_waiters(self, engine):
+        """Test that closing the stream ends the wait."""
+        threading.Timer(0.05, engine.close).start()
+        
+        assert engine.router.wait_any(["coord"], timeout=5.0) is None
+        assert engine.router.is_closed
+    
+    def test_unknown_channel(self, engine):
+        """Test that unknown channels raise ValueError."""
+        with pytest.raises(ValueError):
+            engine.router.wait_any(["nope"], timeout=0)
+
+
+class TestOverflow:
+    """Test bounded channels."""
+    
+    def _fill(self, queue, count):
+        for i in range(count):
+            assert queue.offer(str(i))
+        return [queue.get_nowait() for _ in range(queue.qsize())]
+    
+    def test_drop_oldest(self):
+        """Test that DROP_OLDEST keeps the newest lines."""
+        queue = ChannelQueue(3, OverflowPolicy.DROP_OLDEST)
+        assert self._fill(queue, 5) == ["2", "3", "4"]
+        assert queue.dropped == 2
+    
+    def test_drop_newest(self):
+        """Test that DROP_NEWEST keeps the first lines."""
+        queue = ChannelQueue(3, OverflowPolicy.DROP_NEWEST)
+        assert self._fill(queue, 5) == ["0", "1", "2"]
+        assert queue.dropped == 2
+    
+    def test_keep_latest(self):
+        """Test that KEEP_LATEST holds one line regardless of capacity."""
+        queue = ChannelQueue(0, OverflowPolicy.KEEP_LATEST)
+        assert self._fill(queue, 5) == ["4"]
+        assert queue.dropped == 4
+    
+    def test_block_refuses_when_full(self):
+        """Test that BLOCK leaves the blocking put to the caller."""
+        queue = ChannelQueue(1, OverflowPolicy.BLOCK)
+        assert queue.offer("a")
+        assert not queue.offer("b")
+        assert queue.dropped == 0
+    
+    def test_default_limits(self, engine):
+        """Test that only coord is unbounded by default."""
+        router = engine.router
+        assert router._queues["coord"].maxsize == 0
+        for name in ("message", "info", "error", "realtime", "output"):
+            assert router._queues[name].maxsize > 0
+    
+    def test_router_counts_drops(self, engine):
+        """Test set_channel_limit and the drop counters."""
+        router = engine.router
+        router.set_channel_limit("message", 1, OverflowPolicy.KEEP_LATEST)
+        
+        engine.write("MESSAGE 1", "MESSAGE 2", "MESSAGE 3", "7,7")
+        assert router.wait_any(["coord"], timeout=1.0) == "coord"
+        assert router.get_all("message") == ["MESSAGE 3"]
+        assert router.dropped("message") == 2
+        assert router.drop_counts["coord"] == 0
+    
+    def test_shrinking_trims_oldest(self, engine):
+        """Test that lowering the limit drops excess pending lines."""
+        router = engine.router
+        engine.write("OK 1", "OK 2", "OK 3", "7,7")
+        assert router.wait_any(["coord"], timeout=1.0) == "coord"
+        
+        router.set_channel_limit("output", 1)
+        assert router.get_all("output") == ["OK 3"]
+        assert router.dropped("output") == 2
+    
+    def test_block_applies_backpressure(self, engine):
+        """Test that a full BLOCK channel stalls routing until drained."""
+        router = engine.router
+        router.set_channel_limit("message", 1, OverflowPolicy.BLOCK)
+        
+        engine.write("MESSAGE 1", "MESSAGE 2", "7,7")
+        assert router.wait_any(["message"], timeout=1.0) == "message"
+        time.sleep(0.05)
+        assert router.get_nowait("coord") is None
+        
+        assert router.get("message") == "MESSAGE 1"
+        assert router.wait_any(["coord"], timeout=1.0) == "coord"
+        assert router.get("message") == "MESSAGE 2"
+        assert router.dropped("message") == 0
+
+
+class TestHandlerWaiting:
+    """Test handlers built on wait_for_coord."""
+    
+    def _context(self, engine, on_info=None, timeout=5.0):
+        return CommandContext(
+            transport=FakeTransport(),
+            protocol=GomocupProtocol(),
+            router=engine.router,
+            command="TURN",
+            args=("h8",),
+            on_info=on_info,
+            timeout=timeout,
+        )
+    
+    def test_info_dispatched_before_move(self, engine):
+        """Test on_info gets every message, including the last ones."""
+        received = []
+        context = self._context(engine, on_info=received.append)
+        
+        def play():
+            engine.write(MESSAGE)
+            time.sleep(0.05)
+            engine.write(MESSAGE, MESSAGE, "8,8")
+        
+        threading.Thread(target=play).start()
+        result = TurnHandler().execute(context)
+        
+        assert result.is_success
+        assert context.transport.sent == ["TURN 7,7"]
+        assert result.data.move.to_tuple() == (8, 8)
+        assert len(received) == 3
+        assert result.data.all_info == received
+        assert result.data.search_info.depth == 5
+    
+    def test_timeout_result(self, engine):
+        """Test that no reply gives a timeout result."""
+        result = TurnHandler().execute(self._context(engine, timeout=0.05))
+        assert result.status == CommandStatus.TIMEOUT
+    
+    def test_engine_exit_is_an_error(self, engine):
+        """Test that EOF ends the wait early with an error."""
+        threading.Timer(0.05, engine.close).start()
+        
+        start = time.monotonic()
+        result = TurnHandler().execute(self._context(engine, timeout=10.0))
+        assert result.is_error
+        assert time.monotonic() - start < 5.0
@@ -6,8 +6,11 @@ Tests cover Renju rules:
 - Double-four (4x4) is forbidden for Black  
 - Double-three (3x3 open threes) is forbidden for Black
 - White has no restrictions
+- Split shapes (X.XX, XX.XX) and same-line double fours
 """
 
+import random
+
 import pytest
 from pygomo.board import RenjuBitBoard, BLACK, WHITE, EMPTY
 from pygomo.protocol.models import Move
@@ -269,6 +272,16 @@ class TestRenjuPlaceEnforcement:
         assert result is False
         assert board.is_empty(Move((6, 7)))
     
+    def test_forbidden_index_rejected(self, empty_renju_board):
+        """Test that place_index enforces the same rule."""
+        board = empty_renju_board
+        for i in range(5):
+            board.place(Move((7 + i, 7)))
+            board.place(Move((0, i)))
+        
+        assert board.place_index(7 * 15 + 6) is False
+        assert board.place_index(14 * 15 + 14) is True
+    
     def test_white_not_restricted(self, empty_renju_board):
         """Test that White can place anywhere."""
         board = empty_renju_board
@@ -351,3 +364,207 @@ class TestRenjuWin:
         # White's 5+ (including 6+) should be a win
         assert win is not None
         assert win.winner == WHITE
+
+
+def _reference_forbidden(board, col, row):
+    """
+    Slow line-walk reference for the forbidden rules used by RenjuBitBoard.
+    
+    Places Black at (col, row) and, per direction, counts fives, overlines,
+    fours (distinct completing squares) and open threes (a completing square
+    that makes a straight four).
+    """
+    size = board.size
+    
+    def cell(c, r, extra):
+        if not (0 <= c < size and 0 <= r < size):
+            return WHITE
+        if (c, r) in extra:
+            return BLACK
+        return board.get(Move((c, r)))
+    
+    def run(c, r, dx, dy, extra):
+        n = 1
+        for sign in (1, -1):
+            x, y = c + sign * dx, r + sign * dy
+            while cell(x, y, extra) == BLACK:
+                n += 1
+                x, y = x + sign * dx, y + sign * dy
+        return n
+    
+    def five_squares(c, r, dx, dy, extra):
+        """Empty squares q on the line that complete an exact five through (c, r)."""
+        found = []
+        for k in range(-5, 6):
+            x, y = c + k * dx, r + k * dy
+            if k and cell(x, y, extra) == EMPTY:
+                if run(c, r, dx, dy, extra | {(x, y)}) == 5 and run(
+                    x, y, dx, dy, extra | {(x, y)}
+                ) == 5:
+                    found.append(k)
+        return found
+    
+    p = {(col, row)}
+    fives = overline = fours = threes = 0
+    for dx, dy in [(1, 0), (0, 1), (1, 1), (-1, 1)]:
+        length = run(col, row, dx, dy, p)
+        if length == 5:
+            fives += 1
+        elif length >= 6:
+            overline += 1
+        
+        qs = five_squares(col, row, dx, dy, p)
+        if qs:
+            fours += 1 if (len(qs) == 2 and qs[1] - qs[0] == 5) else len(qs)
+            continue
+        
+        for k in range(-4, 5):
+            x, y = col + k * dx, row + k * dy
+            if k and cell(x, y, p) == EMPTY:
+                ends = five_squares(col, row, dx, dy, p | {(x, y)})
+                if len(ends) == 2 and ends[1] - ends[0] == 5:
+                    threes += 1
+                    break
+    
+    return not fives and (overline > 0 or fours >= 2 or threes >= 2)
+
+
+class TestRenjuSplitPatterns:
+    """Test split shapes and bitwise detection against a reference."""
+    
+    def _setup(self, board, black):
+        """Place black stones with white replies far from them."""
+        whites = iter(f"{c}{r}" for r in (1, 2) for c in "abcdefghijklmno")
+        for coord in black:
+            board.place(Move(coord), BLACK)
+            board.place(Move(next(whites)), WHITE)
+    
+    def test_split_three_makes_double_three(self, empty_renju_board):
+        """Test X.XX (split three) crossing a straight three."""
+        board = empty_renju_board
+        # h8 makes e8 . g8 h8 and h6 h7 h8
+        self._setup(board, ["e8", "g8", "h6", "h7"])
+        assert board.is_forbidden(Move("h8")) is True
+    
+    def test_split_four_makes_double_four(self, empty_renju_board):
+        """Test XX.XX (split four) crossing a straight four."""
+        board = empty_renju_board
+        # i8 makes e8 f8 . h8 i8 and i5 i6 i7 i8
+        self._setup(board, ["e8", "f8", "h8", "i5", "i6", "i7"])
+        assert board.is_forbidden(Move("i8")) is True
+    
+    def test_double_four_in_one_line(self, empty_renju_board):
+        """Test X.XXX.X: two fours on the same line."""
+        board = empty_renju_board
+        self._setup(board, ["c8", "e8", "g8", "i8"])
+        assert board.is_forbidden(Move("f8")) is True
+    
+    def test_four_three_is_allowed(self, empty_renju_board):
+        """Test that a four plus an open three is not forbidden."""
+        board = empty_renju_board
+        # h8 makes e8 f8 g8 h8 (four) and h6 h7 h8 (three)
+        self._setup(board, ["e8", "f8", "g8", "h6", "h7"])
+        assert board.is_forbidden(Move("h8")) is False
+    
+    def test_blocked_three_is_not_open(self, empty_renju_board):
+        """Test that a three blocked by White does not count."""
+        board = empty_renju_board
+        self._setup(board, ["f8", "h8", "g6", "g7"])
+        board.place(Move("i8"), BLACK)
+        board.place(Move("e8"), WHITE)  # blocks e8 side
+        board.place(Move("o15"), BLACK)
+        board.place(Move("j8"), WHITE)  # blocks the other side
+        assert board.is_forbidden(Move("g8")) is False
+    
+    def test_five_beats_double_four(self, empty_renju_board):
+        """Test that a move making exact five is never forbidden."""
+        board = empty_renju_board
+        # h8 makes d8-h8 five and h5 h6 h7 h8 four plus another four
+        self._setup(board, ["d8", "e8", "f8", "g8", "h5", "h6", "h7"])
+        assert board.is_forbidden(Move("h8")) is False
+    
+    def test_black_overline_is_not_a_win(self, empty_renju_board):
+        """Test that check_win ignores Black's six in a row."""
+        board = empty_renju_board
+        for i in range(6):
+            board._black |= board._bit(Move((3 + i, 7)))
+        
+        assert board.check_win() is None
+        assert board.check_win(Move((5, 7))) is None
+    
+    def test_matches_reference_on_random_positions(self):
+        """Test bitwise detection against the line-walk reference."""
+        rng = random.Random(2024)
+        for _ in range(30):
+            board = RenjuBitBoard(_size=15)
+            squares = rng.sample(range(15 * 15), 70)
+            for i, sq in enumerate(squares):
+                bit = 1 << sq
+                if i % 4 == 3:
+                    board._white |= bit
+                else:
+                    board._black |= bit
+            
+            expected = [
+                Move((col, row))
+                for row in range(15)
+                for col in range(15)
+                if board.is_empty(Move((col, row)))
+                and _reference_forbidden(board, col, row)
+            ]
+            assert board.get_forbidden_moves() == expected
+
+
+class TestRenjuForbiddenCache:
+    """Test the incrementally updated forbidden-point cache."""
+    
+    def _fresh(self, board):
+        """Forbidden mask computed from scratch on a copy."""
+        fresh = board.copy()
+        fresh._pattern_key = None
+        return fresh._forbidden_mask()
+    
+    def test_matches_full_recompute_after_place_and_undo(self):
+        """Test the cache against a full rebuild over random games."""
+        rng = random.Random(7)
+        for _ in range(10):
+            board = RenjuBitBoard(_size=15)
+            board.get_forbidden_moves()  # Warm the cache
+            for _ in range(60):
+                if board.move_count and rng.random() < 0.25:
+                    board.undo()
+                else:
+                    empty = [
+                        Move((col, row))
+                        for row in range(3, 12)
+                        for col in range(3, 12)
+                        if board.is_empty(Move((col, row)))
+                    ]
+                    if not empty or not board.place(rng.choice(empty)):
+                        continue
+                assert board._pattern_key == (board._black, board._white)
+                assert board._forbidden_mask() == self._fresh(board)
+    
+    def test_direct_bitboard_edit_rebuilds(self, empty_renju_board):
+        """Test that editing the bitboards directly invalidates the cache."""
+        board = empty_renju_board
+        assert board.get_forbidden_moves() == []
+        
+        # Overline point at h8 without going through place()
+        for col in (2, 3, 4, 5, 6, 8):
+            board._black |= board._bit(Move((col, 7)))
+        board._white |= board._bit(Move((0, 0)))
+        board._white |= board._bit(Move((0, 1)))
+        
+        assert board.is_forbidden(Move("h8")) is True
+    
+    def test_copy_keeps_cache_independent(self, empty_renju_board):
+        """Test that a copy's updates do not leak into the original."""
+        board = empty_renju_board
+        board.get_forbidden_moves()
+        clone = board.copy()
+        clone.place(Move("h8"))
+        
+        assert board._pattern_key == (board._black, board._white)
+        assert board._forbidden_mask() == self._fresh(board)
+        assert clone._forbidden_mask() == self._fresh(clone)
@@ -0,0 +1,147 @@
+"""
+Tests for the SPRT match driver.
+
+Tests cover:
+- Elo conversion and LLR bounds
+- Trinomial and pentanomial statistics
+- Early stopping of a match
+"""
+
+import math
+
+import pytest
+from pygomo.board import BLACK, WHITE, EMPTY
+from pygomo.match import GameResult, SPRT, H0, H1
+from pygomo.match.sprt import expected_score, score_to_elo
+
+
+def game(game_id, score):
+    """Result with the given score for the first engine."""
+    first_is_black = game_id % 2 == 0
+    first, second = (BLACK, WHITE) if first_is_black else (WHITE, BLACK)
+    winner = {1.0: first, 0.0: second, 0.5: EMPTY}[score]
+    return GameResult(winner, "five", game_id=game_id, first_is_black=first_is_black)
+
+
+def feed(sprt, scores):
+    for game_id, score in enumerate(scores):
+        sprt.add(game(game_id, score))
+        if sprt.status is not None:
+            return game_id + 1
+    return len(scores)
+
+
+class StubRunner:
+    """Stands in for MatchRunner with scripted results."""
+
+    def __init__(self, scores):
+        self.scores = scores
+        self.stopped = False
+        self.played = 0
+
+    def run(self):
+        for game_id, score in enumerate(self.scores):
+            if self.stopped:
+                return
+            self.played += 1
+            yield game(game_id, score)
+
+    def stop(self):
+        self.stopped = True
+
+
+class TestElo:
+    """Tests for Elo conversion."""
+
+    def test_round_trip(self):
+        """Test that score and Elo conversions are inverse."""
+        assert expected_score(0) == 0.5
+        assert score_to_elo(expected_score(35.0)) == pytest.approx(35.0)
+        assert score_to_elo(0.6) == pytest.approx(70.44, abs=0.01)
+        assert score_to_elo(1.0) == math.inf
+
+    def test_elo_margin(self):
+        """Test Elo and its confidence margin."""
+        sprt = SPRT(pentanomial=False)
+        assert sprt.elo() == (0.0, math.inf)
+        feed(sprt, [1.0, 0.5, 0.0, 0.5] * 50)
+        elo, margin = sprt.elo()
+        assert elo == pytest.approx(0.0)
+        assert 0 < margin < 100
+        assert sprt.elo(0.99)[1] > margin
+
+
+class TestSPRT:
+    """Tests for the test statistics."""
+
+    def test_bounds(self):
+        """Test the Wald bounds for alpha = beta = 0.05."""
+        lower, upper = SPRT(alpha=0.05, beta=0.05).bounds
+        assert lower == pytest.approx(-2.944, abs=1e-3)
+        assert upper == pytest.approx(2.944, abs=1e-3)
+
+    def test_invalid_hypotheses(self):
+        """Test that elo0 must be below elo1."""
+        with pytest.raises(ValueError):
+            SPRT(elo0=5, elo1=0)
+
+    def test_single_game_is_not_conclusive(self):
+        """Test that one win barely moves the LLR."""
+        sprt = SPRT(elo0=0, elo1=10, pentanomial=False)
+        sprt.add(game(0, 1.0))
+        assert 0 < sprt.llr < 0.1
+        assert sprt.status is None
+
+    @pytest.mark.parametrize("pentanomial", [False, True])
+    def test_accepts_h1(self, pentanomial):
+        """Test that a clearly stronger engine passes."""
+        sprt = SPRT(elo0=0, elo1=20, pentanomial=pentanomial)
+        played = feed(sprt, [1.0, 0.5, 1.0, 0.0, 0.5] * 400)
+        assert sprt.status == H1
+        assert played < 2000
+        assert sprt.elo()[0] > 0
+
+    @pytest.mark.parametrize("pentanomial", [False, True])
+    def test_accepts_h0(self, pentanomial):
+        """Test that an equal engine fails an improvement test."""
+        sprt = SPRT(elo0=0, elo1=20, pentanomial=pentanomial)
+        feed(sprt, [1.0, 0.0, 0.5, 0.5] * 1000)
+        assert sprt.status == H0
+        assert sprt.llr <= sprt.bounds[0]
+
+    def test_pairs_out_of_order(self):
+        """Test that pairs are completed regardless of arrival order."""
+        sprt = SPRT()
+        sprt.add(game(3, 1.0))
+        sprt.add(game(0, 0.5))
+        assert sprt.pairs == (0, 0, 0, 0, 0)
+        sprt.add(game(2, 1.0))
+        sprt.add(game(1, 0.0))
+        assert sprt.pairs == (0, 1, 0, 0, 1)
+        assert sprt.score.games == 4
+
+    def test_pentanomial_removes_opening_bias(self):
+        """Test that color-swapped pairs that split 1-1 carry no signal."""
+        sprt = SPRT(pentanomial=True)
+        feed(sprt, [1.0, 0.0] * 200)
+        assert sprt.elo() == (0.0, 0.0)
+
+
+class TestRun:
+    """Tests for driving a match."""
+
+    def test_stops_runner(self):
+        """Test that the match is stopped once a bound is crossed."""
+        runner = StubRunner([1.0] * 10000)
+        updates = []
+        sprt = SPRT(elo0=0, elo1=10)
+        assert sprt.run(runner, on_update=updates.append) == H1
+        assert runner.stopped
+        assert runner.played == len(updates) < 10000
+        assert "LLR" in str(sprt)
+
+    def test_inconclusive(self):
+        """Test a match that ends before either bound."""
+        runner = StubRunner([1.0, 0.0] * 5)
+        assert SPRT().run(runner) is None
+        assert runner.played == 10
@@ -0,0 +1,184 @@
+"""
+Tests for incremental position sync.
+
+Tests cover:
+- Following the engine's moves from executed commands
+- Planning TAKEBACK / TURN sequences and BOARD fallbacks
+- EngineClient.goto against a fake engine
+"""
+
+import pytest
+from pygomo import BoardPosition, EngineClient, Move
+from pygomo.client import AnalysisCache, PositionTracker
+from pygomo.client.sync import SyncStep
+from pygomo.command import HookType
+
+
+def moves(text):
+    return [Move.parse(move) for move in text.split()]
+
+
+def tracker_at(text, reply=None):
+    """Tracker holding a BOARD position, plus the engine's reply if given."""
+    tracker = PositionTracker()
+    tracker._stones = PositionTracker.to_position(moves(text)).moves
+    if reply is not None:
+        tracker._stones.append((Move(reply), BoardPosition.SELF))
+    return tracker
+
+
+@pytest.fixture
+def engine(fake_engine):
+    """Started fake engine; records the commands sent."""
+    executable, args = fake_engine
+    engine = EngineClient(executable, args=args + ["--messages", "1"])
+    engine.start(15)
+    engine.sent = []
+
+    @engine.hooks.on(HookType.PRE_EXECUTE)
+    def record(context, _):
+        engine.sent.append(context.command)
+
+    yield engine
+    engine.quit()
+
+
+class TestPlan:
+    """Tests for sync planning."""
+
+    def test_unknown_position(self):
+        """Test that an unknown position is set up with BOARD or YXBOARD."""
+        tracker = PositionTracker()
+        assert tracker.plan(moves("h8"), think=True) == [SyncStep("BOARD")]
+        assert tracker.plan(moves("h8"), think=False) == [SyncStep("YXBOARD")]
+
+    def test_sibling(self):
+        """Test that a sibling position takes back to the branch point."""
+        tracker = tracker_at("h8 i9 j10", reply="k11")
+        assert tracker.plan(moves("h8 i9 a1")) == [
+            SyncStep("TAKEBACK", Move("k11")),
+            SyncStep("TAKEBACK", Move("j10")),
+            SyncStep("TURN", Move("a1")),
+        ]
+
+    def test_rethink(self):
+        """Test that a searched position is searched again by replaying its last move."""
+        tracker = tracker_at("h8 i9", reply="j10")
+        assert tracker.plan(moves("h8 i9")) == [
+            SyncStep("TAKEBACK", Move("j10")),
+            SyncStep("TAKEBACK", Move("i9")),
+            SyncStep("TURN", Move("i9")),
+        ]
+        assert tracker.plan(moves("h8 i9"), think=False) == [SyncStep("TAKEBACK", Move("j10"))]
+        assert tracker.plan(moves(""), think=True) == [
+            SyncStep("TAKEBACK", Move("j10")),
+            SyncStep("TAKEBACK", Move("i9")),
+            SyncStep("TAKEBACK", Move("h8")),
+            SyncStep("BEGIN"),
+        ]
+
+    def test_owner_changes(self):
+        """Test that stones held for the other side are not kept."""
+        tracker = tracker_at("h8", reply="i9")  # i9 is the engine's own stone
+        assert tracker.plan(moves("h8 i9")) == [SyncStep("BOARD")]
+        assert tracker.plan(moves("h8 i9"), think=False) == [SyncStep("YXBOARD")]
+        assert tracker.plan(moves("h8"), think=False) == [SyncStep("TAKEBACK", Move("i9"))]
+
+    def test_too_far(self):
+        """Test that adding more than one stone falls back to BOARD."""
+        tracker = tracker_at("h8")
+        assert tracker.plan(moves("h8 i9 j10")) == [SyncStep("BOARD")]
+        assert tracker.plan(moves("h8 i9"), think=False) == [SyncStep("YXBOARD")]
+
+    def test_position_conversion(self):
+        """Test conversion between move sequences and BOARD positions."""
+        position = PositionTracker.to_position(moves("h8 i9 j10"))
+        assert [color for _, color in position.moves] == [
+            BoardPosition.OPPONENT, BoardPosition.SELF, BoardPosition.OPPONENT,
+        ]
+        assert PositionTracker.to_moves(position) == moves("h8 i9 j10")
+
+        position.add_move(Move("a1"), BoardPosition.WALL)
+        assert PositionTracker.to_moves(position) is None
+
+
+class TestGoto:
+    """Tests for EngineClient.goto and position following."""
+
+    def test_follows_commands(self, engine):
+        """Test that the tracker follows the moves sent and played."""
+        assert engine.tracker.moves == ()
+        reply = engine.turn("a1").move
+        assert engine.tracker.moves == (Move("a1"), reply)
+        assert engine.tracker.position.moves == [
+            (Move("a1"), BoardPosition.OPPONENT), (reply, BoardPosition.SELF),
+        ]
+        engine.takeback(reply)
+        assert engine.tracker.moves == (Move("a1"),)
+        engine.takeback("o15")  # Not the last move
+        assert not engine.tracker.is_known
+
+    def test_browse(self, engine):
+        """Test that moving between siblings only uses TAKEBACK and TURN."""
+        first = engine.goto(["a1", "b2"])
+        assert engine.sent == ["BOARD"]
+        assert first.move == Move("h8")
+
+        engine.sent.clear()
+        assert engine.goto(["a1", "b2"], think=False) is None
+        assert engine.sent == ["TAKEBACK"]
+
+        engine.sent.clear()
+        second = engine.goto(["a1", "h8"])
+        assert engine.sent == ["TAKEBACK", "TURN"]
+        assert second.move != Move("h8")
+        assert engine.tracker.moves == (Move("a1"), Move("h8"), second.move)
+
+        engine.sent.clear()
+        assert engine.goto(["a1"], think=False) is None
+        assert engine.sent == ["BOARD"]  # a1 is held as the engine's own stone
+
+        engine.sent.clear()
+        assert engine.goto([]).move == Move("h8")
+        assert engine.sent == ["TAKEBACK", "BEGIN"]
+
+    def test_matches_board(self, fake_engine):
+        """Test that the engine answers as if the position had been sent with BOARD."""
+        executable, args = fake_engine
+        args = args + ["--near-own"]  # Answers depend on who owns each stone
+        with EngineClient(executable, args=args) as engine, EngineClient(executable, args=args) as reference:
+            engine.start(15)
+            reference.start(15)
+            sent = []
+
+            @engine.hooks.on(HookType.PRE_EXECUTE)
+            def record(context, _):
+                sent.append(context.command)
+
+            for target in ("a1 b2 c3", "a1 b2 o15", "a1 b2", "a1", ""):
+                incremental = engine.goto(moves(target))
+                direct = reference.board(PositionTracker.to_position(moves(target)))
+                assert incremental.move == direct.move, target
+            assert "TURN" in sent and "BEGIN" in sent
+
+    def test_no_takeback(self, fake_engine):
+        """Test the BOARD fallback for engines that reject TAKEBACK."""
+        executable, args = fake_engine
+        with EngineClient(executable, args=args + ["--no-takeback"]) as engine:
+            engine.start(15)
+            engine.goto(["a1", "b2"])
+            result = engine.goto(["a1", "h8"], timeout=1.0)
+            assert result is not None
+            assert engine.tracker.moves == (Move("a1"), Move("h8"), result.move)
+
+    def test_nbest_cached_after_goto(self, fake_engine):
+        """Test that YXNBEST on a position reached by goto is cached."""
+        executable, args = fake_engine
+        with AnalysisCache() as cache, EngineClient(executable, args=args, cache=cache) as engine:
+            engine.start(15)
+            engine.goto(["h8", "i9"], think=False)
+            engine.nbest(2)
+            engine.goto(["h8", "i9", "j10"], think=False)
+            engine.goto(["h8", "i9"], think=False)
+            engine.nbest(2)
+            assert (cache.hits, cache.misses) == (1, 1)
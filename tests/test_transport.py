@@ -0,0 +1,117 @@
+"""
+Tests for transport writers and batched sends.
+
+Tests cover:
+- IStreamWriter.writelines / ITransport.send_many defaults
+- Single-write batches in the subprocess and binary writers
+- BOARD positions sent as one batch
+"""
+
+import io
+import os
+
+import pytest
+from pygomo import BoardPosition, Move
+from pygomo.command import CommandContext
+from pygomo.command.handlers import BoardHandler
+from pygomo.protocol import GomocupProtocol
+from pygomo.transport.binary import BinaryStreamWriter
+from pygomo.transport.interface import IStreamWriter, TransportError
+from pygomo.transport.subprocess import SubprocessStreamWriter
+
+
+class CountingStream(io.StringIO):
+    """Text stream that counts write and flush calls."""
+    
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+        self.flushes = 0
+    
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+    
+    def flush(self):
+        self.flushes += 1
+
+
+class RecordingTransport:
+    """Transport stub that records each send and send_many call."""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def send(self, data):
+        self.calls.append(data)
+    
+    def send_many(self, lines):
+        self.calls.append(list(lines))
+
+
+class TestWriteLines:
+    """Tests for batched stream writes."""
+    
+    def test_default_writelines(self):
+        """Test that the interface default falls back to writeline."""
+        class ListWriter(IStreamWriter):
+            def __init__(self):
+                self.lines = []
+            def writeline(self, data):
+                self.lines.append(data)
+            def flush(self):
+                pass
+            def close(self):
+                pass
+        
+        writer = ListWriter()
+        writer.writelines(["a", "b"])
+        assert writer.lines == ["a", "b"]
+    
+    def test_subprocess_writer_single_flush(self):
+        """Test that writelines issues one write and one flush."""
+        stream = CountingStream()
+        writer = SubprocessStreamWriter(stream)
+        writer.writelines(["BOARD", "7,7,1", "DONE"])
+        
+        assert stream.getvalue() == "BOARD\n7,7,1\nDONE\n"
+        assert (stream.writes, stream.flushes) == (1, 1)
+    
+    def test_closed_writer_raises(self):
+        """Test that writing after close raises TransportError."""
+        writer = SubprocessStreamWriter(CountingStream())
+        writer.close()
+        with pytest.raises(TransportError):
+            writer.writelines(["x"])
+    
+    def test_binary_writer(self):
+        """Test that the binary writer sends the whole batch."""
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(write_fd, "wb", buffering=0) as stdin:
+            writer = BinaryStreamWriter(stdin)
+            writer.writelines(["BOARD", "7,7,1", "DONE"])
+            assert os.read(read_fd, 1024) == b"BOARD\n7,7,1\nDONE\n"
+        os.close(read_fd)
+
+
+class TestBoardBatch:
+    """Tests for BOARD positions sent with send_many."""
+    
+    def test_position_is_one_batch(self):
+        """Test that YXBOARD and every stone line go in one call."""
+        position = BoardPosition()
+        position.add_move(Move("h8"), 1)
+        position.add_move(Move("i9"), 2)
+        transport = RecordingTransport()
+        
+        context = CommandContext(
+            transport=transport,
+            protocol=GomocupProtocol(),
+            router=None,
+            command="BOARD",
+            kwargs={"position": position, "start_thinking": False},
+        )
+        result = BoardHandler().execute(context)
+        
+        assert result.is_success
+        assert transport.calls == [["YXBOARD", "7,7,1", "8,8,2", "DONE"]]